@@ -5,19 +5,278 @@ Usage: python git_python_gui.py [repository_path]
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import os
+import re
 import sys
+import codecs
+import hashlib
+import io
+import pickle
+import queue
 import subprocess
 import threading
 from pathlib import Path
 import git
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import webbrowser
 import tempfile
 import threading
 import platform
 import shutil
+import stat
+
+
+@lru_cache(maxsize=1024)
+def _format_time(seconds, timespec, utc_offset):
+    """Memoized body of format_commit_time, keyed on whole seconds so float file mtimes don't churn it"""
+    if utc_offset is None:
+        return datetime.fromtimestamp(seconds).isoformat(' ', timespec)
+    when = datetime.fromtimestamp(seconds, timezone(timedelta(seconds=utc_offset)))
+    return when.replace(tzinfo=None).isoformat(' ', timespec)
+
+
+def format_commit_time(timestamp, timespec='minutes', utc_offset=None):
+    """Format an epoch timestamp as 'YYYY-MM-DD HH:MM[:SS]' at utc_offset (a commit's own zone), else in local time"""
+    return _format_time(int(timestamp), timespec, utc_offset)
+
+
+def parse_tz_offset(tz):
+    """Seconds east of UTC for a git '+HHMM' timezone, None if there is none"""
+    try:
+        sign = -1 if tz[0] == '-' else 1
+        return sign * (int(tz[1:3]) * 3600 + int(tz[3:5]) * 60)
+    except (IndexError, ValueError):
+        return None
+
+
+# GitHub remotes: scheme URLs (https, http, ssh, git) or scp-style, each with an optional user[:password]@
+GITHUB_REMOTE_RE = re.compile(
+    r'(?:(?:https?|ssh|git)://(?:[^@/]+@)?github\.com(?::\d+)?/|(?:[^@/]+@)?github\.com:)'
+    r'([^/]+/[^/]+?)(?:\.git)?/?')
+
+
+def github_base_url(remote_url):
+    """Return https://github.com/<owner>/<repo> for a GitHub remote URL, else None"""
+    match = GITHUB_REMOTE_RE.fullmatch(remote_url.strip())
+    return f"https://github.com/{match.group(1)}" if match else None
+
+
+def visible_entries(path):
+    """(scandir entry, is folder) pairs of a folder without dotfiles, folders first then case-insensitive by name"""
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False  # Vanished or unreadable; list it as a file rather than abort the folder
+            entries.append((entry, is_dir))
+    entries.sort(key=lambda pair: (not pair[1], pair[0].name.lower()))
+    return entries
+
+
+def decode_or_binary(raw):
+    """Decode file bytes as UTF-8, or return None if the first 8 KB contain a NUL byte"""
+    if raw.find(b'\x00', 0, 8192) >= 0:
+        return None
+    return raw.decode('utf-8', 'replace')
+
+
+# Parsed commit headers; the *_tz fields are seconds east of UTC
+CommitMeta = namedtuple('CommitMeta', [
+    'author_name', 'author_email', 'authored_date', 'author_tz',
+    'committer_name', 'committer_email', 'committed_date', 'committer_tz',
+    'parents', 'message'])
+
+# One `git log` record: full sha, author name, committer timestamp, subject line, committer zone (seconds east of UTC)
+LogEntry = namedtuple('LogEntry', ['sha', 'author', 'committed_date', 'subject', 'committer_tz'])
+
+# One tag as read by for-each-ref; message and tagger fields are empty for lightweight tags
+TagMeta = namedtuple('TagMeta', [
+    'name', 'annotated', 'sha', 'committed_date', 'author', 'commit_subject',
+    'message', 'tagger_name', 'tagger_email', 'tagged_date', 'committer_tz', 'tagger_tz'])
+
+
+def _parse_ident(value):
+    """Split a 'Name <email> timestamp tz' commit header value"""
+    name, _, rest = value.partition(' <')
+    email, _, when = rest.partition('> ')
+    timestamp, _, tz = when.partition(' ')
+    return name, email, int(timestamp or 0), parse_tz_offset(tz)
+
+
+@lru_cache(maxsize=2048)
+def commit_meta(repo_path, sha):
+    """Parse a commit object once per (repo, full sha); commits are immutable so this never goes stale"""
+    raw = subprocess.run(['git', '-C', repo_path, 'cat-file', 'commit', sha],
+                         capture_output=True, check=True).stdout.decode('utf-8', 'replace')
+    header, _, message = raw.partition('\n\n')
+    parents = []
+    author = committer = ('', '', 0, '')
+    for line in header.splitlines():
+        key, _, value = line.partition(' ')
+        if key == 'parent':
+            parents.append(value)
+        elif key == 'author':
+            author = _parse_ident(value)
+        elif key == 'committer':
+            committer = _parse_ident(value)
+    return CommitMeta(*author, *committer, tuple(parents), message.strip())
+
+
+# File type icons by lower-case extension
+EXTENSION_ICONS = {ext: icon for exts, icon in (
+    (('.py', '.pyx', '.pyi'), '🐍'),                          # Python files
+    (('.js', '.jsx', '.ts', '.tsx'), '🟨'),                   # JavaScript/TypeScript files
+    (('.html', '.htm'), '🌐'),                                # HTML files
+    (('.css', '.scss', '.sass'), '🎨'),                       # CSS files
+    (('.json', '.yaml', '.yml', '.xml'), '⚙️'),               # Config files
+    (('.md', '.txt', '.rst'), '📝'),                          # Text files
+    (('.jpg', '.jpeg', '.png', '.gif', '.svg', '.bmp'), '🖼️'),  # Image files
+    (('.pdf',), '📄'),                                        # PDF files
+    (('.zip', '.rar', '.7z', '.tar', '.gz'), '🗜️'),           # Archive files
+    (('.exe', '.dll', '.so', '.dylib'), '⚙️'),                # Binary files
+    (('.sh', '.bat', '.cmd'), '⚡'),                          # Script files
+    (('.sql',), '🗃️'),                                        # Database files
+    (('.log',), '📋'),                                        # Log files
+    (('.csv', '.xlsx', '.xls'), '📊'),                        # Spreadsheet files
+) for ext in exts}
+
+# Status indicators appended to file icons
+STATUS_INDICATORS = {
+    'NEW': '🔴',
+    'MODIFIED': '🟠',
+    'STAGED': '🟢',
+    'MODIFIED_STAGED': '🔵',
+}
+
+# Colors of the status badge images shown next to file list rows
+STATUS_BADGE_COLORS = {
+    'NEW': '#dc3545',
+    'MODIFIED': '#fd7e14',
+    'STAGED': '#28a745',
+    'MODIFIED_STAGED': '#007bff',
+    'CONFLICTED': '#6f42c1',
+}
+
+# Folder icons by status
+FOLDER_ICONS = {
+    'NEW': '📁🔴',       # New folder - red indicator
+    'MODIFIED': '📁🟠',  # Modified folder - orange indicator
+    'STAGED': '📁🟢',    # Staged folder - green indicator
+}
+
+# Every (extension, status) icon precomputed; statuses without an indicator map to the bare glyph
+FILE_STATUSES = ('CLEAN', 'CONFLICTED', 'DELETED', 'RENAMED', 'COPIED', *STATUS_INDICATORS)
+ICON_TABLE = {(ext, status): icon + STATUS_INDICATORS.get(status, '')
+              for ext, icon in EXTENSION_ICONS.items() for status in FILE_STATUSES}
+DEFAULT_ICONS = {status: '📄' + STATUS_INDICATORS.get(status, '') for status in FILE_STATUSES}
+
+# Where fetches with a tags refspec store origin's tags
+REMOTE_TAG_PREFIXES = ('refs/remotes/origin/tags/', 'refs/remotes/origin/refs/tags/')
+
+# git diff --name-status letters as shown in the files changed panes
+NAME_STATUS_LABELS = {'A': 'Added', 'D': 'Deleted', 'M': 'Modified', 'R': 'Renamed', 'C': 'Copied'}
+
+# Tag list columns keyed by "is annotated" and "is on origin": (label) and (status text, row tags)
+TAG_TYPE_LABELS = {True: "Annotated", False: "Lightweight"}
+TAG_REMOTE_COLUMNS = {True: ("✓ Remote", ('remote_tag',)), False: ("✗ Local only", ('local_tag',))}
+TAG_ERROR_ROW_TAGS = ('error_tag',)
+
+# Rows inserted per step in the tag manager's files pane (a root commit lists every file)
+TAG_FILES_PAGE_SIZE = 500
+
+# Commit graph branch colors, assigned round-robin by branch row
+GRAPH_BRANCH_COLORS = ('lightblue', 'lightgreen', 'lightcoral', 'lightyellow', 'lightpink', 'lightgray')
+
+# Item id suffix for the stand-in child of a repository tree folder that hasn't been expanded yet
+TREE_PLACEHOLDER_SUFFIX = '\x1fplaceholder'
+
+# file_tree row tags by file status and by folder status
+FILE_ROW_TAGS = {status: (tag,) for status, tag in (
+    ('NEW', 'new_file'), ('MODIFIED', 'modified_file'), ('STAGED', 'staged_file'),
+    ('MODIFIED_STAGED', 'modified_staged_file'), ('DELETED', 'deleted_file'), ('RENAMED', 'renamed_file'),
+    ('COPIED', 'copied_file'), ('CONFLICTED', 'conflicted_file'), ('CLEAN', 'clean_file'))}
+FOLDER_ROW_TAGS = {'MODIFIED': ('modified_folder',), 'NEW': ('new_folder',),
+                   'STAGED': ('staged_folder',), 'CLEAN': ('clean_folder',)}
+
+# Status bits OR'd together per folder; the highest bit present picks the folder's color
+STATUS_NEW = 1
+STATUS_MODIFIED = 2
+STATUS_STAGED = 4
+STATUS_MODIFIED_STAGED = STATUS_MODIFIED | STATUS_STAGED
+STATUS_CODES = {'NEW': STATUS_NEW, 'MODIFIED': STATUS_MODIFIED, 'STAGED': STATUS_STAGED,
+                'MODIFIED_STAGED': STATUS_MODIFIED_STAGED}
+
+# The 5 s status cycle walks untracked files on every Nth run only
+UNTRACKED_SCAN_CYCLES = 6
+
+# Commits walked for the file list's last-commit columns; files untouched within them show as older
+FILE_LOG_MAX_COMMITS = 2000
+
+# Commits fetched per step for the file history dialog
+FILE_HISTORY_PAGE_SIZE = 200
+
+# Commit log window: commits shown, and rows handed to the Tk thread per batch as git produces them
+COMMIT_LOG_MAX_COMMITS = 100
+COMMIT_LOG_BATCH_SIZE = 20
+
+
+class GitBatchClient:
+    """One long-lived `git cat-file --batch*` process answering object queries over stdin"""
+    
+    def __init__(self, repo_path, mode='--batch'):
+        self.repo_path = repo_path
+        self.mode = mode
+        self._proc = None
+        self._lock = threading.Lock()
+    
+    def _ask(self, name):
+        """Send one object name and return the reply header fields, or None if it doesn't resolve"""
+        if '\n' in name:
+            raise ValueError("cat-file batch names can't contain newlines")
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(['git', '-C', self.repo_path, 'cat-file', self.mode],
+                                    stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._proc = proc
+        proc.stdin.write(name.encode() + b'\n')
+        proc.stdin.flush()
+        header = proc.stdout.readline().split()
+        if not header or header[-1] in (b'missing', b'ambiguous'):
+            return None
+        return header
+    
+    def query(self, name):
+        """Return the reply fields for an object name (e.g. 'HEAD:path'), or None if it doesn't exist"""
+        with self._lock:
+            header = self._ask(name)
+        return [field.decode() for field in header] if header else None
+    
+    def read(self, name):
+        """Return an object's bytes; needs a '--batch' client"""
+        with self._lock:
+            header = self._ask(name)
+            if header is None or len(header) != 3:
+                raise KeyError(name)
+            data = self._proc.stdout.read(int(header[2]))
+            self._proc.stdout.read(1)  # Trailing newline after the object
+            return data
+    
+    def close(self):
+        """Stop the git process"""
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.stdin.close()
+                self._proc.wait()
+            self._proc = None
 
 
 class GitPythonGUI:
@@ -27,13 +286,68 @@ class GitPythonGUI:
         self.root.geometry("1400x900")
         self.root.configure(bg='#f0f0f0')
         
+        # Shared fonts for code/diff viewers (created once, reused by every window)
+        self._code_font_10 = tkfont.Font(family='Courier', size=10)
+        self._code_font_9 = tkfont.Font(family='Courier', size=9)
+        
         # Initialize variables
         self.repo = None
         self.repo_path = repo_path or os.getcwd()
+        self._repo_prefix_len = len(self.repo_path.rstrip(os.sep)) + 1  # Slices repo-relative paths
         self.current_branch = None
         self.status_operations = []
         self.file_status_cache = {}  # Cache for file status
-        self.highlighted_files = set()  # Track highlighted files for auto-clear
+        self._folder_status = None  # Folder -> OR of its files' STATUS_* bits; None when stale
+        self._repo_tree_open = set()  # Folders expanded in the repository tree; only these list their subfolders
+        self.highlighted_files = {}  # file_tree item id -> path of a highlighted file, for auto-clear
+        self.highlight_timer = None
+        self._item_to_commit = {}  # Graph canvas item id -> commit
+        self._graph_layout = {}  # Graph commit sha -> (rect id, HEAD marker id or None)
+        self._blob_cache = OrderedDict()  # (commit sha, path) -> raw blob bytes, LRU
+        self._blob_lock = threading.Lock()
+        self._io_pool = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 4) * 3 // 4))  # Blob reads and diff walks
+        self._tag_files_request = None  # Commit sha whose files the tag manager is waiting for
+        self.remote_tags_cache = set()  # Tag names on origin, shared by the tag list and info pane
+        self.remote_tags_cache_ts = None  # When remote_tags_cache was built; None means stale
+        self._contains_cache = OrderedDict()  # Commit sha -> branches containing it, LRU
+        self._tag_meta = {}  # Tag name -> TagMeta from the last list_tags()
+        self._git_file_info_cache = None  # (HEAD sha, future of read_file_log() at that HEAD)
+        self._file_log_waiting = False  # File list rows were drawn before the per-file log was ready
+        self._icon_cache = OrderedDict()  # (path, mtime ns) -> glyph sniffed from an extension-less file, LRU
+        self._tag_render_cache = OrderedDict()  # Commit sha -> [details text, file rows or None], LRU
+        self._github_base = None  # https://github.com/<owner>/<repo> for origin, set by refresh_all
+        self._sorted_tag_rows = None  # Last list_tags() result; None until read or after a tag change
+        self._row_pages = {}  # Tree widget name -> rows still to be paged in
+        self._tag_populate_requests = {}  # Tag manager tree name -> token of the newest populate
+        self._tag_map = {}  # Tag name -> commit sha, rebuilt by refresh_all
+        self._git_batch = {}  # cat-file mode -> GitBatchClient for the current repository
+        self._git_batch_lock = threading.Lock()
+        self._git_write_lock = threading.Lock()  # One index/ref write at a time, so they never race on index.lock
+        self._status_jobs = queue.Queue()  # (repo path, populate trees) for the status worker
+        self._status_results = queue.Queue()
+        self._status_outstanding = 0  # Jobs queued but not yet applied
+        self._status_cycles = 0  # Periodic status runs so far
+        self._untracked_entries = (None, [])  # (repo path, '??' entries) from the last status that scanned them
+        self._status_poll = None
+        self._refresh_pending = False  # Set by _request_refresh, cleared when the refresh runs
+        self._refresh_timer = None
+        self._announce_refresh = True  # Report refresh progress in the status bar: first load and user-started refreshes only
+        self._tag_select_after_id = None  # Pending debounced tag manager selection
+        self._status_saved = None  # (key, entries) last written to the on-disk status cache
+        self._status_generation = 0  # Bumped by discard_status_cache; snapshots from older generations are never saved
+        self._tree_rows = {}  # Tree widget name -> key of the rows last rendered by fill_tree
+        self._user_cached = None  # (repo path, user_label options) from the last git config read
+        self._global_config_cache = None  # (~/.gitconfig mtime, [(section, [(name, value)])]) for show_config
+        self._header_pending = {}  # Toolbar label name -> config options waiting for _apply_header
+        self._header_shown = {}  # Toolbar label name -> config options last applied
+        self._tree_state = {}  # Tree widget name -> {iid: row} as last rendered by fill_tree
+        self._file_row_pool = []  # file_tree item ids in display order, reused across folders
+        self._file_row_iids = {}  # File name -> file_tree item id currently showing it
+        self._file_rows_folder = None  # Folder whose rows file_tree is showing
+        self._push_queue = queue.Queue()  # (remote, full ref name, on_done(error)) for the push worker
+        threading.Thread(target=self._status_worker, daemon=True).start()
+        threading.Thread(target=self._push_worker, daemon=True).start()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Try to initialize repository
         self.init_repository()
@@ -46,7 +360,7 @@ class GitPythonGUI:
         self.create_status_bar()
         
         # Load initial data
-        self.refresh_all()
+        self.refresh_all(use_disk_cache=True)
         self.setup_enhanced_refresh_cycle()
         
         # Auto-clear highlights after 5 seconds
@@ -77,87 +391,74 @@ class GitPythonGUI:
                        foreground='#212529',  # Dark text
                        font=('TkDefaultFont', 10, 'bold'))
         
+        # Status badges for the file list, built once and shared by every row
+        self.status_images = {'CLEAN': tk.PhotoImage(width=10, height=10)}  # Blank keeps glyphs aligned
+        for status, color in STATUS_BADGE_COLORS.items():
+            image = tk.PhotoImage(width=10, height=10)
+            image.put(color, to=(1, 1, 9, 9))
+            self.status_images[status] = image
+        
     
-    def get_file_icon(self, file_path, file_status='CLEAN'):
+    def get_file_icon(self, file_path, file_status='CLEAN', is_dir=None, mtime_ns=None):
         """Get appropriate icon for file type and status"""
-        if os.path.isdir(file_path):
-            if file_status == 'NEW':
-                return '📁🔴'  # New folder - red indicator
-            elif file_status == 'MODIFIED':
-                return '📁🟠'  # Modified folder - orange indicator
-            elif file_status == 'STAGED':
-                return '📁🟢'  # Staged folder - green indicator
+        if is_dir is None:
+            is_dir = os.path.isdir(file_path)
+        if is_dir:
+            return FOLDER_ICONS.get(file_status, '📁')
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '':
+            # No extension - the icon depends on whether the content is binary, so remember
+            # the answer until the file changes
+            if mtime_ns is None:
+                return self.sniff_file_icon(file_path) + STATUS_INDICATORS.get(file_status, '')
+            key = (file_path, mtime_ns)
+            glyph = self._icon_cache.get(key)
+            if glyph is None:
+                glyph = self._icon_cache[key] = self.sniff_file_icon(file_path)
+                if len(self._icon_cache) > 4096:
+                    self._icon_cache.popitem(last=False)
             else:
-                return '📁'  # Clean folder
-        
-        # Get file extension
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
-        
-        # Status indicators
-        status_indicator = ''
-        if file_status == 'NEW':
-            status_indicator = '🔴'
-        elif file_status == 'MODIFIED':
-            status_indicator = '🟠'
-        elif file_status == 'STAGED':
-            status_indicator = '🟢'
-        elif file_status == 'MODIFIED_STAGED':
-            status_indicator = '🔵'
-        
-        # File type icons
-        if ext in ['.py', '.pyx', '.pyi']:
-            return f'🐍{status_indicator}'  # Python files
-        elif ext in ['.js', '.jsx', '.ts', '.tsx']:
-            return f'🟨{status_indicator}'  # JavaScript/TypeScript files
-        elif ext in ['.html', '.htm']:
-            return f'🌐{status_indicator}'  # HTML files
-        elif ext in ['.css', '.scss', '.sass']:
-            return f'🎨{status_indicator}'  # CSS files
-        elif ext in ['.json', '.yaml', '.yml', '.xml']:
-            return f'⚙️{status_indicator}'  # Config files
-        elif ext in ['.md', '.txt', '.rst']:
-            return f'📝{status_indicator}'  # Text files
-        elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.bmp']:
-            return f'🖼️{status_indicator}'  # Image files
-        elif ext in ['.pdf']:
-            return f'📄{status_indicator}'  # PDF files
-        elif ext in ['.zip', '.rar', '.7z', '.tar', '.gz']:
-            return f'🗜️{status_indicator}'  # Archive files
-        elif ext in ['.exe', '.dll', '.so', '.dylib']:
-            return f'⚙️{status_indicator}'  # Binary files
-        elif ext in ['.sh', '.bat', '.cmd']:
-            return f'⚡{status_indicator}'  # Script files
-        elif ext in ['.sql']:
-            return f'🗃️{status_indicator}'  # Database files
-        elif ext in ['.log']:
-            return f'📋{status_indicator}'  # Log files
-        elif ext in ['.csv', '.xlsx', '.xls']:
-            return f'📊{status_indicator}'  # Spreadsheet files
-        elif ext == '':
-            # No extension - check if binary
-            try:
-                with open(file_path, 'rb') as f:
-                    chunk = f.read(1024)
-                    if b'\0' in chunk:
-                        return f'⚙️{status_indicator}'  # Binary file
-                    else:
-                        return f'📝{status_indicator}'  # Text file
-            except:
-                return f'📄{status_indicator}'  # Default file
-        else:
-            return f'📄{status_indicator}'  # Default file icon
+                self._icon_cache.move_to_end(key)
+            return glyph + STATUS_INDICATORS.get(file_status, '')
+        return ICON_TABLE.get((ext, file_status)) or DEFAULT_ICONS.get(file_status, '📄')
+    
+    def sniff_file_icon(self, file_path):
+        """Pick the icon for an extension-less file by checking it for binary content"""
+        try:
+            with open(file_path, 'rb') as f:
+                chunk = f.read(1024)
+                if b'\0' in chunk:
+                    return '⚙️'  # Binary file
+                else:
+                    return '📝'  # Text file
+        except:
+            return '📄'  # Default file
         
     def init_repository(self):
         """Initialize Git repository"""
         try:
-            # Check if current path is a git repo or find parent git repo
+            # Let git discover the enclosing work tree (handles worktrees and .git files)
+            try:
+                result = subprocess.run(['git', '-C', self.repo_path, 'rev-parse', '--show-toplevel'],
+                                        capture_output=True, text=True, check=False)
+            except OSError:
+                result = None
+            if result is not None and result.returncode == 0 and result.stdout.strip():
+                self.repo_path = os.path.normpath(result.stdout.strip())
+                self._repo_prefix_len = len(self.repo_path.rstrip(os.sep)) + 1
+                self.repo = git.Repo(self.repo_path)
+                self.tune_status_performance()
+                return
+            
+            # Fall back to walking up for a .git entry
             current_path = Path(self.repo_path).resolve()
             
             while current_path != current_path.parent:
                 if (current_path / '.git').exists():
                     self.repo_path = str(current_path)
+                    self._repo_prefix_len = len(self.repo_path.rstrip(os.sep)) + 1
                     self.repo = git.Repo(self.repo_path)
+                    self.tune_status_performance()
                     return
                 current_path = current_path.parent
             
@@ -173,14 +474,136 @@ class GitPythonGUI:
         except Exception as e:
             messagebox.showerror("Repository Error", f"Error initializing repository: {str(e)}")
     
+    def status_tuning_marker(self):
+        """Path of the per-repository marker recording the status speedup choice"""
+        return os.path.join(self.repo.git_dir, '.gitpythongui_tuned')
+    
+    def status_tuning_state(self):
+        """Return 'on', 'off' or None if this repository has not been tuned yet"""
+        try:
+            with open(self.status_tuning_marker()) as f:
+                return f.read().strip() or 'on'
+        except OSError:
+            return None
+    
+    def tune_status_performance(self, force=False):
+        """Enable git's untracked cache, a commit-graph (and fsmonitor where supported) once per repository"""
+        state = self.status_tuning_state()
+        if not force and state is not None:
+            if state == 'on':
+                self.ensure_commit_graph()  # Repositories tuned before the graph was part of tuning
+            return
+        repo_path = self.repo_path
+        marker = self.status_tuning_marker()
+        
+        def run(*args):
+            return subprocess.run(['git', '-C', repo_path, *args],
+                                  capture_output=True, text=True, check=False)
+        
+        def tune_worker():
+            try:
+                run('config', 'core.untrackedCache', 'true')
+                
+                # The builtin fsmonitor daemon needs git 2.37+ on Windows or macOS
+                version = run('--version').stdout.split()[-1]
+                major_minor = tuple(int(part) for part in version.split('.')[:2] if part.isdigit())
+                if major_minor >= (2, 37) and platform.system() in ('Windows', 'Darwin'):
+                    run('config', 'core.fsmonitor', 'true')
+                
+                run('update-index', '--untracked-cache', '--test-untracked-cache')
+                
+                with open(marker, 'w') as f:
+                    f.write('on\n')
+            except Exception:
+                pass
+        
+        threading.Thread(target=tune_worker, daemon=True).start()
+        self.ensure_commit_graph()
+    
+    def ensure_commit_graph(self):
+        """Write a commit-graph in the background if the repository has none yet"""
+        common_dir = getattr(self.repo, 'common_dir', None) or self.repo.git_dir
+        info_dir = os.path.join(common_dir, 'objects', 'info')
+        if any(os.path.exists(os.path.join(info_dir, name)) for name in ('commit-graph', 'commit-graphs')):
+            return
+        repo_path = self.repo_path
+        
+        def run(*args):
+            return subprocess.run(['git', '-C', repo_path, *args],
+                                  capture_output=True, text=True, check=False)
+        
+        def graph_worker():
+            try:
+                version = run('--version').stdout.split()[-1]
+                major_minor = tuple(int(part) for part in version.split('.')[:2] if part.isdigit())
+                
+                # A commit-graph gives log and for-each-ref commit dates without inflating commit
+                # objects; fetches keep it current from then on (--changed-paths needs git 2.27+)
+                if major_minor >= (2, 27):
+                    run('commit-graph', 'write', '--reachable', '--changed-paths')
+                    run('config', 'fetch.writeCommitGraph', 'true')
+            except Exception:
+                pass
+        
+        # Slow on large histories, so it never holds up the tuning marker or the UI
+        threading.Thread(target=graph_worker, daemon=True).start()
+    
+    def toggle_status_tuning(self):
+        """Config menu toggle for the untracked cache / fsmonitor / commit-graph settings"""
+        if not self.repo:
+            messagebox.showerror("Error", "No repository loaded")
+            self.status_tuning_var.set(False)
+            return
+        
+        if self.status_tuning_var.get():
+            self.tune_status_performance(force=True)
+            self.status_label.config(text="Enabled untracked cache and commit-graph for faster status and history")
+            return
+        
+        try:
+            self.repo.git.config('core.untrackedCache', 'false')
+            for key in ('core.fsmonitor', 'fetch.writeCommitGraph'):
+                try:
+                    self.repo.git.config('--unset', key)
+                except git.exc.GitCommandError:
+                    pass  # Was never set
+            self.repo.git.update_index('--no-untracked-cache')
+            with open(self.status_tuning_marker(), 'w') as f:
+                f.write('off\n')
+            self.status_label.config(text="Disabled untracked cache, fsmonitor and commit-graph updates")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to update status settings: {str(e)}")
+    
+    def rebuild_tag_map(self):
+        """Snapshot tag name -> commit sha so tag lookups don't scan repo.tags"""
+        try:
+            self._tag_map = {name: sha for name, _, sha, _, _ in self.tag_rows() if sha}
+        except Exception:
+            self._tag_map = {}
+    
+    def tag_commit(self, tag_name):
+        """Resolve a tag name to its commit through the tag map snapshot"""
+        sha = self._tag_map.get(tag_name)
+        if sha is None:
+            # Tag created since the last refresh
+            sha = self.repo.tags[tag_name].commit.hexsha
+            self._tag_map[tag_name] = sha
+        return self.repo.commit(sha)
+    
     def select_repository(self):
         """Select a repository folder"""
         folder = filedialog.askdirectory(title="Select Git Repository Folder")
         if folder:
             try:
                 self.repo_path = folder
+                self._repo_prefix_len = len(self.repo_path.rstrip(os.sep)) + 1
                 self.repo = git.Repo(folder)
-                self.refresh_all()
+                self.invalidate_tag_rows()
+                self.invalidate_remote_tags()
+                self.tune_status_performance()
+                if hasattr(self, 'status_tuning_var'):
+                    self.status_tuning_var.set(self.status_tuning_state() != 'off')
+                self._request_refresh()
             except git.exc.InvalidGitRepositoryError:
                 messagebox.showerror("Invalid Repository", "Selected folder is not a Git repository")
     
@@ -195,7 +618,7 @@ class GitPythonGUI:
         file_menu.add_command(label="Open Repository...", command=self.select_repository)
         file_menu.add_command(label="Clone Repository...", command=self.clone_repository)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_closing)
         
         # Repository menu
         repo_menu = tk.Menu(menubar, tearoff=0)
@@ -226,9 +649,19 @@ class GitPythonGUI:
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Refresh All", command=self.refresh_all)
+        view_menu.add_command(label="Refresh All", command=lambda: self._request_refresh(announce=True))
         view_menu.add_command(label="Show Log", command=self.show_log)
         
+        # Config menu
+        config_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Config", menu=config_menu)
+        config_menu.add_command(label="Git Configuration...", command=self.show_config)
+        self.status_tuning_var = tk.BooleanVar(
+            value=bool(self.repo) and self.status_tuning_state() != 'off')
+        config_menu.add_checkbutton(label="Fast Status (untracked cache / fsmonitor / commit-graph)",
+                                    variable=self.status_tuning_var,
+                                    command=self.toggle_status_tuning)
+        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -295,7 +728,7 @@ class GitPythonGUI:
         tag_manage_btn.pack(side=tk.LEFT, padx=1)
         
         # Refresh icon with better styling
-        refresh_btn = ttk.Button(icons_frame, text="🔄", command=self.refresh_all, 
+        refresh_btn = ttk.Button(icons_frame, text="🔄", command=self._request_refresh, 
                                 width=5, style='Accent.TButton')
         refresh_btn.pack(side=tk.LEFT, padx=1)
         
@@ -320,6 +753,7 @@ class GitPythonGUI:
         
         # Bind events
         self.repo_tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        self.repo_tree.bind('<<TreeviewOpen>>', self.on_tree_open)
     
     def create_file_view(self, parent):
         """Create file view with version information"""
@@ -356,6 +790,9 @@ class GitPythonGUI:
         file_frame.grid_rowconfigure(0, weight=1)
         file_frame.grid_columnconfigure(0, weight=1)
         
+        # Row colors per status, configured once for the life of the widget
+        self.configure_file_tree_colors()
+        
         # Context menu for files
         self.file_context_menu = tk.Menu(self.root, tearoff=0)
         self.file_context_menu.add_command(label="Open in VS Code", command=self.open_in_vscode)
@@ -489,10 +926,21 @@ class GitPythonGUI:
         tags_tree.heading('Remote Status', text='Remote Status')
         tags_tree.column('Remote Status', width=100, minwidth=80)
         
+        # Configure tag colors
+        tags_tree.tag_configure('remote_tag', background='#e8f5e8', foreground='#2d5a2d')  # Light green
+        tags_tree.tag_configure('local_tag', background='#fff3cd', foreground='#856404')   # Light yellow
+        tags_tree.tag_configure('error_tag', background='#f8d7da', foreground='#721c24')   # Light red
+        
         # Scrollbars for tags tree
         tags_v_scroll = ttk.Scrollbar(tags_frame, orient=tk.VERTICAL, command=tags_tree.yview)
         tags_h_scroll = ttk.Scrollbar(tags_frame, orient=tk.HORIZONTAL, command=tags_tree.xview)
-        tags_tree.configure(yscrollcommand=tags_v_scroll.set, xscrollcommand=tags_h_scroll.set)
+        
+        def on_tags_scroll(first, last):
+            tags_v_scroll.set(first, last)
+            if float(last) > 0.9:
+                self.load_more_rows(tags_tree)
+        
+        tags_tree.configure(yscrollcommand=on_tags_scroll, xscrollcommand=tags_h_scroll.set)
         
         tags_tree.grid(row=0, column=0, sticky='nsew')
         tags_v_scroll.grid(row=0, column=1, sticky='ns')
@@ -513,7 +961,7 @@ class GitPythonGUI:
         info_text_frame = ttk.Frame(info_frame)
         info_text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.tag_info_text = tk.Text(info_text_frame, height=8, wrap=tk.WORD, font=('Courier', 10))
+        self.tag_info_text = tk.Text(info_text_frame, height=8, wrap=tk.WORD, font=self._code_font_10)
         info_text_scroll = ttk.Scrollbar(info_text_frame, orient=tk.VERTICAL, command=self.tag_info_text.yview)
         self.tag_info_text.configure(yscrollcommand=info_text_scroll.set)
         
@@ -527,7 +975,7 @@ class GitPythonGUI:
         commit_text_frame = ttk.Frame(commit_frame)
         commit_text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.commit_details_text = tk.Text(commit_text_frame, height=6, wrap=tk.WORD, font=('Courier', 9))
+        self.commit_details_text = tk.Text(commit_text_frame, height=6, wrap=tk.WORD, font=self._code_font_9)
         commit_text_scroll = ttk.Scrollbar(commit_text_frame, orient=tk.VERTICAL, command=self.commit_details_text.yview)
         self.commit_details_text.configure(yscrollcommand=commit_text_scroll.set)
         
@@ -552,10 +1000,23 @@ class GitPythonGUI:
             else:
                 self.tag_files_tree.column(col, width=80, minwidth=60)
         
+        # Configure file colors
+        self.tag_files_tree.tag_configure('added_file', background='#d4edda', foreground='#155724')
+        self.tag_files_tree.tag_configure('deleted_file', background='#f8d7da', foreground='#721c24')
+        self.tag_files_tree.tag_configure('modified_file', background='#fff3cd', foreground='#856404')
+        self.tag_files_tree.tag_configure('renamed_file', background='#cce5ff', foreground='#004085')
+        self.tag_files_tree.tag_configure('summary_row', background='#e9ecef', foreground='#495057', font=('TkDefaultFont', 10, 'bold'))
+        
         # Scrollbars for files tree
         files_v_scroll = ttk.Scrollbar(files_tree_frame, orient=tk.VERTICAL, command=self.tag_files_tree.yview)
         files_h_scroll = ttk.Scrollbar(files_tree_frame, orient=tk.HORIZONTAL, command=self.tag_files_tree.xview)
-        self.tag_files_tree.configure(yscrollcommand=files_v_scroll.set, xscrollcommand=files_h_scroll.set)
+        
+        def on_files_scroll(first, last):
+            files_v_scroll.set(first, last)
+            if float(last) > 0.9:
+                self.load_more_rows(self.tag_files_tree, TAG_FILES_PAGE_SIZE)
+        
+        self.tag_files_tree.configure(yscrollcommand=on_files_scroll, xscrollcommand=files_h_scroll.set)
         
         self.tag_files_tree.grid(row=0, column=0, sticky='nsew')
         files_v_scroll.grid(row=0, column=1, sticky='ns')
@@ -602,15 +1063,8 @@ class GitPythonGUI:
         self.create_tag_context_menu(tags_tree)
         self.create_tag_files_context_menu(self.tag_files_tree, tags_tree)
         
-        # POPULATE DATA
-        self.populate_tags_enhanced(tags_tree)
-        
-        # Select first tag if available
-        if tags_tree.get_children():
-            first_tag = tags_tree.get_children()[0]
-            tags_tree.selection_set(first_tag)
-            tags_tree.see(first_tag)
-            self.on_tag_select(tags_tree)
+        # POPULATE DATA (the first tag is selected once the rows arrive)
+        self.populate_tags_enhanced(tags_tree, select_first=True)
     
     def create_tag_context_menu(self, tags_tree):
         """Create context menu for tags - MODIFIED VERSION"""
@@ -649,77 +1103,241 @@ class GitPythonGUI:
         
         files_tree.bind('<Button-3>', lambda e: self.show_tag_files_context_menu(e, files_tree))
     
-    def populate_tags_enhanced(self, tags_tree):
+    def populate_tags_enhanced(self, tags_tree, select_first=False):
         """Populate tags with comprehensive information"""
+        # Git work runs in a worker; only the latest request for this tree is applied
+        request = object()
+        self._tag_populate_requests[str(tags_tree)] = request
+        
+        # The tag snapshot is one for-each-ref, read here so list_tags only ever runs on the Tk thread
+        try:
+            tag_rows, tag_meta = self.tag_rows(), self._tag_meta
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to populate tags: {str(e)}")
+            return
+        
+        def collect_worker():
+            try:
+                rows = self._collect_tag_rows(tag_rows, tag_meta)
+            except Exception as e:
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Failed to populate tags: {str(e)}"))
+                return
+            self.root.after(0, self._apply_tag_rows, tags_tree, rows, request, select_first)
+        
+        threading.Thread(target=collect_worker, daemon=True).start()
+    
+    def _collect_tag_rows(self, tag_rows, tag_meta):
+        """Build (values, tags) rows for the tag list from a tag_rows() snapshot; no Tk calls"""
+        # Get remote tags for comparison
+        remote_tags = self.load_remote_tags()
+        
+        # Tags come sorted by date (newest first) from one for-each-ref call
+        rows = []
+        append = rows.append
+        for tag_name, annotated, commit_sha, commit_date, author in tag_rows:
+            if not commit_sha:
+                # Tag doesn't point at a commit; show it with limited info
+                append(((tag_name, "Error", "N/A", "N/A", "N/A", "N/A"), TAG_ERROR_ROW_TAGS))
+                continue
+            
+            # Remote status and its color coding in one lookup
+            remote_status, tags = TAG_REMOTE_COLUMNS[tag_name in remote_tags]
+            meta = tag_meta.get(tag_name)
+            
+            append(((
+                tag_name,
+                TAG_TYPE_LABELS[annotated],
+                commit_sha[:12],
+                format_commit_time(commit_date, 'seconds', meta.committer_tz if meta else None),
+                author,
+                remote_status
+            ), tags))
+        return rows
+    
+    def _apply_tag_rows(self, tags_tree, rows, request, select_first=False):
+        """Show collected tag rows; Tk-only counterpart of _collect_tag_rows"""
+        if self._tag_populate_requests.get(str(tags_tree)) is not request:
+            return  # Superseded by a newer populate
         try:
             # Clear existing items
-            for item in tags_tree.get_children():
-                tags_tree.delete(item)
-            
-            # Get remote tags for comparison
+            tags_tree.delete(*tags_tree.get_children())
+            
+            # Only the first page goes into the widget; the rest follow as the list is scrolled
+            self._row_pages[str(tags_tree)] = {'rows': rows, 'shown': 0, 'pending': False}
+            self.load_more_rows(tags_tree)
+            
+            # Select first tag if available
+            if select_first and tags_tree.get_children():
+                first_tag = tags_tree.get_children()[0]
+                tags_tree.selection_set(first_tag)
+                tags_tree.see(first_tag)
+                self.on_tag_select(tags_tree)
+        except tk.TclError:
+            pass  # Tag manager closed before the tags were read
+    
+    def load_remote_tags(self):
+        """Rebuild remote_tags_cache from origin's tag refs, read from the ref files when possible"""
+        remote_tags = self._load_remote_tags_fast()
+        if remote_tags is None:
             remote_tags = set()
             try:
-                if self.repo.remotes:
-                    remote_refs = self.repo.remotes.origin.refs
-                    for ref in remote_refs:
-                        if ref.name.startswith('origin/refs/tags/'):
-                            tag_name = ref.name.replace('origin/refs/tags/', '')
-                            remote_tags.add(tag_name)
+                output = self.git_output('for-each-ref', '--format=%(refname)', *REMOTE_TAG_PREFIXES)
+                for ref in output.splitlines():
+                    remote_tags.add(ref.split('/tags/', 1)[1])
             except:
                 pass
-            
-            # Sort tags by date (newest first)
-            sorted_tags = sorted(self.repo.tags, key=lambda t: t.commit.committed_datetime, reverse=True)
-            
-            for tag in sorted_tags:
-                try:
-                    commit = tag.commit
-                    
-                    # Determine tag type
-                    tag_type = "Lightweight"
-                    if hasattr(tag, 'tag') and tag.tag:
-                        tag_type = "Annotated"
-                    
-                    # Remote status
-                    remote_status = "✓ Remote" if tag.name in remote_tags else "✗ Local only"
-                    
-                    # Color coding based on status
-                    if tag.name in remote_tags:
-                        tags = ('remote_tag',)
-                    else:
-                        tags = ('local_tag',)
-                    
-                    tags_tree.insert('', 'end', values=(
-                        tag.name,
-                        tag_type,
-                        commit.hexsha[:12],
-                        commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                        commit.author.name,
-                        remote_status
-                    ), tags=tags)
-                    
-                except Exception as e:
-                    # If there's an error with a specific tag, add it with limited info
-                    tags_tree.insert('', 'end', values=(
-                        tag.name,
-                        "Error",
-                        "N/A",
-                        "N/A",
-                        "N/A",
-                        "N/A"
-                    ), tags=('error_tag',))
-            
-            # Configure tag colors
-            tags_tree.tag_configure('remote_tag', background='#e8f5e8', foreground='#2d5a2d')  # Light green
-            tags_tree.tag_configure('local_tag', background='#fff3cd', foreground='#856404')   # Light yellow
-            tags_tree.tag_configure('error_tag', background='#f8d7da', foreground='#721c24')   # Light red
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to populate tags: {str(e)}")
+        self.remote_tags_cache = remote_tags
+        self.remote_tags_cache_ts = datetime.now()
+        return remote_tags
+    
+    def _load_remote_tags_fast(self):
+        """Read origin's tag refs from packed-refs and loose ref files; None if that's not possible"""
+        common_dir = getattr(self.repo, 'common_dir', None) or self.repo.git_dir
+        if os.path.exists(os.path.join(common_dir, 'reftable')):
+            return None  # Refs aren't stored as files; ask git instead
+        
+        remote_tags = set()
+        try:
+            with open(os.path.join(common_dir, 'packed-refs'), encoding='utf-8') as f:
+                for line in f:
+                    if line[:1] in '#^':
+                        continue  # Header and peeled-object lines
+                    ref = line.rstrip('\n').partition(' ')[2]
+                    for prefix in REMOTE_TAG_PREFIXES:
+                        if ref.startswith(prefix):
+                            remote_tags.add(ref[len(prefix):])
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        
+        # Loose refs; tag names may contain slashes
+        for prefix in REMOTE_TAG_PREFIXES:
+            base = os.path.join(common_dir, *prefix.split('/'))
+            for dirpath, _, filenames in os.walk(base):
+                rel_dir = os.path.relpath(dirpath, base)
+                for filename in filenames:
+                    if filename.endswith('.lock'):
+                        continue  # Ref update in progress
+                    name = filename if rel_dir == '.' else os.path.join(rel_dir, filename)
+                    remote_tags.add(name.replace(os.sep, '/'))
+        return remote_tags
+    
+    def branches_containing(self, sha):
+        """Local branches that contain a commit, from one --contains query (memoized until refresh)"""
+        branches = self._contains_cache.get(sha)
+        if branches is not None:
+            self._contains_cache.move_to_end(sha)
+            return branches
+        
+        try:
+            # for-each-ref rather than `git branch`, which would also list a detached HEAD
+            output = self.repo.git.for_each_ref('--contains', sha, '--format=%(refname:short)', 'refs/heads/')
+            branches = [line.strip() for line in output.splitlines() if line.strip()]
+        except:
+            return []
+        self._contains_cache[sha] = branches
+        if len(self._contains_cache) > 256:
+            self._contains_cache.popitem(last=False)
+        return branches
+    
+    def invalidate_remote_tags(self):
+        """Mark remote_tags_cache stale after a push, fetch or tag deletion"""
+        self.remote_tags_cache_ts = None
+    
+    def tag_rows(self):
+        """Return the cached list_tags() result, reading it again only after invalidate_tag_rows"""
+        rows = self._sorted_tag_rows
+        if rows is None:
+            rows = self.list_tags()
+        return rows
+    
+    def invalidate_tag_rows(self):
+        """Drop the cached tag list after a tag is created, deleted or fetched"""
+        self._sorted_tag_rows = None
+    
+    def load_more_rows(self, tree, page_size=200):
+        """Insert the next page of (values, tags) rows queued in _row_pages for a tree"""
+        page = self._row_pages.get(str(tree))
+        if not page or page['pending'] or page['shown'] >= len(page['rows']):
+            return
+        
+        def insert_page():
+            page['pending'] = False
+            if self._row_pages.get(str(tree)) is not page:
+                return  # List was repopulated meanwhile
+            start = page['shown']
+            page['shown'] = min(start + page_size, len(page['rows']))
+            try:
+                self.bulk_insert(tree, page['rows'][start:page['shown']])
+            except tk.TclError:
+                self._row_pages.pop(str(tree), None)  # Window closed
+        
+        if page['shown'] == 0:
+            insert_page()  # First page right away so the caller can select it
+        else:
+            page['pending'] = True
+            self.root.after_idle(insert_page)
+    
+    def bulk_insert(self, tree, rows):
+        """Insert (values, tags) rows in one pass; Tk lays out and redraws once at idle"""
+        insert = tree.insert
+        for values, tags in rows:
+            insert('', 'end', values=values, tags=tags)
+    
+    def list_tags(self):
+        """Return (name, annotated, commit sha, commit date, author) for every tag, newest first"""
+        fields = ['refname:short', 'objecttype', 'objectname', '*objectname', '*objecttype',
+                  'committerdate:unix', '*committerdate:unix', 'authorname', '*authorname',
+                  'subject', '*subject', 'taggername', 'taggeremail', 'taggerdate:unix',
+                  'committerdate:format:%z', '*committerdate:format:%z', 'taggerdate:format:%z', 'contents']
+        # Tag messages span lines, so records end with an ASCII record separator
+        output = self.git_output(
+            'for-each-ref', '--format=' + '%00'.join(f'%({f})' for f in fields) + '%1e', 'refs/tags')
+        
+        # Built locally and published at the end, so readers on other threads never see a half-filled snapshot
+        tags = []
+        tag_meta = {}
+        for record in output.split('\x1e'):
+            record = record.lstrip('\n')
+            if not record:
+                continue
+            (name, obj_type, sha, peeled_sha, peeled_type, date, peeled_date, author, peeled_author,
+             subject, peeled_subject, tagger_name, tagger_email, tagged_date,
+             tz, peeled_tz, tagger_tz, message) = record.split('\0')
+            annotated = obj_type == 'tag'
+            if annotated:
+                # Annotated tags report the tag object; use the commit it points at
+                sha, obj_type, date, author, subject, tz = (peeled_sha, peeled_type, peeled_date,
+                                                            peeled_author, peeled_subject, peeled_tz)
+            else:
+                message = ''  # Lightweight tags would report the commit message
+            if obj_type != 'commit':
+                sha, date, author, subject, tz = '', '', '', '', ''
+            meta = TagMeta(name, annotated, sha, int(date) if date else 0, author, subject, message.strip(),
+                           tagger_name, tagger_email.strip('<>'), int(tagged_date) if tagged_date else 0,
+                           parse_tz_offset(tz), parse_tz_offset(tagger_tz))
+            tag_meta[name] = meta
+            tags.append(meta[:5])
+        
+        tags.sort(key=lambda t: t[3], reverse=True)
+        self._tag_meta = tag_meta
+        self._sorted_tag_rows = tags
+        return tags
     
     def on_tag_select(self, tags_tree):
-        """Handle tag selection and update details panes"""
-        selection = tags_tree.selection()
+        """Handle tag selection; selections within 150 ms collapse into one pane update"""
+        if self._tag_select_after_id is not None:
+            self.root.after_cancel(self._tag_select_after_id)
+        self._tag_select_after_id = self.root.after(150, self._do_tag_select, tags_tree)
+    
+    def _do_tag_select(self, tags_tree):
+        """Update the details panes for the settled tag selection"""
+        self._tag_select_after_id = None
+        try:
+            selection = tags_tree.selection()
+        except tk.TclError:
+            return  # Tag manager closed
         if not selection:
             return
         
@@ -727,31 +1345,47 @@ class GitPythonGUI:
             selected_values = tags_tree.item(selection[0])['values']
             tag_name = selected_values[0]
             
-            # Find the tag object
-            selected_tag = None
-            for tag in self.repo.tags:
-                if tag.name == tag_name:
-                    selected_tag = tag
-                    break
-            
-            if not selected_tag:
+            # Metadata comes from the list_tags() snapshot; re-read it for tags created since
+            meta = self._tag_meta.get(str(tag_name))
+            if meta is None:
+                self.list_tags()
+                meta = self._tag_meta.get(str(tag_name))
+            if meta is None:
                 return
             
             # Update tag information pane
-            self.update_tag_info_pane(selected_tag)
+            self.update_tag_info_pane(meta)
             
-            # Update commit details pane
-            self.update_commit_details_pane(selected_tag.commit)
+            if not meta.sha:
+                # Tag does not point at a commit
+                self.commit_details_text.delete('1.0', tk.END)
+                self.tag_files_tree.delete(*self.tag_files_tree.get_children())
+                return
+            commit = self.repo.commit(meta.sha)
+            
+            # Commit details and file rows depend only on the commit, so revisits reuse them
+            cached = self._tag_render_cache.get(meta.sha)
+            if cached is not None:
+                self._tag_render_cache.move_to_end(meta.sha)
+                self.commit_details_text.delete('1.0', tk.END)
+                self.commit_details_text.insert('1.0', cached[0])
+            else:
+                # Update commit details pane
+                details = self.update_commit_details_pane(commit)
+                if details is not None:
+                    self._tag_render_cache[meta.sha] = [details, None]
+                    if len(self._tag_render_cache) > 128:
+                        self._tag_render_cache.popitem(last=False)
             
             # Update files changed pane
-            self.update_tag_files_pane(selected_tag)
+            self.update_tag_files_pane(commit)
             
         except Exception as e:
             self.tag_info_text.delete('1.0', tk.END)
             self.tag_info_text.insert('1.0', f"Error loading tag details: {str(e)}")
     
     def update_tag_info_pane(self, tag):
-        """Update the tag information pane"""
+        """Update the tag information pane from a TagMeta record"""
         try:
             self.tag_info_text.delete('1.0', tk.END)
             
@@ -759,34 +1393,27 @@ class GitPythonGUI:
             info += f"{'='*50}\n\n"
             
             info += f"Name: {tag.name}\n"
-            info += f"Type: {'Annotated' if hasattr(tag, 'tag') and tag.tag else 'Lightweight'}\n"
-            info += f"Object: {tag.commit.hexsha}\n"
-            info += f"Created: {tag.commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+            info += f"Type: {'Annotated' if tag.annotated else 'Lightweight'}\n"
+            info += f"Object: {tag.sha}\n"
+            if tag.committed_date:
+                info += f"Created: {format_commit_time(tag.committed_date, 'seconds', tag.committer_tz)}\n"
             
             # Tag message (for annotated tags)
-            if hasattr(tag, 'tag') and tag.tag:
-                if tag.tag.message:
-                    info += f"\nTag Message:\n{'-'*20}\n{tag.tag.message.strip()}\n"
-                if tag.tag.tagger:
-                    info += f"\nTagger: {tag.tag.tagger.name} <{tag.tag.tagger.email}>\n"
-                    info += f"Tagged: {tag.tag.tagged_date}\n"
+            if tag.annotated:
+                if tag.message:
+                    info += f"\nTag Message:\n{'-'*20}\n{tag.message}\n"
+                if tag.tagger_name:
+                    info += f"\nTagger: {tag.tagger_name} <{tag.tagger_email}>\n"
+                    info += f"Tagged: {format_commit_time(tag.tagged_date, 'seconds', tag.tagger_tz)}\n"
             
             # Remote status
-            try:
-                remote_refs = [ref.name for ref in self.repo.remotes.origin.refs if 'tags' in ref.name]
-                is_remote = any(tag.name in ref for ref in remote_refs)
-                info += f"\nRemote Status: {'✓ Pushed to remote' if is_remote else '✗ Local only'}\n"
-            except:
-                info += f"\nRemote Status: Unknown\n"
+            if self.remote_tags_cache_ts is None:
+                self.load_remote_tags()
+            is_remote = tag.name in self.remote_tags_cache
+            info += f"\nRemote Status: {'✓ Pushed to remote' if is_remote else '✗ Local only'}\n"
             
             # Branch information
-            branches_containing = []
-            for branch in self.repo.branches:
-                try:
-                    if tag.commit in list(self.repo.iter_commits(branch.name)):
-                        branches_containing.append(branch.name)
-                except:
-                    continue
+            branches_containing = self.branches_containing(tag.sha) if tag.sha else []
             
             if branches_containing:
                 info += f"\nBranches containing this tag:\n{', '.join(branches_containing[:5])}"
@@ -800,37 +1427,38 @@ class GitPythonGUI:
             self.tag_info_text.insert('1.0', f"Error updating tag info: {str(e)}")
     
     def update_commit_details_pane(self, commit):
-        """Update the commit details pane"""
+        """Update the commit details pane; returns the rendered text, or None on error"""
         try:
             self.commit_details_text.delete('1.0', tk.END)
+            meta = commit_meta(self.repo_path, commit.hexsha)
             
             details = f"📝  COMMIT DETAILS\n"
             details += f"{'='*50}\n\n"
             
             details += f"Hash: {commit.hexsha}\n"
             details += f"Short Hash: {commit.hexsha[:12]}\n"
-            details += f"Author: {commit.author.name} <{commit.author.email}>\n"
-            details += f"Authored: {commit.authored_datetime.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
-            details += f"Committer: {commit.committer.name} <{commit.committer.email}>\n"
-            details += f"Committed: {commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+            details += f"Author: {meta.author_name} <{meta.author_email}>\n"
+            details += f"Authored: {format_commit_time(meta.authored_date, 'seconds', meta.author_tz)}\n"
+            details += f"Committer: {meta.committer_name} <{meta.committer_email}>\n"
+            details += f"Committed: {format_commit_time(meta.committed_date, 'seconds', meta.committer_tz)}\n"
             
             # Parent information
-            if commit.parents:
-                details += f"\nParents: {', '.join([p.hexsha[:8] for p in commit.parents])}\n"
+            if meta.parents:
+                details += f"\nParents: {', '.join([p[:8] for p in meta.parents])}\n"
             else:
                 details += f"\nParents: None (root commit)\n"
             
             # Commit message
-            details += f"\nCommit Message:\n{'-'*20}\n{commit.message.strip()}\n"
+            details += f"\nCommit Message:\n{'-'*20}\n{meta.message}\n"
             
             # Statistics
             if commit.parents:
                 try:
-                    # Get diff statistics
-                    diff = commit.parents[0].diff(commit)
-                    files_changed = len(diff)
-                    insertions = sum(d.diff.decode('utf-8').count('\n+') for d in diff if d.diff)
-                    deletions = sum(d.diff.decode('utf-8').count('\n-') for d in diff if d.diff)
+                    # Get diff statistics (one --numstat call; binaries count as 0 lines)
+                    counts = self.get_numstat(commit.parents[0].hexsha, commit.hexsha)
+                    files_changed = len(counts)
+                    insertions = sum(additions for additions, _ in counts.values())
+                    deletions = sum(deletions for _, deletions in counts.values())
                     
                     details += f"\nStatistics:\n{'-'*20}\n"
                     details += f"Files changed: {files_changed}\n"
@@ -841,115 +1469,112 @@ class GitPythonGUI:
                     details += f"\nStatistics: Unable to calculate\n"
             
             self.commit_details_text.insert('1.0', details)
+            return details
             
         except Exception as e:
             self.commit_details_text.delete('1.0', tk.END)
             self.commit_details_text.insert('1.0', f"Error updating commit details: {str(e)}")
     
-    def update_tag_files_pane(self, tag):
+    def update_tag_files_pane(self, commit):
         """Update the files changed pane"""
-        try:
-            # Clear existing items
-            for item in self.tag_files_tree.get_children():
-                self.tag_files_tree.delete(item)
-            
-            commit = tag.commit
-            
-            if commit.parents:
-                # Compare with parent commit
-                parent_commit = commit.parents[0]
-                diffs = parent_commit.diff(commit)
-                
-                total_files = 0
-                total_additions = 0
-                total_deletions = 0
-                
-                for diff in diffs:
-                    status = 'Modified'
-                    if diff.new_file:
-                        status = 'Added'
-                    elif diff.deleted_file:
-                        status = 'Deleted'
-                    elif diff.renamed_file:
-                        status = 'Renamed'
-                    elif diff.copied_file:
-                        status = 'Copied'
-                    
-                    file_path = diff.b_path or diff.a_path
-                    
-                    # Calculate line changes
-                    additions = deletions = 0
-                    try:
-                        if diff.diff:
-                            diff_text = diff.diff.decode('utf-8')
-                            additions = diff_text.count('\n+') - diff_text.count('\n+++')
-                            deletions = diff_text.count('\n-') - diff_text.count('\n---')
-                    except:
-                        pass
-                    
-                    total_changes = additions + deletions
-                    total_files += 1
-                    total_additions += additions
-                    total_deletions += deletions
-                    
-                    # Color coding based on change type
-                    if status == 'Added':
-                        tags = ('added_file',)
-                    elif status == 'Deleted':
-                        tags = ('deleted_file',)
-                    elif status == 'Modified':
-                        tags = ('modified_file',)
-                    else:
-                        tags = ('renamed_file',)
-                    
-                    self.tag_files_tree.insert('', 'end', values=(
-                        file_path,
-                        status,
-                        f"+{additions}",
-                        f"-{deletions}",
-                        str(total_changes)
-                    ), tags=tags)
+        # Clear existing items
+        self._row_pages.pop(str(self.tag_files_tree), None)
+        self.tag_files_tree.delete(*self.tag_files_tree.get_children())
+        
+        self._tag_files_request = commit.hexsha
+        cached = self._tag_render_cache.get(commit.hexsha)
+        if cached is not None and cached[1] is not None:
+            self.show_tag_file_rows(cached[1])
+            return
+        
+        # Diff in the I/O pool; only the latest selection's rows are applied
+        self._io_pool.submit(self._collect_tag_file_rows, commit.hexsha).add_done_callback(
+            lambda future: self.root.after(0, self._apply_tag_file_rows, commit.hexsha, future))
+    
+    def _collect_tag_file_rows(self, sha):
+        """Build (values, tags) rows for the files changed pane with one numstat call"""
+        rows = []
+        # Runs in the I/O pool: plain git subprocesses only, never the shared self.repo
+        parents = commit_meta(self.repo_path, sha).parents
+        if parents:
+            # Compare with parent commit: metadata-only diff for status, numstat for line counts
+            changes = self.get_name_status(parents[0], sha)
+            counts = self.get_numstat(parents[0], sha)
+            
+            total_additions = 0
+            total_deletions = 0
+            
+            for status, file_path, _ in changes:
+                additions, deletions = counts.get(file_path, (0, 0))
+                total_additions += additions
+                total_deletions += deletions
                 
-                # Add summary row
-                if total_files > 0:
-                    self.tag_files_tree.insert('', 'end', values=(
-                        f"📊 SUMMARY ({total_files} files)",
-                        "Total",
-                        f"+{total_additions}",
-                        f"-{total_deletions}",
-                        str(total_additions + total_deletions)
-                    ), tags=('summary_row',))
+                # Color coding based on change type
+                if status == 'Added':
+                    tags = ('added_file',)
+                elif status == 'Deleted':
+                    tags = ('deleted_file',)
+                elif status == 'Modified':
+                    tags = ('modified_file',)
+                else:
+                    tags = ('renamed_file',)
                 
-            else:
-                # Root commit - all files are new
-                for item in commit.tree.traverse():
-                    if item.type == 'blob':
-                        self.tag_files_tree.insert('', 'end', values=(
-                            item.path,
-                            'Added',
-                            'New',
-                            '0',
-                            'New'
-                        ), tags=('added_file',))
-            
-            # Configure file colors
-            self.tag_files_tree.tag_configure('added_file', background='#d4edda', foreground='#155724')
-            self.tag_files_tree.tag_configure('deleted_file', background='#f8d7da', foreground='#721c24')
-            self.tag_files_tree.tag_configure('modified_file', background='#fff3cd', foreground='#856404')
-            self.tag_files_tree.tag_configure('renamed_file', background='#cce5ff', foreground='#004085')
-            self.tag_files_tree.tag_configure('summary_row', background='#e9ecef', foreground='#495057', font=('TkDefaultFont', 10, 'bold'))
+                rows.append(((file_path, status, f"+{additions}", f"-{deletions}",
+                              str(additions + deletions)), tags))
             
-        except Exception as e:
-            self.tag_files_tree.insert('', 'end', values=(
-                f"Error: {str(e)}",
-                "Error",
-                "N/A",
-                "N/A",
-                "N/A"
-            ))
+            # Add summary row
+            if rows:
+                rows.append(((f"📊 SUMMARY ({len(rows)} files)", "Total", f"+{total_additions}",
+                              f"-{total_deletions}", str(total_additions + total_deletions)), ('summary_row',)))
+        else:
+            # Root commit - all files are new
+            for path in self.git_output('ls-tree', '-r', '--name-only', '-z', sha).split('\0'):
+                if path:
+                    rows.append(((path, 'Added', 'New', '0', 'New'), ('added_file',)))
+        return rows
+    
+    def _apply_tag_file_rows(self, sha, future, error=None):
+        """Insert the collected files changed rows in one pass on the Tk thread"""
+        if sha is not None and sha != self._tag_files_request:
+            return  # A newer tag was selected meanwhile
+        try:
+            if error is None:
+                try:
+                    rows = future.result()
+                except Exception as e:
+                    error = e
+            
+            if error is not None:
+                self._row_pages.pop(str(self.tag_files_tree), None)
+                self.tag_files_tree.delete(*self.tag_files_tree.get_children())
+                self.tag_files_tree.insert('', 'end', values=(
+                    f"Error: {str(error)}",
+                    "Error",
+                    "N/A",
+                    "N/A",
+                    "N/A"
+                ))
+                return
+            
+            entry = self._tag_render_cache.get(sha)
+            if entry is not None:
+                entry[1] = rows
+            self.show_tag_file_rows(rows)
+        except tk.TclError:
+            pass  # Tag manager closed before the diff finished
+    
+    def show_tag_file_rows(self, rows):
+        """Show files changed rows, paging them in as the list is scrolled"""
+        self._row_pages.pop(str(self.tag_files_tree), None)
+        self.tag_files_tree.delete(*self.tag_files_tree.get_children())
+        
+        # Root commits list every file; page them in as the list is scrolled
+        self._row_pages[str(self.tag_files_tree)] = {'rows': rows, 'shown': 0, 'pending': False}
+        self.load_more_rows(self.tag_files_tree, TAG_FILES_PAGE_SIZE)
     
     def refresh_tags_list(self, tags_tree):
         """Refresh the tags list"""
+        self.invalidate_tag_rows()
         self.populate_tags_enhanced(tags_tree)
     
     def switch_to_selected_tag(self, tags_tree):
@@ -966,7 +1591,7 @@ class GitPythonGUI:
                               "This will detach HEAD from the current branch."):
             try:
                 self.repo.git.checkout(tag_name)
-                self.refresh_all()
+                self._request_refresh()
                 self.status_label.config(text=f"✓ Switched to tag: {tag_name} (HEAD detached)")
                 messagebox.showinfo("Success", f"Successfully switched to tag '{tag_name}'")
             except Exception as e:
@@ -986,6 +1611,9 @@ class GitPythonGUI:
                               "This action cannot be undone."):
             try:
                 self.repo.delete_tag(tag_name)
+                self._tag_map.pop(tag_name, None)
+                self.invalidate_tag_rows()
+                self.invalidate_remote_tags()
                 self.refresh_tags_list(tags_tree)
                 self.status_label.config(text=f"✓ Tag '{tag_name}' deleted")
                 messagebox.showinfo("Success", f"Tag '{tag_name}' deleted successfully")
@@ -1002,17 +1630,17 @@ class GitPythonGUI:
         tag_name = tags_tree.item(selection[0])['values'][0]
         
         if messagebox.askyesno("Confirm Push", f"Push tag '{tag_name}' to remote?"):
-            def push_tag():
-                try:
-                    self.status_label.config(text=f"Pushing tag '{tag_name}'...")
-                    self.repo.git.push('origin', tag_name)
-                    self.root.after(0, lambda: self.status_label.config(text=f"✓ Tag '{tag_name}' pushed to remote"))
-                    self.root.after(0, lambda: self.refresh_tags_list(tags_tree))
-                    self.root.after(0, lambda: messagebox.showinfo("Success", f"Tag '{tag_name}' pushed successfully"))
-                except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Push Error", f"Failed to push tag: {str(e)}"))
+            def pushed(error):
+                if error:
+                    messagebox.showerror("Push Error", f"Failed to push tag: {error}")
+                    return
+                self.invalidate_remote_tags()
+                self.status_label.config(text=f"✓ Tag '{tag_name}' pushed to remote")
+                self.refresh_tags_list(tags_tree)
+                messagebox.showinfo("Success", f"Tag '{tag_name}' pushed successfully")
             
-            threading.Thread(target=push_tag, daemon=True).start()
+            self.status_label.config(text=f"Pushing tag '{tag_name}'...")
+            self._push_queue.put(('origin', f'refs/tags/{tag_name}', pushed))
     
     def push_all_tags(self):
         """Push all tags to remote"""
@@ -1021,6 +1649,7 @@ class GitPythonGUI:
                 try:
                     self.status_label.config(text="Pushing all tags...")
                     self.repo.git.push('origin', '--tags')
+                    self.invalidate_remote_tags()
                     self.root.after(0, lambda: self.status_label.config(text="✓ All tags pushed to remote"))
                     self.root.after(0, lambda: messagebox.showinfo("Success", "All tags pushed successfully"))
                 except Exception as e:
@@ -1045,8 +1674,7 @@ class GitPythonGUI:
             return
         
         try:
-            tag = self.repo.tags[tag_name]
-            self.show_file_at_commit(file_path, tag.commit.hexsha)
+            self.show_file_at_commit(file_path, self.tag_commit(tag_name).hexsha)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to view file: {str(e)}")
     
@@ -1111,12 +1739,11 @@ class GitPythonGUI:
         
         if branch_name:
             try:
-                tag = self.repo.tags[tag_name]
-                new_branch = self.repo.create_head(branch_name, tag.commit)
+                new_branch = self.repo.create_head(branch_name, self.tag_commit(tag_name))
                 
                 if messagebox.askyesno("Switch Branch", f"Switch to new branch '{branch_name}'?"):
                     new_branch.checkout()
-                    self.refresh_all()
+                    self._request_refresh()
                 
                 messagebox.showinfo("Success", f"Branch '{branch_name}' created from tag '{tag_name}'")
             except Exception as e:
@@ -1130,19 +1757,13 @@ class GitPythonGUI:
         
         tag_name = tags_tree.item(selection[0])['values'][0]
         
+        # GitHub URL is derived from origin once per refresh
+        if not self._github_base:
+            messagebox.showinfo("Info", "This feature is only available for GitHub repositories")
+            return
+        
         try:
-            remote_url = self.repo.remotes.origin.url
-            if 'github.com' in remote_url:
-                # Convert SSH URL to HTTPS if needed
-                if remote_url.startswith('git@github.com:'):
-                    remote_url = remote_url.replace('git@github.com:', 'https://github.com/')
-                if remote_url.endswith('.git'):
-                    remote_url = remote_url[:-4]
-                
-                github_url = f"{remote_url}/releases/tag/{tag_name}"
-                webbrowser.open(github_url)
-            else:
-                messagebox.showinfo("Info", "This feature is only available for GitHub repositories")
+            webbrowser.open(f"{self._github_base}/releases/tag/{tag_name}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open GitHub: {str(e)}")
     
@@ -1185,8 +1806,7 @@ class GitPythonGUI:
             return
         
         try:
-            tag = self.repo.tags[tag_name]
-            self.compare_file_with_current(files_tree, tag.commit)
+            self.compare_file_with_current(files_tree, self.tag_commit(tag_name))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to compare file: {str(e)}")
     
@@ -1220,85 +1840,158 @@ class GitPythonGUI:
             history_tree.heading(col, text=col)
             history_tree.column(col, width=150)
         
-        try:
-            commits = list(self.repo.iter_commits(paths=file_path))
-            for commit in commits:
-                history_tree.insert('', 'end', values=(
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
-                    commit.author.name,
-                    commit.message.strip()[:50]
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not get file history: {str(e)}")
+        # git log is streamed in a worker; it pauses after each page until the list is scrolled near the end
+        closed = threading.Event()
+        want_more = threading.Event()
+        want_more.set()
+        
+        def on_close(event):
+            if event.widget is history_window:
+                closed.set()
+                want_more.set()  # Let a paused worker notice the close
+        
+        history_window.bind('<Destroy>', on_close)
+        
+        history_scroll = ttk.Scrollbar(history_window, orient=tk.VERTICAL, command=history_tree.yview)
+        
+        def on_history_scroll(first, last):
+            history_scroll.set(first, last)
+            if float(last) > 0.9:
+                want_more.set()
         
+        history_tree.configure(yscrollcommand=on_history_scroll)
+        
+        def add_page(page):
+            try:
+                self.bulk_insert(history_tree, ((values, ()) for values in page))
+            except tk.TclError:
+                closed.set()  # Window closed
+        
+        def log_worker():
+            page = []
+            try:
+                for entry in self.iter_log('--', file_path):
+                    if closed.is_set():
+                        return
+                    page.append((entry.sha[:8], format_commit_time(entry.committed_date, utc_offset=entry.committer_tz),
+                                 entry.author, entry.subject[:50]))
+                    if len(page) == FILE_HISTORY_PAGE_SIZE:
+                        want_more.clear()
+                        self.root.after(0, add_page, page)
+                        page = []
+                        want_more.wait()
+                self.root.after(0, add_page, page)
+            except Exception as e:
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Could not get file history: {str(e)}"))
+        
+        threading.Thread(target=log_worker, daemon=True).start()
+        
+        history_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
         history_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         ttk.Button(history_window, text="Close", command=history_window.destroy).pack(pady=10)
     
     # Continue with the rest of the original methods...
     
-    def populate_repository_tree(self):
+    def populate_repository_tree(self, refresh_status=True):
         """Populate repository tree with folders and status indicators"""
         if not self.repo:
             return
         
-        # Clear existing items
-        for item in self.repo_tree.get_children():
-            self.repo_tree.delete(item)
-        
         # Update file status cache
-        self.update_file_status_cache_enhanced()
+        if refresh_status:
+            self.update_file_status_cache_enhanced()
         
         # Add repository root
         repo_name = os.path.basename(self.repo_path)
         root_status = self.get_folder_status(self.repo_path)
-        root_item = self.repo_tree.insert('', 'end', text=f"{root_status} {repo_name}", values=(self.repo_path,), open=True)
+        rows = [('', self.repo_path, f"{root_status} {repo_name}", (self.repo_path,), (), '')]
+        
+        # Add folders down to the ones that have been expanded
+        self.add_tree_nodes(self.repo_path, self.repo_path, rows)
         
-        # Add folders recursively
-        self.add_tree_nodes(root_item, self.repo_path)
+        # Only folders that appeared, vanished or changed status touch the widget
+        self.fill_tree(self.repo_tree, rows)
+        self.repo_tree.item(self.repo_path, open=True)
     
         
+    def folder_status_bits(self):
+        """Return {folder: STATUS_* bits}, aggregated once per file_status_cache change"""
+        bits = self._folder_status
+        if bits is None:
+            bits = {}
+            root_len = len(self.repo_path.rstrip(os.sep))
+            for file_path, status in self.file_status_cache.items():
+                code = STATUS_CODES.get(status)
+                if code is None:
+                    continue
+                if file_path.endswith(('/', os.sep)):
+                    folder = file_path.rstrip('/' + os.sep)  # Untracked directory entry
+                else:
+                    folder = os.path.dirname(file_path)
+                # Mark the file's folder and its ancestors up to the repository root; once a folder
+                # already has these bits, so do all of its ancestors
+                while True:
+                    seen = bits.get(folder, 0)
+                    if seen | code == seen:
+                        break
+                    bits[folder] = seen | code
+                    parent = os.path.dirname(folder)
+                    if len(folder) <= root_len or parent == folder:
+                        break
+                    folder = parent
+            self._folder_status = bits
+        return bits
+    
     def get_folder_status(self, folder_path):
         """Get status indicator for folder"""
-        has_new = False
-        has_modified = False
-        has_staged = False
-        
-        for file_path, status in self.file_status_cache.items():
-            if file_path.startswith(folder_path):
-                if status == 'NEW':
-                    has_new = True
-                elif status == 'MODIFIED':
-                    has_modified = True
-                elif status in ['STAGED', 'MODIFIED_STAGED']:
-                    has_staged = True
-        
-        if has_staged:
+        bits = self.folder_status_bits().get(folder_path.rstrip(os.sep), 0)
+        
+        if bits & STATUS_STAGED:
             return "📁🟢"  # Green for staged
-        elif has_modified:
+        elif bits & STATUS_MODIFIED:
             return "📁🟠"  # Orange for modified
-        elif has_new:
+        elif bits & STATUS_NEW:
             return "📁🔴"  # Red for new/untracked
         else:
             return "📁"  # Regular folder
     
-    def add_tree_nodes(self, parent, path):
-        """Add tree nodes recursively with status indicators"""
+    def add_tree_nodes(self, parent, path, rows):
+        """Collect folder rows with status indicators, descending only into expanded folders"""
         try:
-            for item in sorted(os.listdir(path)):
-                if item.startswith('.'):
-                    continue
-                
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    status_indicator = self.get_folder_status(item_path)
-                    folder_item = self.repo_tree.insert(parent, 'end', text=f"{status_indicator} {item}", values=(item_path,))
-                    # Add subdirectories
-                    if any(os.path.isdir(os.path.join(item_path, f)) for f in os.listdir(item_path) if not f.startswith('.')):
-                        self.add_tree_nodes(folder_item, item_path)
-        except PermissionError:
-            pass
+            # scandir's entries carry the file type, so no extra stat or second listing per folder
+            entries = visible_entries(path)
+        except OSError:
+            return  # Unreadable, or removed since the parent was listed
+        
+        for entry, is_dir in entries:
+            if is_dir:
+                item_path = entry.path
+                status_indicator = self.get_folder_status(item_path)
+                rows.append((parent, item_path, f"{status_indicator} {entry.name}", (item_path,), (), ''))
+                # Add subdirectories, or a placeholder so the folder shows an expander until it is opened
+                if item_path in self._repo_tree_open:
+                    self.add_tree_nodes(item_path, item_path, rows)
+                elif self.has_subdirs(item_path):
+                    rows.append((item_path, item_path + TREE_PLACEHOLDER_SUFFIX, '…', (item_path,), (), ''))
+            else:
+                break  # Folders sort first, so the rest are files
+    
+    def has_subdirs(self, path):
+        """Whether a folder has any non-hidden subfolder; stops at the first one found"""
+        try:
+            with os.scandir(path) as it:
+                return any(not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False)
+                           for entry in it)
+        except OSError:
+            return False
+    
+    def on_tree_open(self, event):
+        """List a folder's subfolders the first time it is expanded"""
+        item = self.repo_tree.focus()
+        if item and item not in self._repo_tree_open:
+            self._repo_tree_open.add(item)
+            self.populate_repository_tree(refresh_status=False)
     
     def on_tree_select(self, event):
         """Handle tree selection"""
@@ -1311,44 +2004,32 @@ class GitPythonGUI:
                 self.populate_file_list_enhanced(path)
             else:
                 # If no values, try to reconstruct path
-                self.refresh_all()
+                self._request_refresh()
     
         
     def schedule_highlight_clear(self):
         """Schedule clearing of file highlights after 5 seconds"""
-        if hasattr(self, 'highlight_timer'):
+        # Each refresh pushes the deadline back, so a burst of refreshes clears once
+        if self.highlight_timer is not None:
             self.root.after_cancel(self.highlight_timer)
         
         self.highlight_timer = self.root.after(5000, self.clear_file_highlights)
     
     def clear_file_highlights(self):
         """Clear file highlights and reset to normal colors"""
+        self.highlight_timer = None
         try:
-            if hasattr(self, 'file_tree'):
-                # Reset all highlighted files to clean state
-                for child in self.file_tree.get_children():
-                    current_tags = self.file_tree.item(child, 'tags')
-                    if current_tags and current_tags[0] in ['new_file', 'modified_file', 'staged_file', 'modified_staged_file']:
-                        # Get the file path
-                        file_name = self.file_tree.item(child, 'values')[0]
-                        tree_selection = self.repo_tree.selection()
-                        if tree_selection:
-                            tree_item = self.repo_tree.item(tree_selection[0])
-                            values = tree_item['values']
-                            if values:
-                                folder_path = values[0]
-                                file_path = os.path.join(folder_path, file_name)
-                                
-                                # Check if file is still modified
-                                current_status = self.file_status_cache.get(file_path, 'CLEAN')
-                                if current_status == 'CLEAN':
-                                    # Reset to clean styling
-                                    self.file_tree.item(child, tags=('clean_file',))
-                                    icon = self.get_file_icon(file_path, 'CLEAN')
-                                    self.file_tree.item(child, text=icon)
-                
-                # Clear highlighted files set
-                self.highlighted_files.clear()
+            # Only the highlighted rows need a look, not the whole file list
+            for child, file_path in self.highlighted_files.items():
+                # Check if file is still modified
+                if self.file_status_cache.get(file_path, 'CLEAN') == 'CLEAN' and self.file_tree.exists(child):
+                    # Reset to clean styling
+                    self.file_tree.item(child, tags=('clean_file',),
+                                        image=self.status_images['CLEAN'])
+                    self.mark_row_stale(self.file_tree, child)
+            
+            # Clear highlighted files
+            self.highlighted_files.clear()
                 
         except Exception as e:
             pass  # Silently handle any errors during cleanup
@@ -1372,69 +2053,198 @@ class GitPythonGUI:
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
     
-    def get_git_file_info(self, file_path):
+    def file_log(self, head_sha):
+        """Future for read_file_log() at head_sha, started once per HEAD"""
+        cached = self._git_file_info_cache
+        if cached is None or cached[0] != head_sha:
+            future = self._io_pool.submit(self.read_file_log)
+            cached = self._git_file_info_cache = (head_sha, future)
+            future.add_done_callback(lambda _: self.root.after(0, self._file_log_ready, future))
+        return cached[1]
+    
+    def _file_log_ready(self, future):
+        """Redraw the file list once the per-file log lands, if rows were drawn without it"""
+        cached = self._git_file_info_cache
+        if not self._file_log_waiting or cached is None or cached[1] is not future:
+            return
+        self._file_log_waiting = False
+        self._tree_rows.pop(str(self.file_tree), None)
+        tree_selection = self.repo_tree.selection()
+        if tree_selection:
+            values = self.repo_tree.item(tree_selection[0])['values']
+            if values:
+                self.populate_file_list_enhanced(values[0])
+    
+    def get_git_file_info(self, file_path, head_sha=None):
         """Get Git information for a file"""
         if not self.repo:
             return "", "", "", "", ""
         
         try:
             # Get relative path from repo root
-            rel_path = os.path.relpath(file_path, self.repo_path)
-            
-            # Get latest commit for this file
-            commits = list(self.repo.iter_commits(paths=rel_path, max_count=10))
-            
-            if commits:
-                latest_commit = commits[0]
-                branch_info = self.current_branch or "main"
-                commit_info = latest_commit.hexsha[:8]
-                version_info = str(len(commits))
-                author_info = latest_commit.author.name
-                commit_date = latest_commit.committed_datetime.strftime('%Y-%m-%d')
-                
-                return branch_info, commit_info, version_info, author_info, commit_date
+            rel_path = os.path.relpath(file_path, self.repo_path).replace(os.sep, '/')
+            
+            # Latest commit per file comes from one git log walk, redone only when HEAD moves
+            if head_sha is None:
+                head_sha = self.repo.head.commit.hexsha
+            future = self.file_log(head_sha)
+            if not future.done():
+                # Don't hold the Tk thread on the log walk; _file_log_ready redraws the rows
+                self._file_log_waiting = True
+                return self.current_branch or "main", "…", "…", "…", "…"
+            complete, file_info = future.result()
+            
+            info = file_info.get(rel_path)
+            if info:
+                sha, author, date, count = info
+                return self.current_branch or "main", sha[:8], str(count), author, date
+            elif not complete:
+                # Last touched before the walked window; a per-file log here would cost a history walk per row
+                return self.current_branch or "main", "older", f">{FILE_LOG_MAX_COMMITS}", "", ""
             else:
                 return self.current_branch or "main", "New", "0", "", ""
                 
         except Exception:
             return "", "", "", "", ""
     
-    def populate_changes(self):
+    def read_file_log(self, max_count=FILE_LOG_MAX_COMMITS):
+        """Return (complete, {rel path: [sha, author, date, count]}) from one git log --name-only walk"""
+        # Runs in the I/O pool, so git runs as its own process rather than through self.repo
+        output = self.git_output('log', '--name-only', '-z', '--format=%x01%H%x00%an%x00%cd',
+                                 '--date=short', f'--max-count={max_count}')
+        file_info = {}
+        records = output.split('\x01')[1:]
+        for record in records:
+            fields = record.split('\0')
+            sha, author, date = fields[:3]
+            for path in fields[3:]:
+                path = path.lstrip('\n')
+                if not path:
+                    continue
+                info = file_info.get(path)
+                if info is None:
+                    # Newest first, so the first commit seen is the latest for this file
+                    file_info[path] = [sha, author, date, 1]
+                elif info[3] < 10:
+                    info[3] += 1
+        return len(records) < max_count, file_info
+    
+    def populate_changes(self, entries=None):
         """Populate modified and staged files"""
         if not self.repo:
             return
         
-        # Clear existing items
-        for item in self.modified_tree.get_children():
-            self.modified_tree.delete(item)
-        for item in self.staging_tree.get_children():
-            self.staging_tree.delete(item)
-        
         try:
-            # Get repository status
-            status = self.repo.git.status('--porcelain').split('\n')
+            # Get repository status unless the worker already did
+            if entries is None:
+                entries = self.read_status(self.repo_path)['entries']
             
-            for line in status:
-                if not line.strip():
-                    continue
-                
-                status_code = line[:2]
-                file_path = line[3:]
-                
+            staged_rows = []
+            modified_rows = []
+            for status_code, file_path in entries:
                 # Parse status codes
                 if status_code[0] in ['M', 'A', 'D', 'R', 'C']:
                     # Staged changes
                     status_text = self.get_status_text(status_code[0])
-                    self.staging_tree.insert('', 'end', values=(file_path, status_text))
+                    staged_rows.append(('', file_path, '', (file_path, status_text), (), ''))
                 
                 if status_code[1] in ['M', 'D', '?', '!']:
                     # Unstaged changes
                     status_text = self.get_status_text(status_code[1])
-                    self.modified_tree.insert('', 'end', values=(status_text, file_path))
+                    modified_rows.append(('', file_path, '', (status_text, file_path), (), ''))
+            
+            self.fill_tree(self.staging_tree, staged_rows)
+            self.fill_tree(self.modified_tree, modified_rows)
                     
         except Exception as e:
             self.status_label.config(text=f"Error reading status: {str(e)}")
     
+    def fill_tree(self, tree, rows, key=None):
+        """Sync a tree to (parent, iid, text, values, tags, image) rows, touching only rows that changed"""
+        name = str(tree)
+        key = rows if key is None else key
+        if self._tree_rows.get(name) == key:
+            return False
+        self._tree_rows[name] = key
+        
+        state = self._tree_state.get(name, {})
+        new_state = {row[1]: row for row in rows}
+        
+        # Drop rows that are gone (a deleted folder takes its children with it)
+        for iid in state.keys() - new_state.keys():
+            if tree.exists(iid):
+                tree.delete(iid)
+        
+        # Rows arrive in display order, so new ones go in at their index under their parent
+        positions = {}
+        for row in rows:
+            parent, iid, text, values, tags, image = row
+            index = positions.get(parent, 0)
+            positions[parent] = index + 1
+            if iid not in state:
+                tree.insert(parent, index, iid=iid, text=text, values=values, tags=tags, image=image)
+            elif state[iid] != row:
+                tree.item(iid, text=text, values=values, tags=tags, image=image)
+        
+        self._tree_state[name] = new_state
+        return True
+    
+    def recycle_file_rows(self, rows, key=None, folder=None):
+        """Show rows in file_tree by rewriting its existing items in place, only adding or deleting at the tail"""
+        tree = self.file_tree
+        name = str(tree)
+        key = rows if key is None else key
+        if self._tree_rows.get(name) == key:
+            return False
+        self._tree_rows[name] = key
+        
+        # Items are reused across folders, so selection and focus follow the file name, within one folder only
+        if folder is not None and folder == self._file_rows_folder:
+            names = {iid: item for item, iid in self._file_row_iids.items()}
+            selected = [names.get(iid) for iid in tree.selection()]
+            focused = names.get(tree.focus())
+        else:
+            selected, focused = [], None
+        self._file_rows_folder = folder
+        
+        pool = self._file_row_pool
+        state = self._tree_state.get(name, {})
+        new_state = {}
+        for index, (_, _, text, values, tags, image) in enumerate(rows):
+            row = (text, values, tags, image)
+            if index < len(pool):
+                iid = pool[index]
+                if state.get(iid) != row:
+                    tree.item(iid, text=text, values=values, tags=tags, image=image)
+            else:
+                iid = tree.insert('', 'end', text=text, values=values, tags=tags, image=image)
+                pool.append(iid)
+            new_state[iid] = row
+        
+        # Drop the tail the new folder doesn't need
+        if len(pool) > len(rows):
+            tree.delete(*pool[len(rows):])
+            del pool[len(rows):]
+        
+        # A column sort may have moved items around; put the slots back in order
+        if tree.get_children('') != tuple(pool):
+            for index, iid in enumerate(pool):
+                tree.move(iid, '', index)
+        
+        self._tree_state[name] = new_state
+        self._file_row_iids = {row[1]: iid for row, iid in zip(rows, pool)}
+        tree.selection_set([self._file_row_iids[item] for item in selected if item in self._file_row_iids])
+        tree.focus(self._file_row_iids.get(focused, ''))
+        return True
+    
+    def mark_row_stale(self, tree, iid):
+        """Note that a row was edited outside fill_tree so the next fill rewrites it"""
+        name = str(tree)
+        self._tree_rows.pop(name, None)
+        state = self._tree_state.get(name)
+        if state and iid in state:
+            state[iid] = None
+    
     def get_status_text(self, code):
         """Convert status code to readable text"""
         status_map = {
@@ -1456,109 +2266,389 @@ class GitPythonGUI:
             size /= 1024.0
         return f"{size:.1f} TB"
     
-    def refresh_all(self):
+    def _request_refresh(self, announce=False):
+        """Ask for a refresh_all; requests within 150 ms collapse into one"""
+        self._refresh_pending = True
+        # Every caller has just changed the repository (or the user asked); the saved status can't be trusted
+        self.discard_status_cache()
+        # Refreshes after an operation keep its status message ("Staged x") instead of "Refreshing..."
+        self._announce_refresh = self._announce_refresh or announce
+        if self._refresh_timer is None:
+            self._refresh_timer = self.root.after(150, self._do_refresh_if_pending)
+    
+    def _do_refresh_if_pending(self):
+        """Run the coalesced refresh scheduled by _request_refresh"""
+        self._refresh_timer = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_all()
+    
+    def refresh_all(self, use_disk_cache=False):
         """Refresh all data"""
+        self._blob_cache.clear()
+        self._contains_cache.clear()
         if self.repo:
+            header = {'repo_label': dict(text=self.repo_path)}  # Label updates, applied together at idle
             try:
-                # Check if HEAD is detached and pointing to a tag
-                try:
-                    current_ref = self.repo.head.ref
-                    self.current_branch = current_ref.name
-                    self.branch_label.config(text=f"Branch: {self.current_branch}", 
-                                           foreground='#007bff')  # Blue for branch
-                except:
-                    # HEAD is detached, check if it's pointing to a tag
-                    head_commit = self.repo.head.commit
-                    current_tag = None
-                    
-                    for tag in self.repo.tags:
-                        if tag.commit == head_commit:
-                            current_tag = tag.name
-                            break
+                # GitPython's Repo isn't thread-safe, so the header reads stay on this thread
+                self.invalidate_tag_rows()  # Tags may have changed outside the app
+                self.rebuild_tag_map()
+                head_sha, head_ref = self.read_head()
+                if head_sha:
+                    self.file_log(head_sha)  # Warm the per-file commit index before the file list asks for it
+                
+                if head_ref.startswith('refs/heads/'):
+                    self.current_branch = head_ref[len('refs/heads/'):]
+                    header['branch_label'] = dict(text=f"Branch: {self.current_branch}",
+                                                  foreground='#007bff')  # Blue for branch
+                else:
+                    # HEAD is detached, check if it's pointing to a tag (the tag map was just rebuilt)
+                    self.current_branch = None
+                    current_tag = next((name for name, sha in self._tag_map.items() if sha == head_sha), None)
                     
                     if current_tag:
-                        self.current_branch = None
-                        self.branch_label.config(text=f"Tag: {current_tag}", 
-                                               foreground='#fd7e14')  # Orange for tag
+                        header['branch_label'] = dict(text=f"Tag: {current_tag}",
+                                                      foreground='#fd7e14')  # Orange for tag
                     else:
-                        self.current_branch = None
-                        self.branch_label.config(text=f"HEAD: {head_commit.hexsha[:8]}", 
-                                               foreground='#dc3545')  # Red for detached HEAD
+                        header['branch_label'] = dict(text=f"HEAD: {head_sha[:8]}",
+                                                      foreground='#dc3545')  # Red for detached HEAD
                 
                 # Update remote URL and user info
-                try:
-                    remote_url = self.repo.remotes.origin.url
-                    self.remote_label.config(text=f"Remote: {remote_url}")
-                except:
-                    self.remote_label.config(text="No remote configured")
+                remote_url = self.read_remote_url()
+                if remote_url is not None:
+                    header['remote_label'] = dict(text=f"Remote: {remote_url}")
+                    self._github_base = github_base_url(remote_url)
+                else:
+                    header['remote_label'] = dict(text="No remote configured")
+                    self._github_base = None
                 
-                # Update user info with better detection
-                try:
-                    # Try multiple methods to get user config
-                    user_name = ""
-                    user_email = ""
-                    
-                    # Method 1: Try local repo config
-                    try:
-                        config = self.repo.config_reader()
-                        user_name = config.get_value("user", "name", fallback="")
-                        user_email = config.get_value("user", "email", fallback="")
-                    except:
-                        pass
-                    
-                    # Method 2: Try git config command directly
-                    if not user_name:
-                        try:
-                            user_name = self.repo.git.config('user.name').strip()
-                            user_email = self.repo.git.config('user.email').strip()
-                        except:
-                            pass
-                    
-                    # Method 3: Try global config command
-                    if not user_name:
-                        try:
-                            user_name = self.repo.git.config('--global', 'user.name').strip()
-                            user_email = self.repo.git.config('--global', 'user.email').strip()
-                        except:
-                            pass
-                    
-                    # Method 4: Parse .gitconfig file directly
-                    if not user_name:
-                        try:
-                            import configparser
-                            config_file = os.path.expanduser('~/.gitconfig')
-                            if os.path.exists(config_file):
-                                config_parser = configparser.ConfigParser()
-                                config_parser.read(config_file)
-                                if 'user' in config_parser:
-                                    user_name = config_parser['user'].get('name', '')
-                                    user_email = config_parser['user'].get('email', '')
-                        except:
-                            pass
-                    
-                    # Update label based on results
-                    if user_name and user_email:
-                        self.user_label.config(text=f"User: {user_name} <{user_email}>")
-                    elif user_name:
-                        self.user_label.config(text=f"User: {user_name}")
-                    else:
-                        self.user_label.config(text="User: Not configured")
-                        
-                except Exception as e:
-                    self.user_label.config(text="User: Error reading config")
+                # User identity only changes through the config dialog, so it is read once per repository
+                header['user_label'] = self.get_user_label()
                 
-                self.populate_repository_tree()
-                self.populate_changes()
-                self.status_label.config(text="Repository refreshed")
+                self.update_header(header)
                 
-                # Schedule highlight clearing
-                self.schedule_highlight_clear()
+                # Start from the on-disk status if HEAD and the index are unchanged since it was saved;
+                # the views keep showing it (or the previous status) until the worker's result lands
+                cached = self.load_status_cache() if use_disk_cache else None
+                if cached:
+                    self.apply_status(cached)
+                    if self._announce_refresh:
+                        self.status_label.config(text="Revalidating...")
+                elif self._announce_refresh:
+                    self.status_label.config(text="Refreshing...")
+                
+                # Fresh file status comes back from the worker via _drain_results
+                self.request_status()
                 
             except Exception as e:
                 self.status_label.config(text=f"Error refreshing: {str(e)}")
         else:
             self.status_label.config(text="No repository loaded")
     
+    def read_head(self):
+        """Return HEAD's commit sha and the full ref it points at ('HEAD' when detached), in one git call"""
+        try:
+            head_sha, head_ref = self.repo.git.rev_parse('HEAD', '--symbolic-full-name', 'HEAD').split('\n')
+        except:
+            # No commits yet; HEAD can only name an unborn branch
+            head_sha, head_ref = None, 'refs/heads/' + self.repo.head.ref.name
+        return head_sha, head_ref
+    
+    def read_remote_url(self):
+        """URL of the origin remote, or None if there is none"""
+        try:
+            return self.repo.remotes.origin.url
+        except:
+            return None
+    
+    def get_user_label(self):
+        """Return the user_label options for the current repository, reading git config only on first use"""
+        if self._user_cached and self._user_cached[0] == self.repo_path:
+            return self._user_cached[1]
+        
+        try:
+            # Try multiple methods to get user config
+            user_name = ""
+            user_email = ""
+            
+            # Method 1: Try local repo config
+            try:
+                config = self.repo.config_reader()
+                user_name = config.get_value("user", "name", fallback="")
+                user_email = config.get_value("user", "email", fallback="")
+            except:
+                pass
+            
+            # Method 2: Ask git for both keys at once (local, global and system config)
+            if not user_name:
+                try:
+                    output = self.repo.git.config('--get-regexp', r'^user\.(name|email)$')
+                    for line in output.splitlines():
+                        key, _, value = line.partition(' ')
+                        if key == 'user.name':
+                            user_name = value.strip()
+                        elif key == 'user.email':
+                            user_email = value.strip()
+                except:
+                    pass
+            
+            # Method 3: Parse .gitconfig file directly
+            if not user_name:
+                try:
+                    import configparser
+                    config_file = os.path.expanduser('~/.gitconfig')
+                    if os.path.exists(config_file):
+                        config_parser = configparser.ConfigParser()
+                        config_parser.read(config_file)
+                        if 'user' in config_parser:
+                            user_name = config_parser['user'].get('name', '')
+                            user_email = config_parser['user'].get('email', '')
+                except:
+                    pass
+            
+            # Update label based on results
+            if user_name and user_email:
+                label = dict(text=f"User: {user_name} <{user_email}>")
+            elif user_name:
+                label = dict(text=f"User: {user_name}")
+            else:
+                label = dict(text="User: Not configured")
+                
+        except Exception as e:
+            label = dict(text="User: Error reading config")
+        
+        self._user_cached = (self.repo_path, label)
+        return label
+    
+    def update_header(self, labels):
+        """Queue toolbar label changes and apply them in one idle callback, skipping unchanged ones"""
+        first = not self._header_pending
+        self._header_pending.update(labels)
+        if first:
+            self.root.after_idle(self._apply_header)
+    
+    def _apply_header(self):
+        """Write the queued toolbar label changes"""
+        pending, self._header_pending = self._header_pending, {}
+        for name, options in pending.items():
+            if self._header_shown.get(name) != options:
+                getattr(self, name).config(**options)
+                self._header_shown[name] = options
+    
+    def request_status(self, populate=True, include_untracked=True):
+        """Queue a background git status; bursts of requests coalesce into one run"""
+        self._status_outstanding += 1
+        self._status_jobs.put((self.repo_path, self.repo.git_dir, populate, include_untracked, self._status_generation))
+        if self._status_poll is None:
+            self._status_poll = self.root.after(50, self._drain_results)
+    
+    def _push_worker(self):
+        """Run queued pushes one batch at a time; refs queued together for a remote go out in one git push"""
+        while True:
+            jobs = [self._push_queue.get()]
+            while True:
+                try:
+                    jobs.append(self._push_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Fold consecutive pushes to the same remote into one command; each caller keeps its own ref
+            batches = []
+            for remote, ref, on_done in jobs:
+                if batches and batches[-1][0] == remote:
+                    batches[-1][1].append((ref, on_done))
+                else:
+                    batches.append((remote, [(ref, on_done)]))
+            
+            for remote, callbacks in batches:
+                errors = self.push_refs(remote, [ref for ref, _ in callbacks])
+                for ref, on_done in callbacks:
+                    self.root.after(0, on_done, errors[ref])
+    
+    def push_refs(self, remote, refs):
+        """Push full ref names in one git push and return {ref: error or None} from its --porcelain report"""
+        proc = subprocess.run(['git', '-C', self.repo_path, 'push', '--porcelain', remote, *refs],
+                              capture_output=True)
+        stderr = proc.stderr.decode('utf-8', 'replace').strip()
+        results = {}
+        # Ref lines are "<flag>\t<src>:<dst>\t<summary>"; '!' marks a rejected ref
+        for line in proc.stdout.decode('utf-8', 'replace').split('\n'):
+            fields = line.split('\t')
+            if len(fields) >= 3 and len(fields[0]) == 1:
+                dst = fields[1].partition(':')[2]
+                results[dst] = fields[2] if fields[0] == '!' else None
+        if proc.returncode and not results and len(refs) > 1:
+            # git gave up before reporting any ref (one bad ref aborts them all); push each alone
+            return {ref: self.push_refs(remote, [ref])[ref] for ref in refs}
+        # A ref missing from the report failed before reaching the remote
+        fallback = (stderr or f"git push exited with status {proc.returncode}") if proc.returncode else None
+        return {ref: results[ref] if ref in results else fallback for ref in refs}
+    
+    def _status_worker(self):
+        """Serve status jobs one at a time off the Tk thread"""
+        while True:
+            repo_path, git_dir, populate, include_untracked, generation = self._status_jobs.get()
+            jobs = 1
+            while True:
+                try:
+                    repo_path, git_dir, more, more_untracked, generation = self._status_jobs.get_nowait()
+                except queue.Empty:
+                    break
+                populate = populate or more
+                include_untracked = include_untracked or more_untracked
+                jobs += 1
+            
+            result = {'repo_path': repo_path, 'git_dir': git_dir, 'populate': populate, 'jobs': jobs,
+                      'generation': generation}
+            try:
+                # Taken before running status so a concurrent index write only costs a cache miss
+                index_mtime = self.index_mtime(git_dir)
+                result.update(self.read_status(repo_path, include_untracked))
+                if include_untracked:
+                    self._untracked_entries = (repo_path, [e for e in result['entries'] if e[0] == '??'])
+                elif self._untracked_entries[0] == repo_path:
+                    # Carry untracked files over from the last full scan while they still exist
+                    result['entries'] += [e for e in self._untracked_entries[1]
+                                          if os.path.lexists(os.path.join(repo_path, e[1]))]
+                result['cache_key'] = self.status_cache_key(result['oid'], index_mtime)
+                result['index_mtime'] = index_mtime
+            except Exception as e:
+                result['error'] = str(e)
+            self._status_results.put(result)
+    
+    def read_status(self, repo_path, include_untracked=True, paths=()):
+        """Run one `git status --porcelain=v2 -z --branch` (optionally limited to literal paths) and parse it into a dict"""
+        # Skipping the untracked walk is what makes the periodic status cheap on big trees
+        untracked = '--untracked-files=normal' if include_untracked else '--untracked-files=no'
+        output = subprocess.run(['git', '-C', repo_path, '--no-optional-locks', '--literal-pathspecs', 'status',
+                                 '--porcelain=v2', '-z', '--branch', '--no-ahead-behind', untracked,
+                                 '--', *paths],
+                                capture_output=True, check=True).stdout.decode('utf-8', 'replace')
+        status = {'branch': None, 'oid': None, 'entries': []}
+        records = iter(output.split('\0'))
+        for record in records:
+            kind = record[:1]
+            if kind == '#':
+                key, _, value = record[2:].partition(' ')
+                if key == 'branch.head':
+                    status['branch'] = value
+                elif key == 'branch.oid':
+                    status['oid'] = value
+            elif kind in ('1', '2', 'u'):
+                # Ordinary, renamed/copied and unmerged entries differ only in field count
+                fields = record.split(' ', {'1': 8, '2': 9, 'u': 10}[kind])
+                if kind == '2':
+                    next(records, None)  # Original path of a rename/copy
+                status['entries'].append((fields[1].replace('.', ' '), fields[-1]))
+            elif kind in ('?', '!'):
+                status['entries'].append((kind * 2, record[2:]))
+        return status
+    
+    def _drain_results(self):
+        """Apply finished status jobs from the worker on the Tk thread"""
+        latest = None
+        populate = False
+        while True:
+            try:
+                result = self._status_results.get_nowait()
+            except queue.Empty:
+                break
+            self._status_outstanding -= result['jobs']
+            populate = populate or result['populate']
+            latest = result
+        
+        if self._status_outstanding > 0:
+            self._status_poll = self.root.after(50, self._drain_results)
+        else:
+            self._status_poll = None
+        
+        if latest and self.repo and latest['repo_path'] == self.repo_path:
+            self.apply_status(latest, populate)
+            if populate:
+                self._announce_refresh = False  # Reported; later background refreshes stay quiet
+    
+    def apply_status(self, status, populate=True):
+        """Update the status cache and change views from a parsed status"""
+        if 'error' in status:
+            self.status_label.config(text=f"Error reading status: {status['error']}")
+            return
+        
+        self.file_status_cache = {}
+        self._folder_status = None
+        for status_code, file_path in status['entries']:
+            file_status = self.classify_status_code(status_code)
+            if file_status:
+                self.file_status_cache[os.path.join(self.repo_path, file_path)] = file_status
+        
+        if populate:
+            self.populate_repository_tree(refresh_status=False)
+            self.populate_changes(status['entries'])
+            if self._announce_refresh:
+                self.status_label.config(text="Repository refreshed")
+            
+            # Schedule highlight clearing
+            self.schedule_highlight_clear()
+        
+        # Only a snapshot taken since the last discard_status_cache may be written back
+        saved = (status.get('cache_key'), status['entries'])
+        if saved[0] and saved != self._status_saved and status.get('generation') == self._status_generation:
+            self._status_saved = saved
+            self._io_pool.submit(self.save_status_cache, self.repo_path, status)
+    
+    def index_mtime(self, git_dir):
+        """Modification time of the index in nanoseconds, 0 if there is none"""
+        try:
+            return os.stat(os.path.join(git_dir, 'index')).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def status_cache_key(self, head_sha, index_mtime):
+        """Key a saved status by HEAD and the index mtime"""
+        return hashlib.blake2b(f"{head_sha}\0{index_mtime}".encode(), digest_size=16).hexdigest()
+    
+    def status_cache_file(self, repo_path):
+        """Location of the on-disk status cache for a repository"""
+        name = hashlib.blake2b(repo_path.encode('utf-8', 'surrogateescape'), digest_size=16).hexdigest()
+        return os.path.join(os.path.expanduser('~'), '.cache', 'gitpythongui', f"{name}.pkl")
+    
+    def load_status_cache(self):
+        """Return the saved status if it still matches HEAD and the index, else None"""
+        try:
+            with open(self.status_cache_file(self.repo_path), 'rb') as f:
+                status = pickle.load(f)
+            key = self.status_cache_key(self.repo.head.commit.hexsha, self.index_mtime(self.repo.git_dir))
+        except Exception:
+            return None
+        if status.get('repo_path') != self.repo_path or status.get('cache_key') != key:
+            return None
+        self._status_saved = (key, status['entries'])
+        return status
+    
+    def discard_status_cache(self):
+        """Delete the on-disk status after an index write (the mtime key can miss it on coarse-timestamp filesystems)"""
+        self._status_saved = None
+        self._status_generation += 1
+        try:
+            os.remove(self.status_cache_file(self.repo_path))
+        except OSError:
+            pass
+    
+    def save_status_cache(self, repo_path, status):
+        """Write a parsed status to the on-disk cache"""
+        path = self.status_cache_file(repo_path)
+        if self.index_mtime(status['git_dir']) != status['index_mtime']:
+            return  # The index changed while the snapshot was being taken or queued; it is already stale
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = {'repo_path': repo_path, 'cache_key': status['cache_key'], 'branch': status['branch'],
+                    'oid': status['oid'], 'entries': status['entries']}
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass  # The cache is only an optimization
+    
     def git_pull(self):
         """Execute git pull"""
         if not self.repo:
@@ -1569,8 +2659,10 @@ class GitPythonGUI:
             try:
                 self.status_label.config(text="Pulling changes...")
                 self.repo.remotes.origin.pull()
+                self.invalidate_remote_tags()
+                self.invalidate_tag_rows()
                 self.root.after(0, lambda: self.status_label.config(text="Pull completed"))
-                self.root.after(0, self.refresh_all)
+                self.root.after(0, self._request_refresh)
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Pull Error", str(e)))
         
@@ -1602,12 +2694,38 @@ class GitPythonGUI:
             try:
                 self.status_label.config(text="Fetching changes...")
                 self.repo.remotes.origin.fetch()
+                self.invalidate_remote_tags()
+                self.invalidate_tag_rows()
                 self.root.after(0, lambda: self.status_label.config(text="Fetch completed"))
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Fetch Error", str(e)))
         
         threading.Thread(target=fetch_worker, daemon=True).start()
     
+    def run_git_write(self, args, on_done, error_title):
+        """Run a git write as its own process in a worker thread, serialized with other writes, then call on_done(output) on the Tk thread"""
+        def worker():
+            try:
+                with self._git_write_lock:
+                    # A separate git process, so the Tk thread's self.repo is never shared across threads
+                    result = self.git_output(*args)
+            except subprocess.CalledProcessError as e:
+                # Show git's own explanation rather than just the exit status
+                message = e.stderr.decode('utf-8', 'replace').strip() or str(e)
+                self.root.after(0, self.discard_status_cache)  # A failed write may still have touched the index
+                self.root.after(0, lambda: messagebox.showerror(error_title, message))
+                return
+            except Exception as e:
+                message = str(e)
+                self.root.after(0, self.discard_status_cache)
+                self.root.after(0, lambda: messagebox.showerror(error_title, message))
+                return
+            # The status cache fields belong to the Tk thread; after() runs these in order
+            self.root.after(0, self.discard_status_cache)
+            self.root.after(0, lambda: on_done(result))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def git_commit(self):
         """Execute git commit"""
         if not self.repo:
@@ -1633,12 +2751,13 @@ class GitPythonGUI:
         # Get commit message
         message = simpledialog.askstring("Commit Message", "Enter commit message:")
         if message:
-            try:
-                self.repo.index.commit(message)
+            def done(_):
                 self.status_label.config(text="Commit completed")
-                self.refresh_all()
-            except Exception as e:
-                messagebox.showerror("Commit Error", str(e))
+                self._request_refresh()
+            
+            self.status_label.config(text="Committing...")
+            # --no-verify: hooks would run on a worker thread with nowhere to show their output
+            self.run_git_write(['commit', '--no-verify', '-m', message], done, "Commit Error")
     
     def git_add_all(self):
         """Add all changes to staging area"""
@@ -1646,13 +2765,13 @@ class GitPythonGUI:
             messagebox.showerror("Error", "No repository loaded")
             return
         
-        try:
-            # Add all files including untracked
-            self.repo.git.add('-A')
+        def done(_):
             self.status_label.config(text="All changes added to staging area")
-            self.refresh_all()
-        except Exception as e:
-            messagebox.showerror("Add Error", str(e))
+            self._request_refresh()
+        
+        # Add all files including untracked
+        self.status_label.config(text="Adding all changes...")
+        self.run_git_write(['add', '-A'], done, "Add Error")
     
     def add_selected_file(self):
         """Add selected file to Git"""
@@ -1667,46 +2786,42 @@ class GitPythonGUI:
                 file_path = os.path.join(folder_path, file_name)
                 rel_path = os.path.relpath(file_path, self.repo_path)
                 
-                try:
-                    self.repo.index.add([rel_path])
+                def done(_):
                     self.status_label.config(text=f"Added {file_name} to Git")
-                    self.refresh_all()
-                except Exception as e:
-                    messagebox.showerror("Add Error", str(e))
+                    self._request_refresh()
+                
+                self.run_git_write(['--literal-pathspecs', 'add', '--', rel_path], done, "Add Error")
     
     def stage_file(self, event):
-        """Stage selected file"""
+        """Stage the selected files with one git add"""
         selection = self.modified_tree.selection()
         if selection:
-            item = selection[0]
-            file_path = self.modified_tree.item(item)['values'][1]
-            try:
-                self.repo.index.add([file_path])
+            file_paths = list(selection)  # Rows are keyed by path; values would coerce '007' to 7
+            staged = file_paths[0] if len(file_paths) == 1 else f"{len(file_paths)} files"
+            
+            def done(_):
                 self.populate_changes()
-                self.status_label.config(text=f"Staged {file_path}")
-            except Exception as e:
-                messagebox.showerror("Stage Error", str(e))
+                self.status_label.config(text=f"Staged {staged}")
+            
+            self.run_git_write(['--literal-pathspecs', 'add', '--', *file_paths], done, "Stage Error")
     
     def unstage_file(self, event):
-        """Unstage selected file"""
+        """Unstage the selected files with one git reset"""
         selection = self.staging_tree.selection()
         if selection:
-            item = selection[0]
-            file_path = self.staging_tree.item(item)['values'][0]
-            try:
-                self.repo.index.reset([file_path])
+            file_paths = list(selection)  # Rows are keyed by path; values would coerce '007' to 7
+            unstaged = file_paths[0] if len(file_paths) == 1 else f"{len(file_paths)} files"
+            
+            def done(_):
                 self.populate_changes()
-                self.status_label.config(text=f"Unstaged {file_path}")
-            except Exception as e:
-                messagebox.showerror("Unstage Error", str(e))
+                self.status_label.config(text=f"Unstaged {unstaged}")
+            
+            self.run_git_write(['--literal-pathspecs', 'reset', '-q', '--', *file_paths], done, "Unstage Error")
     
     def open_in_vscode(self):
-        """Open selected file in VS Code"""
+        """Open the selected files in VS Code with a single launch"""
         selection = self.file_tree.selection()
         if selection:
-            item = selection[0]
-            file_name = self.file_tree.item(item)['values'][0]
-            
             # Get current folder path
             tree_selection = self.repo_tree.selection()
             if tree_selection:
@@ -1719,31 +2834,40 @@ class GitPythonGUI:
             else:
                 folder_path = self.repo_path
             
-            file_path = os.path.join(folder_path, file_name)
+            file_paths = [os.path.join(folder_path, str(self.file_tree.item(item)['values'][0]))
+                          for item in selection]
             
-            # Make sure the file exists
-            if os.path.exists(file_path):
-                try:
-                    # Try different VS Code commands
-                    commands_to_try = ['code', 'code.cmd', 'code.exe']
-                    
-                    for cmd in commands_to_try:
-                        try:
-                            subprocess.run([cmd, file_path], check=True)
-                            self.status_label.config(text=f"Opened {file_name} in VS Code")
-                            return
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            continue
-                    
-                    # If VS Code not found, try opening with system default
-                    import webbrowser
+            # Make sure the files exist
+            missing = [path for path in file_paths if not os.path.exists(path)]
+            file_paths = [path for path in file_paths if path not in missing]
+            if not file_paths:
+                messagebox.showerror("Error", f"File not found: {missing[0]}")
+                return
+            
+            opened = (os.path.basename(file_paths[0]) if len(file_paths) == 1
+                      else f"{len(file_paths)} files")
+            try:
+                if self.launch_vscode(file_paths):
+                    self.status_label.config(text=f"Opened {opened} in VS Code")
+                    return
+                
+                # If VS Code not found, try opening with system default
+                for file_path in file_paths:
                     webbrowser.open(file_path)
-                    self.status_label.config(text=f"Opened {file_name} with default application")
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Could not open file: {str(e)}")
-            else:
-                messagebox.showerror("Error", f"File not found: {file_path}")
+                self.status_label.config(text=f"Opened {opened} with default application")
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not open file: {str(e)}")
+    
+    def launch_vscode(self, paths):
+        """Start one `code --reuse-window` for all paths; False if VS Code is not installed"""
+        for cmd in ('code', 'code.cmd', 'code.exe'):
+            try:
+                subprocess.Popen([cmd, '--reuse-window', *paths])
+                return True
+            except FileNotFoundError:
+                continue
+        return False
     
     def show_file_context_menu(self, event):
         """Show context menu for file operations"""
@@ -1775,15 +2899,9 @@ class GitPythonGUI:
             if os.path.isfile(file_path):
                 try:
                     # Try VS Code first, then system default
-                    commands_to_try = ['code', 'code.cmd', 'code.exe']
-                    
-                    for cmd in commands_to_try:
-                        try:
-                            subprocess.run([cmd, file_path], check=True)
-                            self.status_label.config(text=f"Opened {file_name} in VS Code")
-                            return
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            continue
+                    if self.launch_vscode([file_path]):
+                        self.status_label.config(text=f"Opened {file_name} in VS Code")
+                        return
                     
                     # Fallback to system default
                     if sys.platform.startswith('darwin'):
@@ -1835,7 +2953,7 @@ class GitPythonGUI:
                     for commit in commits:
                         history_tree.insert('', 'end', values=(
                             commit.hexsha[:8],
-                            commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
+                            format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset),
                             commit.author.name,
                             commit.message.strip()
                         ))
@@ -1883,49 +3001,29 @@ class GitPythonGUI:
         left_frame = ttk.LabelFrame(paned, text="HEAD Version")
         paned.add(left_frame, weight=1)
         
-        left_text = tk.Text(left_frame, font=('Courier', 9), wrap=tk.NONE)
-        left_v_scroll = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=left_text.yview)
-        left_h_scroll = ttk.Scrollbar(left_frame, orient=tk.HORIZONTAL, command=left_text.xview)
-        left_text.configure(yscrollcommand=left_v_scroll.set, xscrollcommand=left_h_scroll.set)
-        
-        left_text.grid(row=0, column=0, sticky='nsew')
-        left_v_scroll.grid(row=0, column=1, sticky='ns')
-        left_h_scroll.grid(row=1, column=0, sticky='ew')
-        
-        left_frame.grid_rowconfigure(0, weight=1)
-        left_frame.grid_columnconfigure(0, weight=1)
+        left_text = self._make_code_text(left_frame, self._code_font_9)
         
         # Right side - working directory version
         right_frame = ttk.LabelFrame(paned, text="Working Directory")
         paned.add(right_frame, weight=1)
         
-        right_text = tk.Text(right_frame, font=('Courier', 9), wrap=tk.NONE)
-        right_v_scroll = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=right_text.yview)
-        right_h_scroll = ttk.Scrollbar(right_frame, orient=tk.HORIZONTAL, command=right_text.xview)
-        right_text.configure(yscrollcommand=right_v_scroll.set, xscrollcommand=right_h_scroll.set)
-        
-        right_text.grid(row=0, column=0, sticky='nsew')
-        right_v_scroll.grid(row=0, column=1, sticky='ns')
-        right_h_scroll.grid(row=1, column=0, sticky='ew')
-        
-        right_frame.grid_rowconfigure(0, weight=1)
-        right_frame.grid_columnconfigure(0, weight=1)
+        right_text = self._make_code_text(right_frame, self._code_font_9)
         
         try:
             # Get HEAD version
             try:
-                head_commit = self.repo.head.commit
-                head_content = head_commit.tree[rel_path].data_stream.read().decode('utf-8', errors='replace')
-                left_text.insert('1.0', head_content)
-            except:
-                left_text.insert('1.0', "File not found in HEAD or binary file")
+                head_content = decode_or_binary(self._read_blob(self.repo.head.commit, rel_path))
+            except (KeyError, ValueError):
+                head_content = None
+            left_text.insert('1.0', head_content if head_content is not None
+                             else "File not found in HEAD or binary file")
             
             # Get working directory version
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    working_content = f.read()
-                    right_text.insert('1.0', working_content)
-            else:
+            try:
+                working_content = decode_or_binary(Path(file_path).read_bytes())
+                right_text.insert('1.0', working_content if working_content is not None
+                                  else "Binary file - cannot display")
+            except FileNotFoundError:
                 right_text.insert('1.0', "File not found in working directory")
             
             left_text.config(state=tk.DISABLED)
@@ -1956,13 +3054,75 @@ class GitPythonGUI:
         
         branch_name = simpledialog.askstring("New Branch", "Enter branch name:")
         if branch_name:
-            try:
-                new_branch = self.repo.create_head(branch_name)
-                new_branch.checkout()
-                self.refresh_all()
+            def done(_):
+                self._request_refresh()
                 self.status_label.config(text=f"Created and switched to branch: {branch_name}")
+            
+            self.run_git_write(['checkout', '-b', branch_name], done, "Branch Error")
+    
+    def _list_refs_bulk(self, pattern):
+        """Return {name: (short sha, commit date, author, is HEAD, subject)} for the refs under pattern from one for-each-ref"""
+        # %(contents:subject) is an annotated tag's own message, else the commit subject
+        output = self.git_output(
+            'for-each-ref', '--format=%(HEAD)%09%(refname:lstrip=2)%09%(objectname:short)%09%(committerdate:short)%09%(authorname)'
+            '%09%(*objectname:short)%09%(*committerdate:short)%09%(*authorname)%09%(contents:subject)', pattern)
+        refs = {}
+        for line in output.split('\n'):
+            if not line:
+                continue
+            head, name, sha, date, author, peeled_sha, peeled_date, peeled_author, subject = line.split('\t', 8)
+            if peeled_sha:
+                # Annotated tag: describe the commit it points at
+                sha, date, author = peeled_sha, peeled_date, peeled_author
+            refs[name] = (sha, date, author, head == '*', subject.strip())
+        return refs
+    
+    def _collect_refs(self):
+        """Read the switch dialog's (local rows, remote rows, tag rows, current branch)"""
+        # Runs in a worker thread: every read is its own git process, never the shared self.repo
+        # Commit, date and author for every branch and tag, one git call per namespace
+        local_refs = self._list_refs_bulk('refs/heads/')
+        remote_refs = self._list_refs_bulk('refs/remotes/origin/')
+        tag_refs = self._list_refs_bulk('refs/tags/')
+        
+        # Get list of branches; a set, since it is only used for membership checks
+        local_branches = set(local_refs)
+        
+        # Get remote branches without a local branch of the same name; origin's refs come
+        # straight from their own namespace rather than a scan over every ref
+        remote_branches = [name for name in remote_refs
+                           if name != 'origin/HEAD' and name[len('origin/'):] not in local_branches]
+        # for-each-ref marks the checked-out branch, so HEAD is never resolved per branch
+        current = next((name for name, ref in local_refs.items() if ref[3]), None)
+        
+        local_rows = []
+        for branch_name, (sha, date, author, is_head, _) in local_refs.items():
+            is_current = "✓ Current" if is_head else ""
+            local_rows.append((branch_name, f"Local {is_current}", sha, date, author))
+        
+        remote_rows = []
+        for branch_name in remote_branches:
+            sha, date, author, _, _ = remote_refs[branch_name]
+            remote_rows.append((branch_name, "Remote", sha, date, author))
+        
+        tag_rows = []
+        for tag_name, (sha, date, author, _, subject) in tag_refs.items():
+            tag_rows.append((tag_name, sha, date, author, subject[:50]))
+        
+        return local_rows, remote_rows, tag_rows, current
+    
+    def _collect_refs_async(self, callback):
+        """Run _collect_refs in a worker thread and pass its result to callback on the Tk thread"""
+        def collect_worker():
+            try:
+                refs = self._collect_refs()
             except Exception as e:
-                messagebox.showerror("Branch Error", str(e))
+                message = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to read branches: {message}"))
+                return
+            self.root.after(0, callback, refs)
+        
+        threading.Thread(target=collect_worker, daemon=True).start()
     
     def switch_branch(self):
         """Switch to different branch or tag with improved interface"""
@@ -1971,38 +3131,17 @@ class GitPythonGUI:
             return
         
         try:
-            # Get list of branches
-            local_branches = [str(branch.name) for branch in self.repo.branches]
-            remote_branches = []
-            
-            # Get remote branches
-            try:
-                for ref in self.repo.refs:
-                    if ref.name.startswith('origin/') and not ref.name.endswith('/HEAD'):
-                        branch_name = ref.name.replace('origin/', '')
-                        if branch_name not in local_branches:
-                            remote_branches.append(f"origin/{branch_name}")
-            except:
-                pass
-            
-            # Get tags
-            tags = [tag.name for tag in self.repo.tags]
-            
-            # Create branch/tag selection window
+            # Create branch/tag selection window right away; the refs are read in the background
             switch_window = tk.Toplevel(self.root)
             switch_window.title("Switch Branch or Tag")
             switch_window.geometry("700x500")
             
             ttk.Label(switch_window, text="Select branch or tag to switch to:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
             
-            # Current branch info
-            try:
-                current = self.repo.active_branch.name
-                ttk.Label(switch_window, text=f"Current branch: {current}", 
-                         font=('TkDefaultFont', 9)).pack(pady=5)
-            except:
-                ttk.Label(switch_window, text="Current: HEAD detached", 
-                         font=('TkDefaultFont', 9)).pack(pady=5)
+            # Current branch info, filled in once the refs are read
+            current_label = ttk.Label(switch_window, text="Loading branches and tags...", 
+                                      font=('TkDefaultFont', 9))
+            current_label.pack(pady=5)
             
             # Create notebook for branches and tags
             notebook = ttk.Notebook(switch_window)
@@ -2028,36 +3167,6 @@ class GitPythonGUI:
             branch_scrollbar = ttk.Scrollbar(branch_frame, orient=tk.VERTICAL, command=branch_tree.yview)
             branch_tree.configure(yscrollcommand=branch_scrollbar.set)
             
-            # Populate branches
-            for branch_name in local_branches:
-                try:
-                    branch = self.repo.heads[branch_name]
-                    commit = branch.commit
-                    is_current = "✓ Current" if branch == self.repo.active_branch else ""
-                    branch_tree.insert('', 'end', values=(
-                        branch_name,
-                        f"Local {is_current}",
-                        commit.hexsha[:8],
-                        commit.committed_datetime.strftime('%Y-%m-%d'),
-                        commit.author.name
-                    ))
-                except:
-                    branch_tree.insert('', 'end', values=(branch_name, "Local", "", "", ""))
-            
-            for branch_name in remote_branches:
-                try:
-                    ref = self.repo.refs[branch_name]
-                    commit = ref.commit
-                    branch_tree.insert('', 'end', values=(
-                        branch_name,
-                        "Remote",
-                        commit.hexsha[:8],
-                        commit.committed_datetime.strftime('%Y-%m-%d'),
-                        commit.author.name
-                    ))
-                except:
-                    branch_tree.insert('', 'end', values=(branch_name, "Remote", "", "", ""))
-            
             branch_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             branch_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
@@ -2081,29 +3190,24 @@ class GitPythonGUI:
             tag_scrollbar = ttk.Scrollbar(tag_frame, orient=tk.VERTICAL, command=tag_tree.yview)
             tag_tree.configure(yscrollcommand=tag_scrollbar.set)
             
-            # Populate tags
-            for tag in self.repo.tags:
-                commit = tag.commit
-                message = ""
-                try:
-                    if hasattr(tag, 'tag') and tag.tag and tag.tag.message:
-                        message = tag.tag.message.strip()[:50]
-                    else:
-                        message = commit.message.strip()[:50]
-                except:
-                    message = "No message"
-                
-                tag_tree.insert('', 'end', values=(
-                    tag.name,
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d'),
-                    commit.author.name,
-                    message
-                ))
-            
             tag_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             tag_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
+            def populate(refs):
+                local_rows, remote_rows, tag_rows, current = refs
+                if not switch_window.winfo_exists():
+                    return
+                if current:
+                    current_label.config(text=f"Current branch: {current}")
+                else:
+                    current_label.config(text="Current: HEAD detached")
+                
+                # Populate branches and tags, each tree unmapped while it fills
+                self.bulk_insert(branch_tree, [(values, ()) for values in local_rows + remote_rows])
+                self.bulk_insert(tag_tree, [(values, ()) for values in tag_rows])
+            
+            self._collect_refs_async(populate)
+            
             def switch_to_selected():
                 current_tab = notebook.select()
                 tab_text = notebook.tab(current_tab, "text")
@@ -2122,14 +3226,14 @@ class GitPythonGUI:
                                 if messagebox.askyesno("Create Local Branch", 
                                                      f"Create local branch '{local_name}' from '{branch_name}'?"):
                                     self.repo.git.checkout('-b', local_name, branch_name)
-                                    self.refresh_all()
+                                    self._request_refresh()
                                     self.status_label.config(text=f"Created and switched to branch: {local_name}")
                                     switch_window.destroy()
                             else:
                                 # Switch to existing local branch
                                 clean_branch_name = branch_name.replace(" ✓ Current", "")
                                 self.repo.git.checkout(clean_branch_name)
-                                self.refresh_all()
+                                self._request_refresh()
                                 self.status_label.config(text=f"Switched to branch: {clean_branch_name}")
                                 switch_window.destroy()
                                 
@@ -2146,17 +3250,16 @@ class GitPythonGUI:
                         if messagebox.askyesno("Confirm", f"Switch to tag '{tag_name}'?\nThis will detach HEAD."):
                             try:
                                 self.repo.git.checkout(tag_name)
-                                self.refresh_all()
+                                self._request_refresh()
                                 self.status_label.config(text=f"Switched to tag: {tag_name} (HEAD detached)")
                                 switch_window.destroy()
                                 
                                 # Update branch label to show tag
-                                self.branch_label.config(text=f"Tag: {tag_name}", 
-                                                       foreground='#fd7e14')  # Orange for tag
+                                self.update_header({'branch_label': dict(text=f"Tag: {tag_name}",
+                                                                         foreground='#fd7e14')})  # Orange for tag
                                 
-                                # Refresh graph if open
-                                if hasattr(self, 'graph_canvas'):
-                                    self.draw_commit_graph(self.graph_canvas)
+                                # Move the HEAD marker if the graph is open
+                                self.update_graph_head()
                                     
                             except Exception as e:
                                 messagebox.showerror("Switch Error", f"Failed to switch to tag: {str(e)}")
@@ -2188,8 +3291,11 @@ class GitPythonGUI:
                         self.status_label.config(text="Cloning repository...")
                         cloned_repo = git.Repo.clone_from(url, folder)
                         self.repo = cloned_repo
+                        self.invalidate_tag_rows()
+                        self.invalidate_remote_tags()
                         self.repo_path = folder
-                        self.root.after(0, self.refresh_all)
+                        self._repo_prefix_len = len(self.repo_path.rstrip(os.sep)) + 1
+                        self.root.after(0, self._request_refresh)
                         self.root.after(0, lambda: self.status_label.config(text="Repository cloned successfully"))
                     except Exception as e:
                         self.root.after(0, lambda: messagebox.showerror("Clone Error", str(e)))
@@ -2222,20 +3328,40 @@ class GitPythonGUI:
         log_tree.column('Author', width=150)
         log_tree.column('Message', width=500)
         
-        # Populate log
-        try:
-            commits = list(self.repo.iter_commits(max_count=100))
-            for commit in commits:
-                log_tree.insert('', 'end', values=(
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                    commit.author.name,
-                    commit.message.strip()
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not get commit log: {str(e)}")
-        
         log_tree.pack(fill=tk.BOTH, expand=True)
+        
+        # Populate log: rows stream in from one git log pipe while the window is already up
+        closed = threading.Event()
+        
+        def on_close(event):
+            if event.widget is log_window:
+                closed.set()
+        
+        log_window.bind('<Destroy>', on_close)
+        
+        def add_batch(batch):
+            try:
+                self.bulk_insert(log_tree, batch)
+            except tk.TclError:
+                closed.set()  # Window closed
+        
+        def log_worker():
+            batch = []
+            try:
+                for entry in self.iter_log(f'--max-count={COMMIT_LOG_MAX_COMMITS}', 'HEAD'):
+                    if closed.is_set():
+                        return  # Leaving the loop stops git
+                    batch.append(((entry.sha[:8], format_commit_time(entry.committed_date, 'seconds', entry.committer_tz),
+                                   entry.author, entry.subject), ()))
+                    if len(batch) == COMMIT_LOG_BATCH_SIZE:
+                        self.root.after(0, add_batch, batch)
+                        batch = []
+                self.root.after(0, add_batch, batch)
+            except Exception as e:
+                message = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Error", f"Could not get commit log: {message}"))
+        
+        threading.Thread(target=log_worker, daemon=True).start()
     
     def show_about(self):
         """Show about dialog"""
@@ -2280,10 +3406,9 @@ Inspired by Simple VCS version control system.
         local_tree.column('Value', width=300)
         
         try:
-            config = self.repo.config_reader()
-            for section_name in config.sections():
+            for section_name, items in self.config_sections(self.repo.config_reader()):
                 section_item = local_tree.insert('', 'end', text=section_name, values=('',))
-                for (name, value) in config.items(section_name):
+                for (name, value) in items:
                     local_tree.insert(section_item, 'end', text=f"  {name}", values=(value,))
         except Exception as e:
             local_tree.insert('', 'end', text="Error", values=(str(e),))
@@ -2301,11 +3426,9 @@ Inspired by Simple VCS version control system.
         global_tree.column('Value', width=300)
         
         try:
-            from git import GitConfigParser
-            global_config = GitConfigParser([os.path.expanduser('~/.gitconfig')], read_only=True)
-            for section_name in global_config.sections():
+            for section_name, items in self.global_config_sections():
                 section_item = global_tree.insert('', 'end', text=section_name, values=('',))
-                for (name, value) in global_config.items(section_name):
+                for (name, value) in items:
                     global_tree.insert(section_item, 'end', text=f"  {name}", values=(value,))
         except Exception as e:
             global_tree.insert('', 'end', text="Error", values=(str(e),))
@@ -2319,6 +3442,26 @@ Inspired by Simple VCS version control system.
         ttk.Button(button_frame, text="Edit Config", command=self.edit_config).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Close", command=config_window.destroy).pack(side=tk.RIGHT, padx=5)
     
+    def config_sections(self, config):
+        """Read a config parser into [(section, [(name, value)])] in one pass, before any rows are inserted"""
+        sections = []
+        for section_name in config.sections():
+            sections.append((section_name, config.items(section_name)))
+        return sections
+    
+    def global_config_sections(self):
+        """Return ~/.gitconfig as [(section, [(name, value)])], parsed again only when the file changes"""
+        config_file = os.path.expanduser('~/.gitconfig')
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._global_config_cache is None or self._global_config_cache[0] != mtime:
+            from git import GitConfigParser
+            global_config = GitConfigParser([config_file], read_only=True)
+            self._global_config_cache = (mtime, self.config_sections(global_config))
+        return self._global_config_cache[1]
+    
     def edit_config(self):
         """Edit Git configuration"""
         config_window = tk.Toplevel(self.root)
@@ -2352,7 +3495,9 @@ Inspired by Simple VCS version control system.
                 with self.repo.config_writer() as config:
                     config.set_value("user", "name", name_var.get())
                     config.set_value("user", "email", email_var.get())
-                self.refresh_all()
+                self._user_cached = None
+                self._global_config_cache = None
+                self._request_refresh()
                 messagebox.showinfo("Success", "Configuration saved successfully")
                 config_window.destroy()
             except Exception as e:
@@ -2420,7 +3565,7 @@ Inspired by Simple VCS version control system.
         # Current commit info
         try:
             current_commit = self.repo.head.commit
-            commit_info = f"Tag will be created at: {current_commit.hexsha[:8]} - {current_commit.message.strip()[:50]}"
+            commit_info = f"Tag will be created at: {current_commit.hexsha[:8]} - {current_commit.summary[:50]}"
             ttk.Label(tag_window, text=commit_info, font=('TkDefaultFont', 8), 
                      foreground='#6c757d').pack(padx=20, pady=5)
         except:
@@ -2452,6 +3597,7 @@ Inspired by Simple VCS version control system.
                     self.repo.create_tag(tag_name, message=full_message)
                 else:
                     self.repo.create_tag(tag_name)
+                self.invalidate_tag_rows()
                 
                 tag_window.destroy()
                 
@@ -2460,24 +3606,24 @@ Inspired by Simple VCS version control system.
                 
                 # Push tag if requested
                 if push_after_create.get():
-                    def push_tag():
-                        try:
-                            self.status_label.config(text=f"Pushing tag '{tag_name}' to GitHub...")
-                            self.repo.git.push('origin', tag_name)
-                            final_msg = f"✓ Tag '{tag_name}' created and pushed to GitHub"
-                            self.status_label.config(text=final_msg)
-                            messagebox.showinfo("Success", f"Tag '{tag_name}' created and pushed to GitHub!\n\nThe tag is now visible on GitHub.")
-                        except Exception as e:
-                            error_msg = f"Tag created but push failed: {str(e)}"
+                    def pushed(error):
+                        if error:
+                            error_msg = f"Tag created but push failed: {error}"
                             self.status_label.config(text=error_msg)
-                            messagebox.showerror("Push Error", f"Tag '{tag_name}' was created locally but failed to push to GitHub:\n\n{str(e)}\n\nUse 'Push Branch + Tags' to push it later.")
+                            messagebox.showerror("Push Error", f"Tag '{tag_name}' was created locally but failed to push to GitHub:\n\n{error}\n\nUse 'Push Branch + Tags' to push it later.")
+                            return
+                        self.invalidate_remote_tags()
+                        final_msg = f"✓ Tag '{tag_name}' created and pushed to GitHub"
+                        self.status_label.config(text=final_msg)
+                        messagebox.showinfo("Success", f"Tag '{tag_name}' created and pushed to GitHub!\n\nThe tag is now visible on GitHub.")
                     
-                    # Push in background
-                    threading.Thread(target=push_tag, daemon=True).start()
+                    # Push in background on the shared push worker
+                    self.status_label.config(text=f"Pushing tag '{tag_name}' to GitHub...")
+                    self._push_queue.put(('origin', f'refs/tags/{tag_name}', pushed))
                 else:
                     messagebox.showinfo("Tag Created", f"Tag '{tag_name}' created successfully!\n\nNote: The tag is only local. Use 'Push Branch + Tags' to make it visible on GitHub.")
                 
-                self.refresh_all()
+                self._request_refresh()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to create tag: {str(e)}")
@@ -2500,10 +3646,7 @@ Inspired by Simple VCS version control system.
             return
         
         try:
-            tags = list(self.repo.tags)
-            if not tags:
-                messagebox.showwarning("No Tags", "No tags found in repository")
-                return
+            tags = {}  # Tag name -> commit sha, filled in once the background read finishes
             
             # Create tag selection window
             tag_window = tk.Toplevel(self.root)
@@ -2549,35 +3692,6 @@ Inspired by Simple VCS version control system.
             tag_scrollbar = ttk.Scrollbar(selection_frame, orient=tk.VERTICAL, command=tag_tree.yview)
             tag_tree.configure(yscrollcommand=tag_scrollbar.set)
             
-            # Populate tags (sorted by date, newest first)
-            sorted_tags = sorted(tags, key=lambda t: t.commit.committed_datetime, reverse=True)
-            
-            for tag in sorted_tags:
-                commit = tag.commit
-                
-                # Get tag message
-                tag_message = ""
-                try:
-                    if hasattr(tag, 'tag') and tag.tag and tag.tag.message:
-                        tag_message = tag.tag.message.strip()
-                        if len(tag_message) > 40:
-                            tag_message = tag_message[:40] + "..."
-                    else:
-                        commit_msg = commit.message.strip()
-                        if len(commit_msg) > 40:
-                            commit_msg = commit_msg[:40] + "..."
-                        tag_message = f"(commit: {commit_msg})"
-                except:
-                    tag_message = "No message"
-                
-                tag_tree.insert('', 'end', values=(
-                    tag.name,
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
-                    commit.author.name,
-                    tag_message
-                ))
-            
             tag_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             tag_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
@@ -2595,17 +3709,13 @@ Inspired by Simple VCS version control system.
                     selected_values = tag_tree.item(selection[0])['values']
                     tag_name = selected_values[0]
                     
-                    # Find the tag object
-                    selected_tag = None
-                    for tag in tags:
-                        if tag.name == tag_name:
-                            selected_tag = tag
-                            break
+                    # Find the tagged commit
+                    commit_sha = tags.get(str(tag_name))
                     
-                    if selected_tag:
-                        commit = selected_tag.commit
+                    if commit_sha:
+                        commit = self.repo.commit(commit_sha)
                         info_text = f"Tag: {tag_name} | Commit: {commit.hexsha[:12]} | "
-                        info_text += f"Date: {commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S')} | "
+                        info_text += f"Date: {format_commit_time(commit.committed_date, 'seconds', -commit.committer_tz_offset)} | "
                         info_text += f"Author: {commit.author.name}"
                         
                         # Add files changed count
@@ -2631,17 +3741,16 @@ Inspired by Simple VCS version control system.
                                          "You can return to a branch later using 'Switch Branch'."):
                         try:
                             self.repo.git.checkout(tag_name)
-                            self.refresh_all()
+                            self._request_refresh()
                             self.status_label.config(text=f"✓ Switched to tag: {tag_name} (HEAD detached)")
                             tag_window.destroy()
                             
                             # Update the branch label to show tag
-                            self.branch_label.config(text=f"Tag: {tag_name}", 
-                                                   foreground='#fd7e14')  # Orange for tag
+                            self.update_header({'branch_label': dict(text=f"Tag: {tag_name}",
+                                                                     foreground='#fd7e14')})  # Orange for tag
                             
-                            # Refresh graph if open
-                            if hasattr(self, 'graph_canvas'):
-                                self.draw_commit_graph(self.graph_canvas)
+                            # Move the HEAD marker if the graph is open
+                            self.update_graph_head()
                             
                             # Show success message
                             messagebox.showinfo("Success", f"Successfully switched to tag '{tag_name}'")
@@ -2668,16 +3777,71 @@ Inspired by Simple VCS version control system.
             # Double-click to switch
             tag_tree.bind('<Double-1>', lambda e: switch_to_selected_tag())
             
-            # Select first tag by default
-            if tag_tree.get_children():
+            def populate(result):
+                tag_commits, rows = result
+                if not tag_window.winfo_exists():
+                    return
+                if not rows:
+                    tag_window.destroy()
+                    messagebox.showwarning("No Tags", "No tags found in repository")
+                    return
+                
+                tags.update(tag_commits)
+                self.bulk_insert(tag_tree, [(values, ()) for values in rows])
+                
+                # Select first tag by default
                 first_item = tag_tree.get_children()[0]
                 tag_tree.selection_set(first_item)
                 tag_tree.see(first_item)
                 on_tag_select(None)
             
+            def tags_worker():
+                try:
+                    result = self._collect_tag_switch_rows()
+                except Exception as e:
+                    message = str(e)
+                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load tags: {message}"))
+                    return
+                self.root.after(0, populate, result)
+            
+            threading.Thread(target=tags_worker, daemon=True).start()
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load tags: {str(e)}")
     
+    def _collect_tag_switch_rows(self):
+        """Read ({tag name: commit sha}, tree rows newest first) for the switch-to-tag dialog"""
+        # %(contents:subject) is the tag message for annotated tags and the commit subject otherwise;
+        # the * fields are the peeled commit's and are empty for lightweight tags
+        output = self.git_output(
+            'for-each-ref', '--format=%(refname:lstrip=2)%09%(objectname)%09%(committerdate:unix)%09%(authorname)'
+            '%09%(*objectname)%09%(*committerdate:unix)%09%(*authorname)%09%(committerdate:format:%z)'
+            '%09%(*committerdate:format:%z)%09%(contents:subject)', 'refs/tags/')
+        
+        tags = []
+        for line in output.split('\n'):
+            if not line:
+                continue
+            (name, sha, date, author, peeled_sha, peeled_date, peeled_author,
+             tz, peeled_tz, subject) = line.split('\t', 9)
+            annotated = bool(peeled_sha)
+            if annotated:
+                sha, date, author, tz = peeled_sha, peeled_date, peeled_author, peeled_tz
+            tags.append((int(date or 0), name, sha, author, annotated, subject.strip(), parse_tz_offset(tz)))
+        
+        # Populate tags (sorted by date, newest first); annotated tags carry no committerdate of
+        # their own, so the sort uses the peeled dates here rather than for-each-ref's --sort
+        tags.sort(key=lambda tag: tag[0], reverse=True)
+        
+        rows = []
+        for date, name, sha, author, annotated, subject, tz in tags:
+            # Get tag message
+            if len(subject) > 40:
+                subject = subject[:40] + "..."
+            tag_message = subject if annotated else f"(commit: {subject})"
+            rows.append((name, sha[:8], format_commit_time(date, utc_offset=tz), author, tag_message))
+        return {name: sha for _, name, sha, _, _, _, _ in tags}, rows
+    
     def show_selected_tag_details(self, tag_tree):
         """Show detailed information about selected tag"""
         selection = tag_tree.selection()
@@ -2706,9 +3870,9 @@ Inspired by Simple VCS version control system.
         info_frame = ttk.LabelFrame(paned, text="Tag Information")
         paned.add(info_frame, weight=1)
         
+        # Resolve the tag once; the info pane and the file list both use this commit
         try:
-            tag = self.repo.tags[tag_name]
-            commit = tag.commit
+            commit = self.tag_commit(tag_name)
             
             ttk.Label(info_frame, text=f"Tag: {tag_name}").pack(anchor=tk.W, padx=5, pady=2)
             ttk.Label(info_frame, text=f"Commit: {commit.hexsha}").pack(anchor=tk.W, padx=5, pady=2)
@@ -2717,6 +3881,7 @@ Inspired by Simple VCS version control system.
             ttk.Label(info_frame, text=f"Message: {commit.message.strip()}").pack(anchor=tk.W, padx=5, pady=2)
         except Exception as e:
             ttk.Label(info_frame, text=f"Error: {str(e)}").pack(anchor=tk.W, padx=5, pady=2)
+            return
         
         # Bottom - files
         files_frame = ttk.LabelFrame(paned, text="Files Changed")
@@ -2743,41 +3908,151 @@ Inspired by Simple VCS version control system.
         files_tree.bind('<Button-3>', show_tag_file_menu)
         files_tree.bind('<Double-1>', lambda e: self.view_file_at_tag(files_tree, tag_name))
         
-        try:
-            tag = self.repo.tags[tag_name]
-            commit = tag.commit
-            
-            if commit.parents:
-                diffs = commit.parents[0].diff(commit)
-                for diff in diffs:
-                    status = 'Modified'
-                    if diff.new_file:
-                        status = 'Added'
-                    elif diff.deleted_file:
-                        status = 'Deleted'
-                    elif diff.renamed_file:
-                        status = 'Renamed'
-                    
-                    file_path = diff.b_path or diff.a_path
-                    
-                    try:
-                        if diff.diff:
-                            additions = diff.diff.decode('utf-8').count('\n+')
-                            deletions = diff.diff.decode('utf-8').count('\n-')
-                        else:
-                            additions = deletions = 0
-                    except:
-                        additions = deletions = 0
-                    
-                    files_tree.insert('', 'end', values=(file_path, status, additions, deletions))
-            else:
-                for item in commit.tree.traverse():
-                    if item.type == 'blob':
-                        files_tree.insert('', 'end', values=(item.path, 'Added', 0, 0))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to get tag files: {str(e)}")
+        # Rows are walked in the I/O pool, then inserted a page at a time as the user scrolls.
+        # Addition/deletion counts start as placeholders and are filled in for visible rows only.
+        rows = iter(())
+        scrollbar = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=files_tree.yview)
+        loading = {'pending': True, 'done': False}
+        row_ids = []
+        uncounted = {}  # iid -> (path, rename source or None) still showing placeholder counts
+        
+        def load_more(count=200):
+            loading['pending'] = False
+            try:
+                for _ in range(count):
+                    values, source = next(rows)
+                    iid = files_tree.insert('', 'end', values=values)
+                    row_ids.append(iid)
+                    if values[2] == '…':
+                        uncounted[iid] = (values[0], source)
+            except StopIteration:
+                loading['done'] = True
+            except tk.TclError:
+                loading['done'] = True  # Window closed
+        
+        def fill_counts(batch, future):
+            try:
+                counts = future.result()
+            except Exception:
+                counts = None
+            try:
+                for iid, (path, _) in batch.items():
+                    additions, deletions = counts.get(path, (0, 0)) if counts is not None else ('?', '?')
+                    files_tree.set(iid, 'Additions', additions)
+                    files_tree.set(iid, 'Deletions', deletions)
+            except tk.TclError:
+                pass  # Window closed
+        
+        def count_visible(first, last):
+            start = int(float(first) * len(row_ids))
+            end = int(float(last) * len(row_ids)) + 1
+            batch = {iid: uncounted.pop(iid) for iid in row_ids[start:end] if iid in uncounted}
+            if not batch:
+                return
+            parent_sha = commit.parents[0].hexsha
+            # A rename is only detected when both of its paths are in the pathspec
+            paths = [path for pair in batch.values() for path in pair if path]
+            self._io_pool.submit(self.get_numstat, parent_sha, commit.hexsha, paths).add_done_callback(
+                lambda future: self.root.after(0, fill_counts, batch, future))
+        
+        def rows_ready(future):
+            nonlocal rows
+            try:
+                rows = iter(future.result())
+            except Exception as e:
+                loading['done'] = True
+                messagebox.showerror("Error", f"Failed to get tag files: {str(e)}")
+                return
+            load_more()
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            count_visible(first, last)
+            if float(last) > 0.9 and not loading['done'] and not loading['pending']:
+                loading['pending'] = True
+                self.root.after(0, load_more)
         
+        files_tree.configure(yscrollcommand=on_scroll)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         files_tree.pack(fill=tk.BOTH, expand=True)
+        
+        self._io_pool.submit(lambda: list(self._tag_rows(commit.hexsha))).add_done_callback(
+            lambda future: self.root.after(0, rows_ready, future))
+    
+    def _tag_rows(self, sha):
+        """Yield ((path, status, additions, deletions), rename source or None) for the files changed in a tag's commit"""
+        # Runs in the I/O pool: plain git subprocesses only, never the shared self.repo
+        parents = commit_meta(self.repo_path, sha).parents
+        if parents:
+            # Metadata-only diff: no patch bytes are generated or held, counts come from --numstat
+            for status, file_path, source in self.get_name_status(parents[0], sha):
+                # Counts are filled in once the row scrolls into view
+                yield (file_path, status, '…', '…'), source
+        else:
+            # Root commit: list every file with one native ls-tree walk
+            paths = self.git_output('ls-tree', '-r', '--name-only', '-z', sha).split('\0')
+            for path in paths:
+                if path:
+                    yield (path, 'Added', 0, 0), None
+    
+    def get_numstat(self, old_sha, new_sha, paths=None):
+        """Return {path: (additions, deletions)} between two commits from one git diff --numstat"""
+        counts = {}
+        # Same rename detection as get_name_status, so both key a rename by its new path
+        args = ['diff', '--numstat', '-z', '--find-renames', old_sha, new_sha]
+        if paths:
+            # Literal, so a name like a[1].txt matches only itself
+            args = ['--literal-pathspecs', *args, '--', *paths]
+        fields = self.git_output(*args).split('\0')
+        i = 0
+        while i < len(fields):
+            entry = fields[i]
+            i += 1
+            if not entry:
+                continue
+            additions, deletions, path = entry.split('\t', 2)
+            if not path:
+                # Renames list the old and new paths as the next two fields
+                path = fields[i + 1]
+                i += 2
+            # Binary files report '-' for both counts
+            counts[path] = (int(additions) if additions != '-' else 0,
+                            int(deletions) if deletions != '-' else 0)
+        return counts
+    
+    def get_name_status(self, old_sha, new_sha):
+        """Return [(status, path, old path or None)] between two commits from one git diff --name-status"""
+        changes = []
+        fields = self.git_output('diff', '--name-status', '-z', '--find-renames', old_sha, new_sha).split('\0')
+        i = 0
+        while i < len(fields) - 1:
+            letter = fields[i][:1]
+            source = None
+            if letter in 'RC':
+                # Renames and copies list the old and new paths; show the new one
+                source, path = fields[i + 1], fields[i + 2]
+                i += 3
+            else:
+                path = fields[i + 1]
+                i += 2
+            changes.append((NAME_STATUS_LABELS.get(letter, 'Modified'), path, source))
+        return changes
+    
+    def get_log_numstat(self, path):
+        """Return {sha: (additions, deletions)} for each commit touching path from one git log --numstat"""
+        counts = {}
+        sha = None
+        for line in self.repo.git.log('--numstat', '--format=%x1e%H', '--', path).split('\n'):
+            if line.startswith('\x1e'):
+                sha = line[1:]
+                counts[sha] = (0, 0)
+            elif line and sha:
+                additions, deletions, _ = line.split('\t', 2)
+                total_add, total_del = counts[sha]
+                # Binary files report '-' for both counts
+                counts[sha] = (total_add + (int(additions) if additions != '-' else 0),
+                               total_del + (int(deletions) if deletions != '-' else 0))
+        return counts
     
     def view_file_at_tag(self, tree, tag_name):
         """View file at specific tag"""
@@ -2785,8 +4060,7 @@ Inspired by Simple VCS version control system.
         if selection:
             file_path = tree.item(selection[0])['values'][0]
             try:
-                tag = self.repo.tags[tag_name]
-                self.show_file_at_commit(file_path, tag.commit.hexsha)
+                self.show_file_at_commit(file_path, self.tag_commit(tag_name).hexsha)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to view file at tag: {str(e)}")
     
@@ -2795,38 +4069,167 @@ Inspired by Simple VCS version control system.
         try:
             commit = self.repo.commit(commit_hash)
             
-            file_window = tk.Toplevel(self.root)
-            file_window.title(f"File: {file_path} @ {commit_hash[:8]}")
-            file_window.geometry("1000x700")
-            
-            # Create text widget with scrollbar
-            text_frame = ttk.Frame(file_window)
-            text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            text_widget = tk.Text(text_frame, font=('Courier', 10), wrap=tk.NONE)
-            v_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
-            h_scrollbar = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL, command=text_widget.xview)
-            text_widget.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-            
-            text_widget.grid(row=0, column=0, sticky='nsew')
-            v_scrollbar.grid(row=0, column=1, sticky='ns')
-            h_scrollbar.grid(row=1, column=0, sticky='ew')
-            
-            text_frame.grid_rowconfigure(0, weight=1)
-            text_frame.grid_columnconfigure(0, weight=1)
-            
-            # Get file content
-            try:
-                file_content = commit.tree[file_path].data_stream.read().decode('utf-8')
-                text_widget.insert('1.0', file_content)
-            except:
-                text_widget.insert('1.0', f"Could not read file content (binary file or not found)")
+            file_window, text_widget = self._make_code_viewer(f"File: {file_path} @ {commit_hash[:8]}")
             
+            # Get file content (read in the I/O pool, streamed in chunks so large blobs don't block the UI)
             text_widget.config(state=tk.DISABLED)
+            self.fill_text_async(lambda: self._read_blob(commit, file_path), text_widget,
+                                 "Could not read file content (binary file or not found)")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show file at commit: {str(e)}")
     
+    def _make_code_viewer(self, title, geometry="1000x700"):
+        """Open a Toplevel holding a scrollable code text widget; returns (window, text)"""
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry(geometry)
+        
+        text_frame = ttk.Frame(window)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        return window, self._make_code_text(text_frame)
+    
+    def _make_code_text(self, parent, font=None):
+        """Grid a no-wrap code Text with both scrollbars into parent and return the Text"""
+        text_widget = tk.Text(parent, font=font or self._code_font_10, wrap=tk.NONE)
+        v_scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=text_widget.yview)
+        h_scrollbar = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=text_widget.xview)
+        text_widget.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        text_widget.grid(row=0, column=0, sticky='nsew')
+        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        h_scrollbar.grid(row=1, column=0, sticky='ew')
+        
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+        return text_widget
+    
+    def _read_blob(self, commit, file_path):
+        """Return the raw bytes of file_path at commit, cached by (sha, path)"""
+        key = (commit.hexsha, file_path)
+        with self._blob_lock:
+            data = self._blob_cache.get(key)
+            if data is not None:
+                self._blob_cache.move_to_end(key)
+                return data
+        if '\n' in file_path:
+            # cat-file --batch reads one object name per line
+            data = self.repo.git.show(f'{commit.hexsha}:{file_path}', stdout_as_string=False)
+        else:
+            data = self.git_batch().read(f'{commit.hexsha}:{file_path}')
+        with self._blob_lock:
+            self._blob_cache[key] = data
+            if len(self._blob_cache) > 128:
+                self._blob_cache.popitem(last=False)
+        return data
+    
+    def on_closing(self):
+        """Stop the long-lived git processes, then close the window"""
+        with self._git_batch_lock:
+            for client in self._git_batch.values():
+                client.close()
+            self._git_batch.clear()
+        if self.repo:
+            self.repo.close()  # GitPython's own persistent cat-file processes
+        self.root.destroy()
+    
+    def git_batch(self, mode='--batch'):
+        """Return the shared GitBatchClient for this repository, replacing it after a repo switch"""
+        with self._git_batch_lock:
+            client = self._git_batch.get(mode)
+            if client is None or client.repo_path != self.repo_path:
+                if client is not None:
+                    client.close()
+                client = self._git_batch[mode] = GitBatchClient(self.repo_path, mode)
+            return client
+    
+    def _read_working_file(self, path):
+        """Read a working-tree file as bytes with one stat and raw os.read calls"""
+        st = os.stat(path)
+        flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+        if hasattr(os, 'O_NOATIME') and os.geteuid() == st.st_uid:
+            flags |= os.O_NOATIME  # Skip the atime update on files we own
+        fd = os.open(path, flags)
+        try:
+            chunks = []
+            remaining = st.st_size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            return b''.join(chunks)
+        finally:
+            os.close(fd)
+    
+    def _set_text(self, text_widget, content):
+        """Replace the content of a read-only text widget"""
+        try:
+            text_widget.config(state=tk.NORMAL)
+            text_widget.delete('1.0', tk.END)
+            text_widget.insert('1.0', content)
+            text_widget.config(state=tk.DISABLED)
+        except tk.TclError:
+            pass  # Window was closed
+    
+    def fill_text_async(self, read, text_widget, error_message, binary_message=None):
+        """Run read() in the I/O pool and stream the returned bytes into text_widget"""
+        def done(future):
+            try:
+                data = future.result()
+            except Exception:
+                self.root.after(0, self._set_text, text_widget, error_message)
+            else:
+                self.root.after(0, self.stream_into_text, io.BytesIO(data), text_widget,
+                                binary_message or error_message)
+        
+        self._io_pool.submit(read).add_done_callback(done)
+    
+    def _read_chunks(self, stream, chunk_size=65536):
+        """Yield decoded text chunks from a byte stream, or None if it is binary"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        try:
+            chunk = stream.read(chunk_size)
+            if chunk.find(b'\x00', 0, 8192) >= 0:
+                yield None
+                return
+            while chunk:
+                yield decoder.decode(chunk)
+                chunk = stream.read(chunk_size)
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+        finally:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+    
+    def stream_into_text(self, stream, text_widget, binary_message):
+        """Fill a read-only text widget from a byte stream one chunk per idle tick"""
+        self.root.after_idle(self._pump_stream, self._read_chunks(stream), text_widget, binary_message)
+    
+    def _pump_stream(self, chunks, text_widget, binary_message):
+        """Insert the next chunk of a streamed file and reschedule until exhausted"""
+        try:
+            chunk = next(chunks, '')
+            if chunk is None:
+                self._set_text(text_widget, binary_message)
+                return
+            if not chunk:
+                return
+            text_widget.config(state=tk.NORMAL)
+            text_widget.insert(tk.END, chunk)
+            text_widget.config(state=tk.DISABLED)
+        except tk.TclError:
+            # Window was closed while the file was still loading
+            chunks.close()
+            return
+        except Exception:
+            self._set_text(text_widget, binary_message)
+            return
+        self.root.after_idle(self._pump_stream, chunks, text_widget, binary_message)
+    
     # Additional methods for comprehensive functionality
     def sort_files_by_column(self, column):
         """Sort files by column"""
@@ -2888,18 +4291,33 @@ Inspired by Simple VCS version control system.
             files_tree.heading(col, text=col)
             files_tree.column(col, width=200)
         
-        # Populate commits
-        try:
-            commits = list(self.repo.iter_commits(max_count=100))
-            for commit in commits:
-                commits_tree.insert('', 'end', values=(
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                    commit.author.name,
-                    commit.message.strip()
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to get commit history: {str(e)}")
+        # Populate commits: git log is streamed in a worker and handed to the tree 500 rows at a time
+        closed = threading.Event()
+        history_window.bind('<Destroy>', lambda e: closed.set() if e.widget is history_window else None)
+        
+        def add_page(page):
+            try:
+                for values in page:
+                    commits_tree.insert('', 'end', values=values)
+            except tk.TclError:
+                closed.set()  # Window closed
+        
+        def log_worker():
+            page = []
+            try:
+                for entry in self.iter_log('HEAD'):
+                    if closed.is_set():
+                        return
+                    page.append((entry.sha[:8], format_commit_time(entry.committed_date, 'seconds', entry.committer_tz),
+                                 entry.author, entry.subject))
+                    if len(page) == 500:
+                        self.root.after(0, add_page, page)
+                        page = []
+                self.root.after(0, add_page, page)
+            except Exception as e:
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Failed to get commit history: {str(e)}"))
+        
+        threading.Thread(target=log_worker, daemon=True).start()
         
         def on_commit_select(event):
             selection = commits_tree.selection()
@@ -2915,6 +4333,7 @@ Inspired by Simple VCS version control system.
                     
                     if commit.parents:
                         diffs = commit.parents[0].diff(commit)
+                        counts = self.get_numstat(commit.parents[0].hexsha, commit.hexsha)
                         for diff in diffs:
                             status = 'Modified'
                             if diff.new_file:
@@ -2926,10 +4345,8 @@ Inspired by Simple VCS version control system.
                             
                             file_path = diff.b_path or diff.a_path
                             
-                            try:
-                                changes = f"+{diff.diff.decode('utf-8').count(chr(10) + '+')} -{diff.diff.decode('utf-8').count(chr(10) + '-')}" if diff.diff else "0"
-                            except:
-                                changes = "0"
+                            additions, deletions = counts.get(file_path, (0, 0))
+                            changes = f"+{additions} -{deletions}" if additions or deletions else "0"
                             
                             files_tree.insert('', 'end', values=(file_path, status, changes))
                     else:
@@ -2985,6 +4402,10 @@ Inspired by Simple VCS version control system.
         canvas_frame.grid_rowconfigure(0, weight=1)
         canvas_frame.grid_columnconfigure(0, weight=1)
         
+        # Single click dispatchers for all commit boxes (see _item_to_commit)
+        canvas.bind("<Button-1>", self._on_graph_click)
+        canvas.bind("<Double-1>", self._on_graph_double_click)
+        
         # Store canvas reference for refresh
         self.graph_canvas = canvas
         self.graph_window = graph_window
@@ -2997,6 +4418,8 @@ Inspired by Simple VCS version control system.
         try:
             # Clear canvas
             canvas.delete("all")
+            self._item_to_commit = {}
+            self._graph_layout = {}
             
             # Get commits from all branches
             all_commits = {}
@@ -3036,9 +4459,13 @@ Inspired by Simple VCS version control system.
             
             # Assign colors to branches
             branch_colors = {}
-            colors = ['lightblue', 'lightgreen', 'lightcoral', 'lightyellow', 'lightpink', 'lightgray']
             for i, branch_name in enumerate(branch_commits.keys()):
-                branch_colors[branch_name] = colors[i % len(colors)]
+                branch_colors[branch_name] = GRAPH_BRANCH_COLORS[i % len(GRAPH_BRANCH_COLORS)]
+            
+            try:
+                head_sha = self.repo.head.commit.hexsha
+            except:
+                head_sha = None
             
             # Draw commits
             for i, commit_data in enumerate(sorted_commits):
@@ -3072,7 +4499,7 @@ Inspired by Simple VCS version control system.
                                  font=('Arial', 8), anchor='center')
                 
                 canvas.create_text(x + commit_width//2, y + 65, 
-                                 text=commit.committed_datetime.strftime('%Y-%m-%d %H:%M'), 
+                                 text=format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset), 
                                  font=('Arial', 7), anchor='center')
                 
                 # Branch info
@@ -3084,19 +4511,16 @@ Inspired by Simple VCS version control system.
                                  font=('Arial', 7), anchor='center')
                 
                 # Message (truncated)
-                message = commit.message.strip()[:25] + "..." if len(commit.message.strip()) > 25 else commit.message.strip()
+                message = commit.summary[:25] + "..." if len(commit.summary) > 25 else commit.summary
                 canvas.create_text(x + commit_width//2, y + 95, 
                                  text=message, 
                                  font=('Arial', 7), anchor='center')
                 
                 # Current HEAD indicator
-                try:
-                    if commit == self.repo.head.commit:
-                        canvas.create_text(x + commit_width//2, y + 110, 
-                                         text="← HEAD", 
-                                         font=('Arial', 8, 'bold'), fill='red', anchor='center')
-                except:
-                    pass
+                head_id = None
+                if commit.hexsha == head_sha:
+                    head_id = self._draw_graph_head(canvas, rect)
+                self._graph_layout[commit.hexsha] = (rect, head_id)
                 
                 # Draw connection line to next commit
                 if i < len(sorted_commits) - 1:
@@ -3104,11 +4528,8 @@ Inspired by Simple VCS version control system.
                                      x + commit_width + margin_x, y + commit_height//2,
                                      fill='green', width=3, arrow=tk.LAST)
                 
-                # Make clickable with commit operations
-                canvas.tag_bind(rect, "<Button-1>", 
-                               lambda e, c=commit: self.show_commit_operations(c))
-                canvas.tag_bind(rect, "<Double-1>", 
-                               lambda e, c=commit: self.checkout_commit(c.hexsha))
+                # Make clickable with commit operations (dispatched by _on_graph_click)
+                self._item_to_commit[rect] = commit
                 
                 # Store position for branch lines
                 commit_data['x'] = x + commit_width//2
@@ -3118,6 +4539,16 @@ Inspired by Simple VCS version control system.
             self.draw_branch_lines(canvas, branch_commits, sorted_commits, branch_colors, 
                                  commit_width, margin_x, branch_y_offset)
             
+            # Remember the layout so HEAD moves and new branches can be drawn in place
+            self._graph_geometry = {
+                'sorted_commits': sorted_commits,
+                'branch_colors': branch_colors,
+                'branch_rows': len(branch_commits),
+                'commit_width': commit_width,
+                'margin_x': margin_x,
+                'branch_y_offset': branch_y_offset,
+            }
+            
             # Update scroll region
             total_width = len(sorted_commits) * (commit_width + margin_x) + margin_x
             canvas.configure(scrollregion=(0, 0, total_width, commit_height + branch_y_offset + 100))
@@ -3126,12 +4557,89 @@ Inspired by Simple VCS version control system.
             messagebox.showerror("Error", f"Failed to create version graph: {str(e)}")
             canvas.create_text(200, 100, text=f"Error: {str(e)}", font=('Arial', 12), fill='red')
     
+    def _draw_graph_head(self, canvas, rect):
+        """Draw the HEAD marker under a commit box and return its item id"""
+        x1, y1, x2, y2 = canvas.coords(rect)
+        return canvas.create_text((x1 + x2) // 2, y1 + 110, 
+                                text="← HEAD", 
+                                font=('Arial', 8, 'bold'), fill='red', anchor='center')
+    
+    def _graph_is_open(self):
+        """Check whether the version graph window is still on screen"""
+        try:
+            return hasattr(self, 'graph_canvas') and self.graph_canvas.winfo_exists()
+        except tk.TclError:
+            return False
+    
+    def update_graph_head(self):
+        """Move the HEAD marker in the open graph, redrawing only for unknown commits"""
+        if not self._graph_is_open():
+            return
+        canvas = self.graph_canvas
+        try:
+            head_sha = self.repo.head.commit.hexsha
+        except:
+            head_sha = None
+        if head_sha not in self._graph_layout:
+            self.draw_commit_graph(canvas)
+            return
+        for sha, (rect, head_id) in self._graph_layout.items():
+            if head_id is not None:
+                canvas.delete(head_id)
+                self._graph_layout[sha] = (rect, None)
+        rect = self._graph_layout[head_sha][0]
+        self._graph_layout[head_sha] = (rect, self._draw_graph_head(canvas, rect))
+    
+    def add_graph_branch(self, branch_name):
+        """Draw the branch line for a newly created branch in the open graph"""
+        if not self._graph_is_open():
+            return
+        canvas = self.graph_canvas
+        geometry = getattr(self, '_graph_geometry', None)
+        try:
+            commits = list(self.repo.iter_commits(branch_name, max_count=30))
+        except:
+            return
+        if not geometry or any(c.hexsha not in self._graph_layout for c in commits):
+            self.draw_commit_graph(canvas)
+            return
+        row = geometry['branch_rows']
+        geometry['branch_colors'][branch_name] = GRAPH_BRANCH_COLORS[row % len(GRAPH_BRANCH_COLORS)]
+        self.draw_branch_lines(canvas, {branch_name: commits}, geometry['sorted_commits'],
+                             geometry['branch_colors'], geometry['commit_width'],
+                             geometry['margin_x'], geometry['branch_y_offset'], first_row=row)
+        geometry['branch_rows'] = row + 1
+        # The new row may sit below the old scroll area
+        canvas.configure(scrollregion=canvas.bbox('all'))
+    
+    def _graph_commit_at(self, event):
+        """Return the commit whose box lies under a graph canvas click"""
+        canvas = event.widget
+        x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+        for item in canvas.find_overlapping(x, y, x, y):
+            commit = self._item_to_commit.get(item)
+            if commit is not None:
+                return commit
+        return None
+    
+    def _on_graph_click(self, event):
+        """Open commit operations for the clicked commit box"""
+        commit = self._graph_commit_at(event)
+        if commit is not None:
+            self.show_commit_operations(commit)
+    
+    def _on_graph_double_click(self, event):
+        """Checkout the double-clicked commit box"""
+        commit = self._graph_commit_at(event)
+        if commit is not None:
+            self.checkout_commit(commit.hexsha)
+    
     def draw_branch_lines(self, canvas, branch_commits, sorted_commits, branch_colors, 
-                         commit_width, margin_x, branch_y_offset):
+                         commit_width, margin_x, branch_y_offset, first_row=0):
         """Draw branch lines below commits"""
         y_start = 200  # Below commits
         
-        for i, (branch_name, commits) in enumerate(branch_commits.items()):
+        for i, (branch_name, commits) in enumerate(branch_commits.items(), first_row):
             y_pos = y_start + i * 30
             color = branch_colors.get(branch_name, 'blue')
             
@@ -3174,7 +4682,7 @@ Inspired by Simple VCS version control system.
         ttk.Label(info_frame, text=f"Hash: {commit.hexsha[:8]}").pack(anchor=tk.W, padx=5, pady=2)
         ttk.Label(info_frame, text=f"Author: {commit.author.name}").pack(anchor=tk.W, padx=5, pady=2)
         ttk.Label(info_frame, text=f"Date: {commit.committed_datetime}").pack(anchor=tk.W, padx=5, pady=2)
-        ttk.Label(info_frame, text=f"Message: {commit.message.strip()}").pack(anchor=tk.W, padx=5, pady=2)
+        ttk.Label(info_frame, text=f"Message: {commit.summary}").pack(anchor=tk.W, padx=5, pady=2)
         
         # Operations
         ops_frame = ttk.LabelFrame(ops_window, text="Operations")
@@ -3200,12 +4708,11 @@ Inspired by Simple VCS version control system.
                               f"Checkout to commit {commit_hash[:8]}?\nThis will detach HEAD."):
             try:
                 self.repo.git.checkout(commit_hash)
-                self.refresh_all()
+                self._request_refresh()
                 self.status_label.config(text=f"Checked out to commit {commit_hash[:8]} (HEAD detached)")
                 
-                # Refresh graph if open
-                if hasattr(self, 'graph_canvas'):
-                    self.draw_commit_graph(self.graph_canvas)
+                # Move the HEAD marker if the graph is open
+                self.update_graph_head()
                     
             except Exception as e:
                 messagebox.showerror("Checkout Error", str(e))
@@ -3293,6 +4800,7 @@ Inspired by Simple VCS version control system.
         try:
             if commit.parents:
                 diffs = commit.parents[0].diff(commit)
+                counts = self.get_numstat(commit.parents[0].hexsha, commit.hexsha)
                 for diff in diffs:
                     status = 'Modified'
                     if diff.new_file:
@@ -3304,15 +4812,8 @@ Inspired by Simple VCS version control system.
                     
                     file_path = diff.b_path or diff.a_path
                     
-                    try:
-                        if diff.diff:
-                            additions = diff.diff.decode('utf-8').count('\n+')
-                            deletions = diff.diff.decode('utf-8').count('\n-')
-                            changes = f"+{additions} -{deletions}"
-                        else:
-                            changes = "Binary"
-                    except:
-                        changes = "Modified"
+                    additions, deletions = counts.get(file_path, (0, 0))
+                    changes = f"+{additions} -{deletions}"
                     
                     files_tree.insert('', 'end', values=(file_path, status, changes))
             else:
@@ -3450,7 +4951,7 @@ Inspired by Simple VCS version control system.
                 commits_tree.insert('', 'end', values=(
                     position,
                     commit.hexsha[:12],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                    format_commit_time(commit.committed_date, 'seconds', -commit.committer_tz_offset),
                     commit.author.name,
                     message
                 ), tags=tags)
@@ -3563,7 +5064,7 @@ Inspired by Simple VCS version control system.
             def show_success(msg):
                 edit_window.destroy()
                 messagebox.showinfo("Success", msg)
-                self.refresh_all()
+                self._request_refresh()
                 if hasattr(self, 'graph_canvas'):
                     self.draw_commit_graph(self.graph_canvas)
             
@@ -3676,7 +5177,7 @@ Inspired by Simple VCS version control system.
                 if messagebox.askyesno("Confirm", "Amend the last commit with new message?"):
                     self.repo.git.commit('--amend', '-m', new_message.strip())
                     messagebox.showinfo("Success", "HEAD commit message updated!")
-                    self.refresh_all()
+                    self._request_refresh()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to edit commit message: {str(e)}")
@@ -3741,9 +5242,11 @@ Inspired by Simple VCS version control system.
         if branch_name:
             try:
                 new_branch = self.repo.create_head(branch_name, commit)
+                self.add_graph_branch(branch_name)
                 if messagebox.askyesno("Switch Branch", f"Switch to new branch '{branch_name}'?"):
                     new_branch.checkout()
-                    self.refresh_all()
+                    self._request_refresh()
+                    self.update_graph_head()
                 
                 messagebox.showinfo("Success", f"Branch '{branch_name}' created from {commit.hexsha[:8]}")
                 parent_window.destroy()
@@ -3767,7 +5270,7 @@ Inspired by Simple VCS version control system.
                 else:
                     messagebox.showwarning("Warning", "Can only edit the last commit message safely")
                 
-                self.refresh_all()
+                self._request_refresh()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to edit commit message: {str(e)}")
     
@@ -3777,7 +5280,7 @@ Inspired by Simple VCS version control system.
             try:
                 self.repo.git.revert(commit.hexsha, '--no-edit')
                 messagebox.showinfo("Success", "Commit reverted")
-                self.refresh_all()
+                self._request_refresh()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to revert commit: {str(e)}")
     
@@ -3787,7 +5290,7 @@ Inspired by Simple VCS version control system.
             try:
                 self.repo.git.cherry_pick(commit.hexsha)
                 messagebox.showinfo("Success", "Commit cherry picked")
-                self.refresh_all()
+                self._request_refresh()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to cherry pick commit: {str(e)}")
     
@@ -3816,35 +5319,27 @@ Inspired by Simple VCS version control system.
             left_frame = ttk.LabelFrame(main_frame, text=f"Commit {commit.hexsha[:8]}")
             left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
             
-            left_text = tk.Text(left_frame, font=('Courier', 9), wrap=tk.NONE)
-            left_text.pack(fill=tk.BOTH, expand=True)
+            left_text = self._make_code_text(left_frame, self._code_font_9)
             
             # Right side - current version
             right_frame = ttk.LabelFrame(main_frame, text="Current Version")
             right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
             
-            right_text = tk.Text(right_frame, font=('Courier', 9), wrap=tk.NONE)
-            right_text.pack(fill=tk.BOTH, expand=True)
+            right_text = self._make_code_text(right_frame, self._code_font_9)
             
             try:
-                # Get commit version
-                try:
-                    commit_content = commit.tree[file_path].data_stream.read().decode('utf-8')
-                    left_text.insert('1.0', commit_content)
-                except:
-                    left_text.insert('1.0', "File not found in commit or binary file")
+                left_text.config(state=tk.DISABLED)
+                right_text.config(state=tk.DISABLED)
+                
+                # Get commit version (both sides are read in parallel in the I/O pool)
+                self.fill_text_async(lambda: self._read_blob(commit, file_path), left_text,
+                                     "File not found in commit or binary file")
                 
                 # Get current version
                 current_path = os.path.join(self.repo_path, file_path)
-                if os.path.exists(current_path):
-                    with open(current_path, 'r', encoding='utf-8') as f:
-                        current_content = f.read()
-                        right_text.insert('1.0', current_content)
-                else:
-                    right_text.insert('1.0', "File not found in current working directory")
-                
-                left_text.config(state=tk.DISABLED)
-                right_text.config(state=tk.DISABLED)
+                self.fill_text_async(lambda: self._read_working_file(current_path), right_text,
+                                     "File not found in current working directory",
+                                     "Binary file - cannot display")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to compare files: {str(e)}")
@@ -3939,7 +5434,7 @@ Inspired by Simple VCS version control system.
         """Draw vertical timeline from oldest to newest"""
         try:
             # Get all commits (reversed to show oldest first)
-            commits = list(reversed(list(self.repo.iter_commits(max_count=100))))
+            commits = list(reversed(list(self.iter_log('--max-count=100', 'HEAD'))))
             
             if not commits:
                 canvas.create_text(300, 100, text="No commits found", font=('Arial', 16), fill='red')
@@ -3957,21 +5452,24 @@ Inspired by Simple VCS version control system.
             branch_info = {}
             tag_info = {}
             
-            # Map commits to branches
+            # Map commits to branches (only the shown commits matter; rev-list is streamed, no objects built)
+            shown = {commit.sha for commit in commits}
             for branch in self.repo.branches:
                 try:
-                    for commit in self.repo.iter_commits(branch.name):
-                        if commit.hexsha not in branch_info:
-                            branch_info[commit.hexsha] = []
-                        branch_info[commit.hexsha].append(branch.name)
+                    for sha in self.stream_git(['rev-list', branch.name], sep='\n'):
+                        if sha in shown:
+                            branch_info.setdefault(sha, []).append(branch.name)
                 except:
                     continue
             
             # Map commits to tags
-            for tag in self.repo.tags:
-                if tag.commit.hexsha not in tag_info:
-                    tag_info[tag.commit.hexsha] = []
-                tag_info[tag.commit.hexsha].append(tag.name)
+            for tag_name, sha in self._tag_map.items():
+                tag_info.setdefault(sha, []).append(tag_name)
+            
+            try:
+                head_sha = self.repo.head.commit.hexsha
+            except:
+                head_sha = None
             
             # Draw timeline line
             canvas.create_line(50, margin, 50, total_height - margin, fill='blue', width=4)
@@ -3984,11 +5482,7 @@ Inspired by Simple VCS version control system.
                 canvas.create_oval(45, y + 55, 55, y + 65, fill='red', outline='darkred', width=2)
                 
                 # Draw commit box
-                is_head = False
-                try:
-                    is_head = (commit == self.repo.head.commit)
-                except:
-                    pass
+                is_head = commit.sha == head_sha
                 
                 box_color = 'lightgreen' if is_head else 'lightblue'
                 rect = canvas.create_rectangle(80, y + 10, 80 + item_width, y + 100, 
@@ -4000,28 +5494,28 @@ Inspired by Simple VCS version control system.
                                  font=('Arial', 10, 'bold'), anchor='w')
                 
                 # Hash
-                canvas.create_text(90, y + 40, text=f"Hash: {commit.hexsha[:12]}", 
+                canvas.create_text(90, y + 40, text=f"Hash: {commit.sha[:12]}", 
                                  font=('Arial', 9), anchor='w')
                 
                 # Author and date
-                canvas.create_text(90, y + 55, text=f"Author: {commit.author.name}", 
+                canvas.create_text(90, y + 55, text=f"Author: {commit.author}", 
                                  font=('Arial', 9), anchor='w')
-                canvas.create_text(90, y + 70, text=f"Date: {commit.committed_datetime.strftime('%Y-%m-%d %H:%M:%S')}", 
+                canvas.create_text(90, y + 70, text=f"Date: {format_commit_time(commit.committed_date, 'seconds', commit.committer_tz)}", 
                                  font=('Arial', 9), anchor='w')
                 
                 # Branches and tags
                 branch_text = ""
-                if commit.hexsha in branch_info:
-                    branches = branch_info[commit.hexsha][:3]  # Show max 3 branches
+                if commit.sha in branch_info:
+                    branches = branch_info[commit.sha][:3]  # Show max 3 branches
                     branch_text = f"Branches: {', '.join(branches)}"
-                    if len(branch_info[commit.hexsha]) > 3:
-                        branch_text += f" (+{len(branch_info[commit.hexsha]) - 3})"
+                    if len(branch_info[commit.sha]) > 3:
+                        branch_text += f" (+{len(branch_info[commit.sha]) - 3})"
                 
-                if commit.hexsha in tag_info:
-                    tags = tag_info[commit.hexsha][:2]  # Show max 2 tags
+                if commit.sha in tag_info:
+                    tags = tag_info[commit.sha][:2]  # Show max 2 tags
                     tag_text = f"Tags: {', '.join(tags)}"
-                    if len(tag_info[commit.hexsha]) > 2:
-                        tag_text += f" (+{len(tag_info[commit.hexsha]) - 2})"
+                    if len(tag_info[commit.sha]) > 2:
+                        tag_text += f" (+{len(tag_info[commit.sha]) - 2})"
                     branch_text += f" | {tag_text}" if branch_text else tag_text
                 
                 if branch_text:
@@ -4035,40 +5529,73 @@ Inspired by Simple VCS version control system.
                 
                 # Message (on hover or click)
                 canvas.tag_bind(rect, "<Button-1>", 
-                               lambda e, c=commit: self.show_timeline_commit_details(c))
+                               lambda e, sha=commit.sha: self.show_timeline_commit_details(self.repo.commit(sha)))
                 
                 # Store commit reference
-                canvas.create_text(90, y + 5, text="", tags=f"commit_{commit.hexsha}")
+                canvas.create_text(90, y + 5, text="", tags=f"commit_{commit.sha}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to draw timeline: {str(e)}")
             canvas.create_text(300, 100, text=f"Error: {str(e)}", font=('Arial', 12), fill='red')
 
+    def git_output(self, *args):
+        """Run one git command as its own process and return its decoded stdout; safe off the Tk thread"""
+        return subprocess.run(['git', '-C', self.repo_path, *args],
+                              capture_output=True, check=True).stdout.decode('utf-8', 'replace')
+    
+    def stream_git(self, args, sep='\0'):
+        """Yield sep-separated records from a git command while it is still running"""
+        proc = subprocess.Popen(['git', '-C', self.repo_path, *args],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        pending = ''
+        try:
+            while True:
+                chunk = proc.stdout.read1(4096)
+                if not chunk:
+                    break
+                pending += decoder.decode(chunk)
+                *records, pending = pending.split(sep)
+                yield from records
+            pending += decoder.decode(b'', final=True)
+            if pending:
+                yield pending
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, ['git', *args])
+        finally:
+            # Also reached when the caller stops early; don't leave git running
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+    
+    def iter_log(self, *revs):
+        """Stream LogEntry records from one `git log` process instead of building Commit objects"""
+        for record in self.stream_git(['log', '-z', '--format=%H%x1f%an%x1f%ct%x1f%ci%x1f%s', *revs]):
+            sha, author, date, iso_date, subject = record.split('\x1f', 4)
+            # %ci ends in the committer's +HHMM zone
+            yield LogEntry(sha.lstrip('\n'), author, int(date), subject, parse_tz_offset(iso_date[-5:]))
+    
     def show_timeline_commit_details(self, commit):
         """Show commit details in timeline right pane"""
         try:
             # Update details text
             self.timeline_details_text.delete('1.0', tk.END)
             
+            meta = commit_meta(self.repo_path, commit.hexsha)
             details = f"Commit: {commit.hexsha}\n"
-            details += f"Author: {commit.author.name} <{commit.author.email}>\n"
-            details += f"Date: {commit.committed_datetime}\n"
-            details += f"Message:\n{commit.message.strip()}\n\n"
+            details += f"Author: {meta.author_name} <{meta.author_email}>\n"
+            details += f"Date: {format_commit_time(meta.committed_date, 'seconds', meta.committer_tz)}\n"
+            details += f"Message:\n{meta.message}\n\n"
             
             # Add parent info
-            if commit.parents:
-                details += f"Parents: {', '.join([p.hexsha[:8] for p in commit.parents])}\n"
+            if meta.parents:
+                details += f"Parents: {', '.join([p[:8] for p in meta.parents])}\n"
             else:
                 details += "Parents: None (initial commit)\n"
             
             # Add branch/tag info
-            branch_info = []
-            for branch in self.repo.branches:
-                try:
-                    if commit in list(self.repo.iter_commits(branch.name)):
-                        branch_info.append(branch.name)
-                except:
-                    continue
+            branch_info = self.branches_containing(commit.hexsha)
             
             if branch_info:
                 details += f"Branches: {', '.join(branch_info)}\n"
@@ -4089,6 +5616,7 @@ Inspired by Simple VCS version control system.
             
             if commit.parents:
                 diffs = commit.parents[0].diff(commit)
+                counts = self.get_numstat(commit.parents[0].hexsha, commit.hexsha)
                 for diff in diffs:
                     status = 'Modified'
                     if diff.new_file:
@@ -4100,15 +5628,8 @@ Inspired by Simple VCS version control system.
                     
                     file_path = diff.b_path or diff.a_path
                     
-                    try:
-                        if diff.diff:
-                            additions = diff.diff.decode('utf-8').count('\n+')
-                            deletions = diff.diff.decode('utf-8').count('\n-')
-                            changes = f"+{additions} -{deletions}"
-                        else:
-                            changes = "Binary"
-                    except:
-                        changes = "Modified"
+                    additions, deletions = counts.get(file_path, (0, 0))
+                    changes = f"+{additions} -{deletions}"
                     
                     self.timeline_files_tree.insert('', 'end', values=(file_path, status, changes))
             else:
@@ -4203,7 +5724,7 @@ Inspired by Simple VCS version control system.
                     is_current,
                     commit.hexsha[:8],
                     commit.author.name,
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M')
+                    format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset)
                 ))
             
             # Remote branches
@@ -4217,30 +5738,26 @@ Inspired by Simple VCS version control system.
                             "origin",
                             commit.hexsha[:8],
                             commit.author.name,
-                            commit.committed_datetime.strftime('%Y-%m-%d %H:%M')
+                            format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset)
                         ))
             except:
                 pass
             
-            # Tags
-            for tag in self.repo.tags:
-                commit = tag.commit
-                tag_type = "Annotated" if hasattr(tag, 'tag') and tag.tag else "Lightweight"
-                message = ""
-                try:
-                    if hasattr(tag, 'tag') and tag.tag and tag.tag.message:
-                        message = tag.tag.message.strip()[:50]
-                    else:
-                        message = commit.message.strip()[:50]
-                except:
-                    message = "No message"
+            # Tags: type and messages come from the list_tags() snapshot, not per-tag object reads
+            self.tag_rows()
+            for tag_name in sorted(self._tag_meta):
+                meta = self._tag_meta[tag_name]
+                if not meta.sha:
+                    tags_overview_tree.insert('', 'end', values=(tag_name, "Error", "N/A", "N/A", "N/A", "N/A"))
+                    continue
+                message = (meta.message or meta.commit_subject)[:50]
                 
                 tags_overview_tree.insert('', 'end', values=(
-                    tag.name,
-                    tag_type,
-                    commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
-                    commit.author.name,
+                    tag_name,
+                    TAG_TYPE_LABELS[meta.annotated],
+                    meta.sha[:8],
+                    format_commit_time(meta.committed_date, utc_offset=meta.committer_tz),
+                    meta.author,
                     message
                 ))
             
@@ -4289,13 +5806,13 @@ Inspired by Simple VCS version control system.
         
         # Populate commits
         for commit in commits:
-            message = commit.message.strip()[:50]
-            if len(commit.message.strip()) > 50:
+            message = commit.summary[:50]
+            if len(commit.summary) > 50:
                 message += "..."
             
             commits_tree.insert('', 'end', values=(
                 commit.hexsha[:8],
-                commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
+                format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset),
                 commit.author.name,
                 message
             ))
@@ -4392,13 +5909,13 @@ Inspired by Simple VCS version control system.
         
         # Populate commits
         for commit in commits:
-            message = commit.message.strip()[:50]
-            if len(commit.message.strip()) > 50:
+            message = commit.summary[:50]
+            if len(commit.summary) > 50:
                 message += "..."
             
             commits_tree.insert('', 'end', values=(
                 commit.hexsha[:8],
-                commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
+                format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset),
                 commit.author.name,
                 message
             ))
@@ -4454,7 +5971,11 @@ Inspired by Simple VCS version control system.
             messagebox.showwarning("Not a File", "Please select a file, not a directory")
             return
         
-        rel_path = os.path.relpath(file_path, self.repo_path)
+        # folder_path always lives under repo_path, so slice instead of os.path.relpath
+        if len(folder_path) < self._repo_prefix_len:
+            rel_path = file_name
+        else:
+            rel_path = folder_path[self._repo_prefix_len:].replace(os.sep, '/') + '/' + file_name
         
         # Get commits that contain this file
         try:
@@ -4508,14 +6029,14 @@ Inspired by Simple VCS version control system.
         # Populate commits
         for i, commit in enumerate(commits):
             version_num = len(commits) - i
-            message = commit.message.strip()[:50]
-            if len(commit.message.strip()) > 50:
+            message = commit.summary[:50]
+            if len(commit.summary) > 50:
                 message += "..."
             
             commits_tree.insert('', 'end', values=(
                 version_num,
                 commit.hexsha[:8],
-                commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
+                format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset),
                 commit.author.name,
                 message
             ))
@@ -4535,16 +6056,15 @@ Inspired by Simple VCS version control system.
                         for commit in commits:
                             if commit.hexsha.startswith(commit_hash):
                                 # Get file content at this commit
-                                file_content = commit.tree[rel_path].data_stream.read()
+                                file_content = self._read_blob(commit, rel_path)
                                 
                                 # Write to working directory
-                                with open(file_path, 'wb') as f:
-                                    f.write(file_content)
+                                self.write_file_atomic(file_path, file_content)
                                 
                                 messagebox.showinfo("Success", 
                                                 f"{file_name} reverted to version {version_num}")
                                 revert_window.destroy()
-                                self.refresh_all()
+                                self._refresh_file(rel_path)
                                 break
                     except Exception as e:
                         messagebox.showerror("Error", f"Failed to revert file: {str(e)}")
@@ -4568,6 +6088,26 @@ Inspired by Simple VCS version control system.
             commits_tree.selection_set(first_item)
             commits_tree.see(first_item)
 
+    def write_file_atomic(self, path, data):
+        """Replace a working-tree file through a temp file so a failed write never truncates it"""
+        # A unique name in the same directory, so concurrent writers never share it and os.replace stays atomic
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.revtmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            try:
+                shutil.copymode(path, tmp_path)
+            except OSError:
+                os.chmod(tmp_path, 0o644)  # File was deleted; mkstemp's 0600 would hide it from others
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Don't leave the temp file behind when the write or rename fails
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def show_file_blame(self):
         """Show file blame/annotation"""
         selection = self.file_tree.selection()
@@ -4787,7 +6327,7 @@ Inspired by Simple VCS version control system.
         ttk.Label(right_frame, text="File Content at Selected Version", font=('TkDefaultFont', 10, 'bold')).pack(pady=5)
         
         # File content text
-        content_text = tk.Text(right_frame, wrap=tk.NONE, font=('Courier', 10))
+        content_text = tk.Text(right_frame, wrap=tk.NONE, font=self._code_font_10)
         content_v_scroll = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=content_text.yview)
         content_h_scroll = ttk.Scrollbar(right_frame, orient=tk.HORIZONTAL, command=content_text.xview)
         content_text.configure(yscrollcommand=content_v_scroll.set, xscrollcommand=content_h_scroll.set)
@@ -4808,6 +6348,12 @@ Inspired by Simple VCS version control system.
                 timeline_window.destroy()
                 return
             
+            # Line counts for every version from one git log --numstat; no per-commit diffs
+            try:
+                counts = self.get_log_numstat(rel_path)
+            except:
+                counts = {}
+            
             # Populate timeline
             for i, commit in enumerate(commits):
                 version_num = len(commits) - i
@@ -4815,22 +6361,18 @@ Inspired by Simple VCS version control system.
                 # Get changes info
                 changes_info = "Initial"
                 if commit.parents:
-                    try:
-                        diffs = commit.parents[0].diff(commit, paths=rel_path)
-                        if diffs and diffs[0].diff:
-                            diff_text = diffs[0].diff.decode('utf-8', errors='replace')
-                            additions = diff_text.count('\n+')
-                            deletions = diff_text.count('\n-')
-                            changes_info = f"+{additions} -{deletions}"
-                    except:
+                    if commit.hexsha in counts:
+                        additions, deletions = counts[commit.hexsha]
+                        changes_info = f"+{additions} -{deletions}"
+                    else:
                         changes_info = "Modified"
                 
                 timeline_tree.insert('', 'end', values=(
                     version_num,
                     commit.hexsha[:8],
-                    commit.committed_datetime.strftime('%Y-%m-%d %H:%M'),
+                    format_commit_time(commit.committed_date, utc_offset=-commit.committer_tz_offset),
                     commit.author.name,
-                    commit.message.strip()[:40] + ("..." if len(commit.message.strip()) > 40 else ""),
+                    commit.summary[:40] + ("..." if len(commit.summary) > 40 else ""),
                     changes_info
                 ))
             
@@ -4846,12 +6388,13 @@ Inspired by Simple VCS version control system.
                         if commit.hexsha.startswith(commit_hash):
                             content_text.delete('1.0', tk.END)
                             
+                            # Get file content at this commit
                             try:
-                                # Get file content at this commit
-                                file_content = commit.tree[rel_path].data_stream.read().decode('utf-8', errors='replace')
-                                content_text.insert('1.0', file_content)
-                            except:
-                                content_text.insert('1.0', "Could not read file content (binary file or file not found)")
+                                file_content = decode_or_binary(self._read_blob(commit, rel_path))
+                            except KeyError:
+                                file_content = None
+                            content_text.insert('1.0', file_content if file_content is not None
+                                                else "Could not read file content (binary file or file not found)")
                             break
             
             timeline_tree.bind('<<TreeviewSelect>>', on_timeline_select)
@@ -4945,7 +6488,7 @@ Inspired by Simple VCS version control system.
             
             if self.rename_tag(old_name, new_name):
                 rename_window.destroy()
-                self.refresh_all()
+                self._request_refresh()
         
         # Buttons
         button_frame = ttk.Frame(rename_window)
@@ -5004,6 +6547,8 @@ Inspired by Simple VCS version control system.
             
             # Delete old tag
             self.repo.delete_tag(old_tag_name)
+            self._tag_map.pop(old_tag_name, None)
+            self.invalidate_tag_rows()
             
             # Ask about remote operations
             if messagebox.askyesno("Remote Operations", 
@@ -5016,6 +6561,7 @@ Inspired by Simple VCS version control system.
                     self.repo.git.push('origin', f':refs/tags/{old_tag_name}')
                     # Push new tag to remote
                     self.repo.git.push('origin', new_tag_name)
+                    self.invalidate_remote_tags()
                     messagebox.showinfo("Success", f"Tag renamed from '{old_tag_name}' to '{new_tag_name}' and updated on remote")
                 except Exception as e:
                     messagebox.showwarning("Remote Update Failed", 
@@ -5082,15 +6628,14 @@ Inspired by Simple VCS version control system.
                     for commit in commits:
                         if commit.hexsha.startswith(commit_hash):
                             # Get file content at this commit
-                            file_content = commit.tree[rel_path].data_stream.read()
+                            file_content = self._read_blob(commit, rel_path)
                             
                             # Write to working directory
                             full_path = os.path.join(self.repo_path, rel_path)
-                            with open(full_path, 'wb') as f:
-                                f.write(file_content)
+                            self.write_file_atomic(full_path, file_content)
                             
                             messagebox.showinfo("Success", f"File reverted to version {version_num}")
-                            self.refresh_all()
+                            self._refresh_file(rel_path)
                             break
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to revert file: {str(e)}")
@@ -5110,49 +6655,30 @@ Inspired by Simple VCS version control system.
         left_frame = ttk.LabelFrame(paned, text=f"Version at {commit.hexsha[:8]}")
         paned.add(left_frame, weight=1)
         
-        left_text = tk.Text(left_frame, font=('Courier', 9), wrap=tk.NONE)
-        left_v_scroll = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=left_text.yview)
-        left_h_scroll = ttk.Scrollbar(left_frame, orient=tk.HORIZONTAL, command=left_text.xview)
-        left_text.configure(yscrollcommand=left_v_scroll.set, xscrollcommand=left_h_scroll.set)
-        
-        left_text.grid(row=0, column=0, sticky='nsew')
-        left_v_scroll.grid(row=0, column=1, sticky='ns')
-        left_h_scroll.grid(row=1, column=0, sticky='ew')
-        
-        left_frame.grid_rowconfigure(0, weight=1)
-        left_frame.grid_columnconfigure(0, weight=1)
+        left_text = self._make_code_text(left_frame, self._code_font_9)
         
         # Right side - current version
         right_frame = ttk.LabelFrame(paned, text="Current Version")
         paned.add(right_frame, weight=1)
         
-        right_text = tk.Text(right_frame, font=('Courier', 9), wrap=tk.NONE)
-        right_v_scroll = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=right_text.yview)
-        right_h_scroll = ttk.Scrollbar(right_frame, orient=tk.HORIZONTAL, command=right_text.xview)
-        right_text.configure(yscrollcommand=right_v_scroll.set, xscrollcommand=right_h_scroll.set)
-        
-        right_text.grid(row=0, column=0, sticky='nsew')
-        right_v_scroll.grid(row=0, column=1, sticky='ns')
-        right_h_scroll.grid(row=1, column=0, sticky='ew')
-        
-        right_frame.grid_rowconfigure(0, weight=1)
-        right_frame.grid_columnconfigure(0, weight=1)
+        right_text = self._make_code_text(right_frame, self._code_font_9)
         
         try:
             # Get commit version
             try:
-                commit_content = commit.tree[rel_path].data_stream.read().decode('utf-8', errors='replace')
-                left_text.insert('1.0', commit_content)
-            except:
-                left_text.insert('1.0', "Could not read file content (binary file or file not found)")
+                commit_content = decode_or_binary(self._read_blob(commit, rel_path))
+            except KeyError:
+                commit_content = None
+            left_text.insert('1.0', commit_content if commit_content is not None
+                             else "Could not read file content (binary file or file not found)")
             
             # Get current version
             current_path = os.path.join(self.repo_path, rel_path)
-            if os.path.exists(current_path):
-                with open(current_path, 'r', encoding='utf-8', errors='replace') as f:
-                    current_content = f.read()
-                    right_text.insert('1.0', current_content)
-            else:
+            try:
+                current_content = decode_or_binary(Path(current_path).read_bytes())
+                right_text.insert('1.0', current_content if current_content is not None
+                                  else "Binary file - cannot display")
+            except FileNotFoundError:
                 right_text.insert('1.0', "File not found in current working directory")
             
             left_text.config(state=tk.DISABLED)
@@ -5215,7 +6741,7 @@ Inspired by Simple VCS version control system.
                 # HEAD commit - use amend
                 self.repo.git.commit('--amend', '-m', new_message)
                 self.root.after(0, lambda: messagebox.showinfo("Success", "HEAD commit message updated!"))
-                self.root.after(0, self.refresh_all)
+                self.root.after(0, self._request_refresh)
                 return True
                 
             elif position == 1:
@@ -5239,7 +6765,7 @@ Inspired by Simple VCS version control system.
                             self.repo.git.cherry_pick(original_head)
                             
                             self.root.after(0, lambda: messagebox.showinfo("Success", "Commit message updated using reset method!"))
-                            self.root.after(0, self.refresh_all)
+                            self.root.after(0, self._request_refresh)
                             return True
                         
                     except Exception as e:
@@ -5303,7 +6829,7 @@ fi
                 
                 self.root.after(0, lambda: messagebox.showinfo("Success", 
                     "Commit message updated using filter-branch!"))
-                self.root.after(0, self.refresh_all)
+                self.root.after(0, self._request_refresh)
                 return True
             else:
                 # Keep backup branch for safety
@@ -5427,7 +6953,7 @@ fi
                 progress_window.destroy()
                 messagebox.showinfo("Success", 
                     "Commit message updated successfully!\n\nGit history has been rewritten.")
-                self.refresh_all()
+                self._request_refresh()
                 if hasattr(self, 'graph_canvas'):
                     self.draw_commit_graph(self.graph_canvas)
             
@@ -5473,7 +6999,7 @@ fi
         info_frame = ttk.LabelFrame(recovery_window, text="Error Details")
         info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        error_text = tk.Text(info_frame, height=8, wrap=tk.WORD, font=('Courier', 9))
+        error_text = tk.Text(info_frame, height=8, wrap=tk.WORD, font=self._code_font_9)
         error_scroll = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, command=error_text.yview)
         error_text.configure(yscrollcommand=error_scroll.set)
         
@@ -5512,7 +7038,7 @@ fi
                     recovery_window.destroy()
                     messagebox.showinfo("Rebase Aborted", 
                         "Rebase has been aborted. Repository is back to original state.")
-                    self.refresh_all()
+                    self._request_refresh()
                 else:
                     messagebox.showerror("Abort Failed", f"Failed to abort rebase: {result.stderr}")
                     
@@ -5528,7 +7054,7 @@ fi
                     recovery_window.destroy()
                     messagebox.showinfo("Rebase Continued", 
                         "Rebase completed successfully!")
-                    self.refresh_all()
+                    self._request_refresh()
                 else:
                     messagebox.showerror("Continue Failed", 
                         f"Failed to continue rebase: {result.stderr}\n\n" +
@@ -5662,7 +7188,7 @@ fi
                         self.repo.git.commit('--amend', '-m', new_message)
                         edit_dialog.destroy()
                         messagebox.showinfo("Success", "HEAD commit message updated!")
-                        self.refresh_all()
+                        self._request_refresh()
                     except Exception as e:
                         messagebox.showerror("Error", f"Failed to update message: {str(e)}")
                 else:
@@ -5686,91 +7212,118 @@ fi
     
     def populate_file_list_enhanced(self, folder_path):
         """Enhanced file list with better row highlighting"""
-        # Clear existing items
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
-        
         if not os.path.exists(folder_path):
+            self.recycle_file_rows([])
             return
         
         try:
-            for item in sorted(os.listdir(folder_path)):
-                if item.startswith('.'):
+            # Cheap listing first: if nothing the rows depend on has changed, keep the current rows
+            listing = []
+            for entry, _ in visible_entries(folder_path):
+                try:
+                    st = entry.stat()
+                except OSError:
                     continue
-                
-                item_path = os.path.join(folder_path, item)
-                
+                listing.append((entry.name, entry.path, st))
+            
+            try:
+                head_sha = self.repo.head.commit.hexsha
+            except Exception:
+                head_sha = None
+            prefix = os.path.join(folder_path, '')
+            key = (folder_path, head_sha,
+                   tuple((item, st.st_mode, st.st_size, st.st_mtime_ns) for item, _, st in listing),
+                   tuple(sorted((path, status) for path, status in self.file_status_cache.items()
+                                if path.startswith(prefix))))
+            if self._tree_rows.get(str(self.file_tree)) == key:
+                return
+            
+            rows = []
+            highlighted = []
+            for item, item_path, st in listing:
                 # Get file status
                 file_status = self.file_status_cache.get(item_path, 'CLEAN')
                 
                 # Get file info
-                if os.path.isfile(item_path):
-                    size = os.path.getsize(item_path)
-                    size_str = self.format_file_size(size)
-                    modified = datetime.fromtimestamp(os.path.getmtime(item_path)).strftime('%Y-%m-%d %H:%M')
+                if stat.S_ISREG(st.st_mode):
+                    size_str = self.format_file_size(st.st_size)
+                    modified = format_commit_time(st.st_mtime)
                     
-                    # Get Git info
-                    branch_info, commit_info, version_info, author_info, commit_date = self.get_git_file_info(item_path)
+                    # Get Git info; an untracked file has no history to look up
+                    if file_status == 'NEW':
+                        branch_info, commit_info, version_info, author_info, commit_date = (
+                            self.current_branch or "main", "New", "0", "", "")
+                    else:
+                        branch_info, commit_info, version_info, author_info, commit_date = self.get_git_file_info(item_path, head_sha)
                     
-                    # Choose icon based on file type and status
-                    icon = self.get_file_icon(item_path, file_status)
+                    # File type glyph as text, status as a prebuilt badge image
+                    icon = self.get_file_icon(item_path, 'CLEAN', is_dir=False, mtime_ns=st.st_mtime_ns)
                     
                     # Enhanced row highlighting based on file status
-                    if file_status == 'NEW':
-                        tags = ('new_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'MODIFIED':
-                        tags = ('modified_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'STAGED':
-                        tags = ('staged_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'MODIFIED_STAGED':
-                        tags = ('modified_staged_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'DELETED':
-                        tags = ('deleted_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'RENAMED':
-                        tags = ('renamed_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'COPIED':
-                        tags = ('copied_file',)
-                        self.highlighted_files.add(item_path)
-                    elif file_status == 'CONFLICTED':
-                        tags = ('conflicted_file',)
-                        self.highlighted_files.add(item_path)
-                    else:
-                        tags = ('clean_file',)
+                    tags = self.get_file_status_tags(file_status)
+                    if tags != ('clean_file',):
+                        highlighted.append((item, item_path))
                     
-                    file_item = self.file_tree.insert('', 'end', text=icon, 
-                                        values=(item, 'File', size_str, modified, branch_info, version_info, author_info, commit_info, commit_date),
-                                        tags=tags)
+                    rows.append(('', item, icon, (item, 'File', size_str, modified, branch_info, version_info, author_info, commit_info, commit_date),
+                                 tags, self.status_images.get(file_status, self.status_images['CLEAN'])))
                     
-                elif os.path.isdir(item_path):
-                    folder_icon = self.get_folder_status(item_path)
+                elif stat.S_ISDIR(st.st_mode):
                     folder_status = self.get_folder_git_status(item_path)
+                    tags = FOLDER_ROW_TAGS[folder_status]
                     
-                    if folder_status == 'MODIFIED':
-                        tags = ('modified_folder',)
-                    elif folder_status == 'NEW':
-                        tags = ('new_folder',)
-                    elif folder_status == 'STAGED':
-                        tags = ('staged_folder',)
-                    else:
-                        tags = ('clean_folder',)
-                    
-                    self.file_tree.insert('', 'end', text=folder_icon, 
-                                        values=(item, 'Folder', '', '', '', '', '', '', ''),
-                                        tags=tags)
+                    rows.append(('', item, '📁', (item, 'Folder', '', '', '', '', '', '', ''), tags,
+                                 self.status_images.get(folder_status, self.status_images['CLEAN'])))
             
-            # Configure enhanced tag colors with better contrast
-            self.configure_file_tree_colors()
+            self.recycle_file_rows(rows, key, folder_path)
+            # Row items are reused across folders, so earlier highlights no longer name these rows
+            self.highlighted_files = {self._file_row_iids[item]: item_path for item, item_path in highlighted}
             
         except PermissionError:
             self.status_label.config(text="Permission denied accessing folder")
 
 
+    def get_file_status_tags(self, file_status):
+        """Return the file_tree row tags for a file status"""
+        return FILE_ROW_TAGS.get(file_status, FILE_ROW_TAGS['CLEAN'])
+    
+    def _refresh_file(self, rel_path):
+        """Update one file's status, its file list row and the changes view after a single-file edit"""
+        full_path = os.path.join(self.repo_path, rel_path)
+        try:
+            entries = self.read_status(self.repo_path, include_untracked=False, paths=[rel_path])['entries']
+        except Exception as e:
+            self.status_label.config(text=f"Error updating status: {str(e)}")
+            return
+        
+        file_status = self.classify_status_code(entries[0][0]) if entries else None
+        self._folder_status = None
+        if file_status:
+            self.file_status_cache[full_path] = file_status
+        else:
+            self.file_status_cache.pop(full_path, None)
+            file_status = 'CLEAN'
+        
+        # Update the row in place if the file's folder is the one being shown
+        tree_selection = self.repo_tree.selection()
+        values = self.repo_tree.item(tree_selection[0])['values'] if tree_selection else None
+        if values and os.path.normpath(str(values[0])) == os.path.dirname(os.path.normpath(full_path)):
+            file_name = os.path.basename(full_path)
+            iid = self._file_row_iids.get(file_name)
+            row = self.file_tree.item(iid, 'values') if iid and self.file_tree.exists(iid) else None
+            if row:
+                st = os.stat(full_path)
+                row = list(row)
+                row[2] = self.format_file_size(st.st_size)
+                row[3] = format_commit_time(st.st_mtime)
+                tags = self.get_file_status_tags(file_status)
+                if tags != ('clean_file',):
+                    self.highlighted_files[iid] = full_path
+                self.file_tree.item(iid, values=row, tags=tags,
+                                    image=self.status_images.get(file_status, self.status_images['CLEAN']))
+                self.mark_row_stale(self.file_tree, iid)
+        
+        self.populate_changes()
+    
     def configure_file_tree_colors(self):
         """Configure enhanced color scheme for file tree"""
         # File status colors with better visibility
@@ -5823,24 +7376,13 @@ fi
 
     def get_folder_git_status(self, folder_path):
         """Get Git status for folder"""
-        has_new = False
-        has_modified = False
-        has_staged = False
-        
-        for file_path, status in self.file_status_cache.items():
-            if file_path.startswith(folder_path):
-                if status == 'NEW':
-                    has_new = True
-                elif status == 'MODIFIED':
-                    has_modified = True
-                elif status in ['STAGED', 'MODIFIED_STAGED']:
-                    has_staged = True
-        
-        if has_staged:
+        bits = self.folder_status_bits().get(folder_path.rstrip(os.sep), 0)
+        
+        if bits & STATUS_STAGED:
             return 'STAGED'
-        elif has_modified:
+        elif bits & STATUS_MODIFIED:
             return 'MODIFIED'
-        elif has_new:
+        elif bits & STATUS_NEW:
             return 'NEW'
         else:
             return 'CLEAN'
@@ -5852,44 +7394,34 @@ fi
             return
         
         self.file_status_cache = {}
+        self._folder_status = None
         
         try:
-            # Get repository status
-            status_output = self.repo.git.status('--porcelain')
-            
-            for line in status_output.split('\n'):
-                if not line.strip():
-                    continue
-                
-                status_code = line[:2]
-                file_path = line[3:]
+            # One porcelain status call instead of GitPython's per-file walk
+            for status_code, file_path in self.read_status(self.repo_path)['entries']:
                 full_path = os.path.join(self.repo_path, file_path)
                 
-                # Enhanced status detection
-                if status_code == 'UU':  # Both modified (merge conflict)
-                    self.file_status_cache[full_path] = 'CONFLICTED'
-                elif status_code == 'AA':  # Both added (merge conflict)
-                    self.file_status_cache[full_path] = 'CONFLICTED'
-                elif status_code == 'DD':  # Both deleted (merge conflict)
-                    self.file_status_cache[full_path] = 'CONFLICTED'
-                elif status_code[0] in ['M', 'A', 'D', 'R', 'C']:
-                    if status_code[1] in ['M', 'D']:
-                        self.file_status_cache[full_path] = 'MODIFIED_STAGED'
-                    else:
-                        self.file_status_cache[full_path] = 'STAGED'
-                elif status_code[1] in ['M', 'D']:
-                    self.file_status_cache[full_path] = 'MODIFIED'
-                elif status_code[1] == '?':
-                    self.file_status_cache[full_path] = 'NEW'
-                elif status_code[0] == 'R':
-                    self.file_status_cache[full_path] = 'RENAMED'
-                elif status_code[0] == 'C':
-                    self.file_status_cache[full_path] = 'COPIED'
-                elif status_code[0] == 'D' or status_code[1] == 'D':
-                    self.file_status_cache[full_path] = 'DELETED'
+                file_status = self.classify_status_code(status_code)
+                if file_status:
+                    self.file_status_cache[full_path] = file_status
                         
         except Exception as e:
             self.status_label.config(text=f"Error updating status: {str(e)}")
+    
+    def classify_status_code(self, status_code):
+        """Map a two-letter porcelain status code to a file status name"""
+        # Enhanced status detection
+        if status_code in ('UU', 'AA', 'DD'):  # Merge conflicts
+            return 'CONFLICTED'
+        elif status_code[0] in ['M', 'A', 'D', 'R', 'C']:
+            if status_code[1] in ['M', 'D']:
+                return 'MODIFIED_STAGED'
+            return 'STAGED'
+        elif status_code[1] in ['M', 'D']:
+            return 'MODIFIED'
+        elif status_code[1] == '?':
+            return 'NEW'
+        return None
 
     
     def edit_commit_message_python_only(self, commit, new_message):
@@ -5899,7 +7431,7 @@ fi
             if commit == self.repo.head.commit:
                 self.repo.git.commit('--amend', '-m', new_message)
                 self.root.after(0, lambda: messagebox.showinfo("Success", "HEAD commit message updated!"))
-                self.root.after(0, self.refresh_all)
+                self.root.after(0, self._request_refresh)
                 return True
             
             # Method 2: For other commits, use Python-based rebase
@@ -5963,7 +7495,7 @@ fi
             
             self.root.after(0, lambda: messagebox.showinfo("Success", 
                 "Commit message updated successfully using Python rebase!"))
-            self.root.after(0, self.refresh_all)
+            self.root.after(0, self._request_refresh)
             return True
             
         except Exception as e:
@@ -6001,7 +7533,7 @@ fi
                     self.repo.delete_head(backup_branch)
                     conflict_window.destroy()
                     messagebox.showinfo("Aborted", "Rebase aborted, repository restored.")
-                    self.refresh_all()
+                    self._request_refresh()
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to abort: {str(e)}")
             
@@ -6231,7 +7763,7 @@ fi
             if merge_msg:
                 self.repo.git.commit('-m', merge_msg)
                 messagebox.showinfo("Merge Complete", "Merge completed successfully!")
-                self.refresh_all()
+                self._request_refresh()
                 self.update_merge_navbar_status()
         
         except Exception as e:
@@ -6244,7 +7776,7 @@ fi
             try:
                 self.repo.git.merge('--abort')
                 messagebox.showinfo("Merge Aborted", "Merge has been aborted.")
-                self.refresh_all()
+                self._request_refresh()
                 self.update_merge_navbar_status()
             except Exception as e:
                 messagebox.showerror("Abort Error", f"Failed to abort merge: {str(e)}")
@@ -6322,6 +7854,8 @@ fi
         def pull_worker():
             try:
                 self.repo.remotes.origin.pull()
+                self.invalidate_remote_tags()
+                self.invalidate_tag_rows()
                 self.root.after(0, lambda: self.complete_operation(self.pull_button, "Pull", "Pull completed successfully"))
             except Exception as e:
                 self.root.after(0, lambda: self.handle_operation_error(self.pull_button, "Pull", str(e)))
@@ -6408,6 +7942,7 @@ fi
 
     def refresh_all_data(self):
         """Refresh all data components"""
+        self.invalidate_tag_rows()
         self.update_file_status_cache_enhanced()
         self.populate_repository_tree()
         self.populate_changes()
@@ -6430,7 +7965,10 @@ fi
         """Setup enhanced refresh cycle with merge detection"""
         def refresh_cycle():
             if self.repo:
-                self.update_file_status_cache_enhanced()
+                # Untracked files are only walked every few cycles; explicit refreshes always walk them
+                self._status_cycles += 1
+                self.request_status(populate=False,
+                                    include_untracked=self._status_cycles % UNTRACKED_SCAN_CYCLES == 0)
                 self.update_merge_navbar_status()
             
             # Schedule next refresh